@@ -0,0 +1,38 @@
+"""
+Shared pytest fixtures for the Translator3000 test scripts.
+"""
+
+import sys
+import os
+
+import pytest
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from translator3000.processors.csv_processor import CSVProcessor
+from translator3000.processors.xml_processor import XMLProcessor
+
+
+def pytest_configure(config):
+    """Register the pytest-xdist group marker so it is known even without the plugin."""
+    config.addinivalue_line("markers", "xdist_group(name): run tests in the same group on one xdist worker")
+
+
+@pytest.fixture(scope="session")
+def csv_processor():
+    """One English -> Danish CSV processor shared by the whole test session."""
+    return CSVProcessor('en', 'da')
+
+
+@pytest.fixture
+def xml_processor(csv_processor):
+    """XML processor wrapping the shared CSV processor."""
+    return XMLProcessor(csv_processor)
+
+
+@pytest.fixture(scope="session")
+def xml_pipeline():
+    """English -> Norwegian (csv_processor, xml_processor) pair shared by the XML fix tests."""
+    csv = CSVProcessor("en", "no", delay_between_requests=0.01)
+    return csv, XMLProcessor(csv)
@@ -12,7 +12,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import xml.etree.ElementTree as ET
 from translator3000.processors.csv_processor import CSVProcessor
-from translator3000.processors.xml_processor import XMLProcessor
+from translator3000.processors.xml_processor import XMLProcessor, scan_cdata_element_tags
 
 # Set up detailed logging
 logging.basicConfig(level=logging.DEBUG, format='%(levelname)s: %(message)s')
@@ -22,10 +22,6 @@ def debug_text_collection():
     
     input_file = "test_ignore_case_fix.xml"
     
-    # Read the raw XML content
-    with open(input_file, 'r', encoding='utf-8') as f:
-        raw_xml_content = f.read()
-    
     # Parse the XML file
     tree = ET.parse(input_file)
     root = tree.getroot()
@@ -36,7 +32,8 @@ def debug_text_collection():
     
     # Collect text elements
     text_elements = []
-    xml_processor._collect_text_elements(root, text_elements, raw_xml_content)
+    cdata_tags = scan_cdata_element_tags(input_file)
+    xml_processor._collect_text_elements(root, text_elements, cdata_tags)
     
     print(f"Found {len(text_elements)} text elements:")
     for i, element_data in enumerate(text_elements):
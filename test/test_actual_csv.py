@@ -4,11 +4,13 @@ Test the actual CSV translation with the KIT fix
 """
 import sys
 import os
+import tempfile
+from pathlib import Path
 sys.path.insert(0, os.path.abspath('.'))
 
-from translator3000.translator import CSVTranslator
+from translator3000.translator import get_translator
 
-def test_csv_translation():
+def test_csv_translation(tmp_path):
     """Test CSV translation with KIT fix."""
     print("=== Testing CSV Translation with KIT fix ===")
     
@@ -18,16 +20,17 @@ Product 1,This is a KIT for testing
 Product 2,Contains kit components
 Product 3,The Kit includes everything"""
     
-    with open("test_kit.csv", "w", encoding="utf-8") as f:
-        f.write(test_csv_content)
+    input_file = tmp_path / "test_kit.csv"
+    output_file = tmp_path / "test_kit_translated.csv"
+    input_file.write_text(test_csv_content, encoding="utf-8")
     
     # Initialize translator
-    translator = CSVTranslator(source_lang='en', target_lang='da')
+    translator = get_translator('en', 'da')
     
     # Translate the CSV
     success, chars = translator.translate_csv(
-        input_file="test_kit.csv",
-        output_file="test_kit_translated.csv", 
+        input_file=str(input_file),
+        output_file=str(output_file),
         columns_to_translate=["description"]
     )
     
@@ -35,20 +38,12 @@ Product 3,The Kit includes everything"""
         print(f"✓ Translation completed successfully! {chars} characters translated.")
         
         # Read and show the result
-        with open("test_kit_translated.csv", "r", encoding="utf-8") as f:
-            result = f.read()
+        result = output_file.read_text(encoding="utf-8")
         print("\nTranslated CSV content:")
         print(result)
     else:
         print("✗ Translation failed!")
-    
-    # Clean up
-    import os
-    try:
-        os.remove("test_kit.csv")
-        os.remove("test_kit_translated.csv") 
-    except:
-        pass
 
 if __name__ == "__main__":
-    test_csv_translation()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        test_csv_translation(Path(temp_dir))
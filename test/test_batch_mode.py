@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Test script to verify batch mode processing of several files.
+"""
+
+import sys
+import os
+import threading
+import time
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from translator3000 import cli
+from translator3000.config import get_config
+from translator3000.utils.file_utils import discover_files_and_folders
+
+
+class SlowXMLTranslator:
+    """Fake translator whose XML translation blocks like a network round trip."""
+
+    target_lang = 'da'
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def translate_xml(self, input_file, output_file):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.05)
+        with self.lock:
+            self.active -= 1
+        if input_file.endswith("broken.xml"):
+            raise ValueError("broken feed")
+        return True, 10
+
+
+def test_batch_files_run_concurrently(monkeypatch, tmp_path, capsys):
+    """Test that batch mode translates files in parallel and counts every result."""
+    source = tmp_path / "source"
+    source.mkdir()
+    for name in ["a.xml", "b.xml", "c.xml", "broken.xml"]:
+        (source / name).write_text("<a/>", encoding="utf-8")
+
+    monkeypatch.setattr(cli, "TARGET_DIR", tmp_path / "target")
+    monkeypatch.setitem(get_config(), 'batch_file_workers', 4)
+    translator = SlowXMLTranslator()
+    user_input = {
+        'discovered': discover_files_and_folders(source),
+        'folder_choice': {'type': 'root'},
+        'target_lang': 'da',
+    }
+
+    success, chars = cli.process_batch_mode(translator, user_input)
+
+    # The failing file is reported, not raised, and the others still count
+    assert success and chars == 30
+    assert translator.peak > 1
+
+    # Buffered result lines still report every file once
+    output = capsys.readouterr().out
+    assert output.count("Finished:") == 4
+    assert "❌ Failed to process broken.xml" in output
+
+    print(f"✅ Batch mode ran up to {translator.peak} files at once")
+
+
+def test_batch_folders_created_once(monkeypatch, tmp_path):
+    """Test that files are grouped by folder and each target folder is created."""
+    source = tmp_path / "source"
+    for folder in ["shop", "blog"]:
+        (source / folder).mkdir(parents=True)
+        for name in ["a.xml", "b.xml"]:
+            (source / folder / name).write_text("<a/>", encoding="utf-8")
+    (source / "root.xml").write_text("<a/>", encoding="utf-8")
+
+    target = tmp_path / "target"
+    monkeypatch.setattr(cli, "TARGET_DIR", target)
+    created = []
+    original_mkdir = type(target).mkdir
+    monkeypatch.setattr(type(target), "mkdir",
+                        lambda self, *args, **kwargs: (created.append(self), original_mkdir(self, *args, **kwargs))[1])
+
+    user_input = {
+        'discovered': discover_files_and_folders(source),
+        'folder_choice': {'type': 'all'},
+        'target_lang': 'da',
+    }
+    success, chars = cli.process_batch_mode(SlowXMLTranslator(), user_input)
+
+    assert success and chars == 50
+    # One mkdir per location, not per file
+    assert len(created) == 3
+    assert all(path.is_dir() for path in created)
+
+    print("✅ Batch mode creates one target folder per location")
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__]))
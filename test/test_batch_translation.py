@@ -0,0 +1,539 @@
+#!/usr/bin/env python3
+"""
+Test script to verify batched translation of several texts.
+"""
+
+import sys
+import os
+from io import StringIO
+
+import pandas as pd
+import pytest
+from bs4 import BeautifulSoup
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from translator3000 import CSVTranslator
+from translator3000.config import get_config
+from translator3000.processors import csv_processor
+from translator3000.processors.csv_processor import CSVProcessor, HTML_SAMPLE_SIZE, is_rate_limit_error
+from translator3000.processors.xml_processor import XMLProcessor
+from translator3000.services import LibreTranslateService, RateLimitError
+
+
+class BatchCountingTranslator:
+    """Fake translation service that records each batch it receives."""
+
+    def __init__(self):
+        self.batches = []
+
+    def translate(self, text):
+        return f"[da] {text}"
+
+    def translate_batch(self, texts):
+        self.batches.append(list(texts))
+        return [f"[da] {text}" for text in texts]
+
+
+class FailingBatchTranslator(BatchCountingTranslator):
+    """Fake service whose batch endpoint fails and whose single requests reject one text."""
+
+    def translate(self, text):
+        if text == "bad":
+            raise ValueError("rejected")
+        return super().translate(text)
+
+    def translate_batch(self, texts):
+        raise ValueError("batch rejected")
+
+
+class FlakyBatchTranslator(BatchCountingTranslator):
+    """Fake service whose first batch request fails."""
+
+    def __init__(self):
+        super().__init__()
+        self.attempts = 0
+
+    def translate_batch(self, texts):
+        self.attempts += 1
+        if self.attempts == 1:
+            raise ConnectionError("temporary outage")
+        return super().translate_batch(texts)
+
+
+class PackedGoogleTranslator:
+    """Fake deep-translator service that answers packed requests, optionally dropping a separator."""
+
+    __module__ = 'deep_translator.google'
+
+    def __init__(self, merge_parts=False):
+        self.requests = []
+        self.merge_parts = merge_parts
+
+    def translate(self, text):
+        self.requests.append(text)
+        if self.merge_parts and '\u241E' in text:
+            return text.replace('\n\u241E\n', ' ')
+        # Like the real service, the separator lines come back with changed whitespace
+        return '\u241E '.join(f"[da] {part}" for part in text.split('\n\u241E\n'))
+
+    def translate_batch(self, texts):
+        return [self.translate(text) for text in texts]
+
+
+class TooManyRequests(Exception):
+    """Stand-in for deep-translator's HTTP 429 exception."""
+
+
+class ThrottledTranslator(BatchCountingTranslator):
+    """Fake service that throttles its first request and rejects one text outright."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def translate(self, text):
+        self.calls.append(text)
+        if len(self.calls) == 1:
+            raise TooManyRequests("Server Error: You made too many requests to the server")
+        if text == "bad":
+            raise ValueError("rejected")
+        return super().translate(text)
+
+
+class ThrottlingSession:
+    """Fake requests session for LibreTranslate that answers HTTP 429 to its first post."""
+
+    def __init__(self):
+        self.posts = []
+
+    def post(self, url, json, headers, timeout):
+        self.posts.append(json['q'])
+        if len(self.posts) == 1:
+            return type('Response', (), {'status_code': 429, 'text': 'Too many requests'})()
+        q = json['q']
+        translated = [f"[da] {text}" for text in q] if isinstance(q, list) else f"[da] {q}"
+        return type('Response', (), {'status_code': 200, 'json': lambda self: {'translatedText': translated}})()
+
+
+def make_processor(fake):
+    """Create an en -> da processor that only uses the given fake service."""
+    processor = CSVProcessor('en', 'da', delay_between_requests=0)
+    processor.translators = [('deep_translator', fake)]
+    processor.translation_cache = None
+    processor.glossary = {}
+    return processor
+
+
+def test_translate_batch_single_request():
+    """Test that plain texts are sent to the service in one batch, in order."""
+    fake = BatchCountingTranslator()
+    processor = make_processor(fake)
+
+    texts = ["Hello world", "", "This is a test", "Hello world", "<p>Bold</p>"]
+    results = processor.translate_batch(texts)
+
+    assert results == ["[da] Hello world", "", "[da] This is a test", "[da] Hello world", "<p>[da] Bold</p>"]
+    # HTML text nodes get their own batch; the plain texts share one deduplicated batch
+    assert fake.batches == [["Bold"], ["Hello world", "This is a test"]]
+
+    print("✅ Plain texts are translated in a single batch")
+
+
+def test_translate_texts_respects_batch_limits(monkeypatch):
+    """Test that translate_texts splits distinct texts by the item and character limits."""
+    monkeypatch.setitem(get_config(), 'batch_max_items', 2)
+    monkeypatch.setitem(get_config(), 'batch_max_chars', 12)
+    fake = BatchCountingTranslator()
+    processor = make_processor(fake)
+
+    texts = ["one", "two", "three", "one", "a longer text", "four"]
+    results = processor.translate_texts(texts, max_workers=1)
+
+    assert results == [f"[da] {text}" for text in texts]
+    assert fake.batches == [["one", "two"], ["three"], ["a longer text"], ["four"]]
+
+    # Concurrent batches still map back to their own texts
+    fake.batches.clear()
+    processor._cache.clear()
+    assert processor.translate_texts(texts, max_workers=4) == results
+    assert sorted(fake.batches) == [["a longer text"], ["four"], ["one", "two"], ["three"]]
+
+    print("✅ Batches respect the configured limits")
+
+
+def test_translator_sends_distinct_texts_once():
+    """Test that repeated category values reach the service once through CSVTranslator."""
+    fake = BatchCountingTranslator()
+    translator = CSVTranslator('en', 'da', delay_between_requests=0)
+    translator.csv_processor = make_processor(fake)
+
+    texts = ["In stock"] * 500 + ["Sold out"] * 300 + ["In stock"]
+    results = translator.translate_texts(texts)
+
+    assert results == [f"[da] {text}" for text in texts]
+    assert fake.batches == [["In stock", "Sold out"]]
+
+    print("✅ 801 category cells were sent as 2 distinct texts")
+
+
+def test_failed_batch_falls_back_to_single_texts():
+    """Test that a failing batch is retried per text so one bad string keeps its original."""
+    processor = make_processor(FailingBatchTranslator())
+
+    assert processor.translate_batch(["good", "bad", "fine"]) == ["[da] good", "bad", "[da] fine"]
+
+    print("✅ Failed batches fall back to single requests")
+
+
+def test_batched_column_skips_blank_cells():
+    """Test that a batched column only sends non-empty cells and keeps the rest as they are."""
+    fake = BatchCountingTranslator()
+    processor = make_processor(fake)
+    df = pd.DataFrame({'Description': ["Green tea", None, "   ", "", 42, "Green tea", "<p>Bold</p>"]})
+
+    translated, chars = processor._translate_column_batched(df, 'Description')
+
+    assert translated[0] == "[da] Green tea" and translated[5] == "[da] Green tea"
+    assert translated[1] is None
+    assert translated[2:4] == ["   ", ""]
+    assert translated[4] == "42"
+    assert translated[6] == "<p>[da] Bold</p>"
+    # HTML cells are split off before batching and numbers are never sent
+    assert fake.batches == [["Green tea"], ["Bold"]]
+    assert chars == len("Green tea") * 2 + 2 + len("<p>Bold</p>")
+
+    print("✅ Blank and missing cells are not sent for translation")
+
+
+def test_per_row_column_skips_blank_cells():
+    """Test that the per-row paths only translate non-empty cells, each distinct one once."""
+    processor = make_processor(BatchCountingTranslator())
+    sent = []
+    translate_text = processor.translate_text
+    processor.translate_text = lambda text: sent.append(text) or translate_text(text)
+    df = pd.DataFrame({'Description': ["Green tea", None, "   ", "", "Green tea", "Mint"]})
+
+    for translate in (processor._translate_column_single_threaded,
+                      lambda df, column: processor.translate_column_multithreaded(df, column, max_workers=2)):
+        sent.clear()
+        translated, chars = translate(df, 'Description')
+
+        assert translated[0] == translated[4] == "[da] Green tea"
+        assert pd.isna(translated[1]) and translated[2:4] == ["   ", ""]
+        assert translated[5] == "[da] Mint"
+        assert sorted(sent) == ["Green tea", "Mint"]
+        assert chars == len("Green tea") * 2 + len("Mint")
+
+    print("✅ Per-row translation skips blank and missing cells")
+
+
+def test_plain_column_sample_skips_html_scan(monkeypatch):
+    """Test that a column whose sampled cells hold no markup skips the per-cell HTML scan."""
+    fake = BatchCountingTranslator()
+    processor = make_processor(fake)
+    cells = [f"Tea {i}" for i in range(HTML_SAMPLE_SIZE)] + ["<p>Late</p>"]
+    df = pd.DataFrame({'Description': cells})
+
+    scanned = []
+    original_contains = pd.Series.str.contains
+    monkeypatch.setattr(pd.core.strings.accessor.StringMethods, 'contains',
+                        lambda self, pat, *args, **kwargs: scanned.append(pat) or original_contains(self, pat, *args, **kwargs))
+
+    translated, _ = processor._translate_column_batched(df, 'Description')
+
+    # Only the literal '<' sample check runs; the stray HTML cell is still translated safely
+    assert scanned == ['<']
+    assert translated[0] == "[da] Tea 0"
+    assert translated[-1] == "<p>[da] Late</p>"
+
+    print("✅ Plain columns are classified from a sample")
+
+
+def test_columns_share_one_translation_pass():
+    """Test that text repeated across columns is sent once, in a single batch for all columns."""
+    fake = BatchCountingTranslator()
+    processor = make_processor(fake)
+    df = pd.DataFrame({'Name': ["Green tea", "Mint"], 'Category': ["Tea", "Green tea"]})
+
+    results = processor.translate_columns(df, ['Name', 'Category'])
+
+    assert results['Name'] == (["[da] Green tea", "[da] Mint"], len("Green teaMint"))
+    assert results['Category'] == (["[da] Tea", "[da] Green tea"], len("TeaGreen tea"))
+    assert fake.batches == [["Green tea", "Mint", "Tea"]]
+
+    print("✅ Columns are translated in one pass")
+
+
+def test_batch_request_retried_with_backoff():
+    """Test that a failed batch request is retried before falling back to single texts."""
+    fake = FlakyBatchTranslator()
+    processor = make_processor(fake)
+
+    assert processor.translate_batch(["Green tea", "Mint"]) == ["[da] Green tea", "[da] Mint"]
+    assert fake.attempts == 2
+    assert fake.batches == [["Green tea", "Mint"]]
+
+    print("✅ Failed batch requests are retried")
+
+
+def test_throttled_single_request_retried():
+    """Test that single texts are retried on HTTP 429 only."""
+    fake = ThrottledTranslator()
+    processor = make_processor(fake)
+
+    assert processor.translate_text("Green tea") == "[da] Green tea"
+    assert fake.calls == ["Green tea", "Green tea"]
+
+    # A rejected text is not retried
+    assert processor.translate_text("bad") == "bad"
+    assert fake.calls[2:] == ["bad"]
+
+    print("✅ Throttled requests are retried with backoff")
+
+
+def test_libretranslate_throttling_reaches_retries():
+    """Test that a LibreTranslate HTTP 429 is retried instead of being swallowed by the service."""
+    for translate in (lambda processor: processor.translate_text("Green tea"),
+                      lambda processor: processor.translate_batch(["Green tea"])[0]):
+        service = LibreTranslateService('en', 'da', api_url="http://localhost:1/translate")
+        service.session = ThrottlingSession()
+        processor = make_processor(service)
+
+        assert translate(processor) == "[da] Green tea"
+        assert len(service.session.posts) == 2
+
+    assert is_rate_limit_error(RateLimitError("Rate limit exceeded"))
+
+    print("✅ LibreTranslate rate limits are retried with backoff")
+
+
+def test_packed_request_for_per_text_services(monkeypatch):
+    """Test that deep-translator batches go out as one packed request and fall back on a bad split."""
+    fake = PackedGoogleTranslator()
+    processor = make_processor(fake)
+
+    texts = ["Red shirt", "Blue\nshirt", "Green shirt"]
+    assert processor.translate_batch(texts) == ["[da] Red shirt", "[da] Blue\nshirt", "[da] Green shirt"]
+    assert len(fake.requests) == 1
+
+    # Packs stay under the request size limit
+    monkeypatch.setattr(csv_processor, 'PACK_MAX_CHARS', 25)
+    fake.requests.clear()
+    processor._cache.clear()
+    processor.translate_batch(texts)
+    assert len(fake.requests) == 2
+
+    # A response that does not split back into one part per text is retried text by text
+    broken = PackedGoogleTranslator(merge_parts=True)
+    processor = make_processor(broken)
+    assert processor.translate_batch(["Red shirt", "Green shirt"]) == ["[da] Red shirt", "[da] Green shirt"]
+    assert broken.requests[1:] == ["Red shirt", "Green shirt"]
+
+    print("✅ deep-translator batches are sent as packed requests")
+
+
+def test_xml_plain_text_in_one_batch():
+    """Test that plain XML text is batched and deep documents are walked without recursion."""
+    import xml.etree.ElementTree as ET
+
+    fake = BatchCountingTranslator()
+    xml_processor = XMLProcessor(make_processor(fake))
+
+    depth = 3000
+    root = ET.fromstring("<a>" * depth + "deep" + "</a>" * depth)
+    products = ET.fromstring('<Products><Name>Green tea</Name><Name ignore="true">Keep</Name><Name>Black tea</Name></Products>')
+    root.append(products)
+
+    text_elements = []
+    xml_processor._collect_text_elements(root, text_elements, set())
+    assert [text_data['original'] for text_data in text_elements] == ["deep", "Green tea", "Black tea"]
+
+    success, chars = xml_processor._translate_and_apply_robust(text_elements)
+    assert success and chars == len("deepGreen teaBlack tea")
+    assert fake.batches == [["deep", "Green tea", "Black tea"]]
+    assert [name.text for name in products] == ["[da] Green tea", "Keep", "[da] Black tea"]
+
+    print("✅ Plain XML text is translated in a single batch")
+
+
+def test_translate_csv_in_chunks(monkeypatch, tmp_path):
+    """Test that a CSV streamed in small chunks gets one header and every translated row."""
+    monkeypatch.setitem(get_config(), 'csv_chunk_size', 2)
+    processor = make_processor(BatchCountingTranslator())
+
+    input_csv = StringIO("Name;Price\nGreen tea;10\nBlack tea;12\nGreen tea;10\nMint;8\nChai;9\n")
+    output_file = tmp_path / "output.csv"
+    success, chars = processor.translate_csv(input_csv, str(output_file), ['Name'], delimiter=';')
+
+    assert success and chars == len("Green teaBlack teaGreen teaMintChai")
+    assert output_file.read_text(encoding='utf-8').splitlines() == [
+        "Name;Price;Name_translated",
+        "Green tea;10;[da] Green tea",
+        "Black tea;12;[da] Black tea",
+        "Green tea;10;[da] Green tea",
+        "Mint;8;[da] Mint",
+        "Chai;9;[da] Chai",
+    ]
+
+    # Cells are read as text, so leading zeros and decimals survive the round trip
+    text_file = tmp_path / "text.csv"
+    assert processor.translate_csv(StringIO("Sku;Price;Name\n00123;10.50;Tea\n"), str(text_file), ['Name'], delimiter=';')[0]
+    assert text_file.read_text(encoding='utf-8').splitlines()[1] == "00123;10.50;Tea;[da] Tea"
+
+    # A missing column is reported before any chunk is written
+    missing_file = tmp_path / "missing.csv"
+    assert processor.translate_csv(StringIO("Name\nTea\nMint\nChai\n"), str(missing_file), ['Title']) == (False, 0)
+    assert not missing_file.exists()
+
+    print("✅ Chunked CSV output matches the input rows")
+
+
+def test_translate_csv_with_pyarrow_reader(monkeypatch, tmp_path):
+    """Test that the pyarrow reader streams chunks and writes cells back as read."""
+    pytest.importorskip("pyarrow")
+    monkeypatch.setitem(get_config(), 'csv_chunk_size', 2)
+    monkeypatch.setitem(get_config(), 'csv_use_pyarrow', True)
+    monkeypatch.setitem(get_config(), 'csv_pyarrow_min_bytes', 0)
+    processor = make_processor(BatchCountingTranslator())
+
+    input_file = tmp_path / "input.csv"
+    input_file.write_text("Name;Price\nGreen tea;10.50\nBlack tea;\nMint;8\n", encoding='utf-8')
+    output_file = tmp_path / "output.csv"
+    success, _ = processor.translate_csv(str(input_file), str(output_file), ['Name'], delimiter=';')
+
+    assert success
+    assert output_file.read_text(encoding='utf-8').splitlines() == [
+        "Name;Price;Name_translated",
+        "Green tea;10.50;[da] Green tea",
+        "Black tea;;[da] Black tea",
+        "Mint;8;[da] Mint",
+    ]
+
+    print("✅ pyarrow reader keeps cells as text")
+
+
+def test_non_linguistic_texts_are_not_sent():
+    """Test that numbers, prices, URLs and e-mail addresses skip the translation services."""
+    fake = BatchCountingTranslator()
+    processor = make_processor(fake)
+
+    texts = ["42.99", "€ 1.299,00", "https://example.com/tea", "info@example.com", "Green tea", "10%", "–", "#1234-56"]
+    results = processor.translate_texts(texts)
+
+    assert results == texts[:4] + ["[da] Green tea"] + texts[5:]
+    assert fake.batches == [["Green tea"]]
+
+    # Single texts skip the services the same way
+    assert processor._translate_plain_text("– 4 × 25") == "– 4 × 25"
+    assert processor._translate_plain_text("25 cl") == "[da] 25 cl"
+
+    print("✅ Non-linguistic texts are kept without a request")
+
+
+def test_glossary_applies_before_non_linguistic_check():
+    """Test that a glossary term without letters is replaced on the batched paths as on the single one."""
+    fake = BatchCountingTranslator()
+    processor = make_processor(fake)
+    processor.glossary = {'24/7': {'target': 'døgnet rundt', 'keep_case': False, 'original_source': '24/7'}}
+
+    assert processor.translate_text("24/7") == "[da] døgnet rundt"
+    assert processor.translate_texts(["24/7", "Open 24/7"]) == ["[da] døgnet rundt", "[da] Open døgnet rundt"]
+    translated, _ = processor.translate_column(pd.DataFrame({'Hours': ["24/7", "12:00"]}), 'Hours')
+    assert translated == ["[da] døgnet rundt", "12:00"]
+
+    print("✅ Glossary terms without letters are applied before skipping non-linguistic text")
+
+
+def test_same_language_sends_nothing():
+    """Test that a processor translating into its own source language never calls a service."""
+    fake = BatchCountingTranslator()
+    processor = CSVProcessor('da', 'da')
+    processor.translators = [('deep_translator', fake)]
+    processor.translation_cache = None
+
+    assert processor.translate_texts(["Grøn te", "Sort te"]) == ["Grøn te", "Sort te"]
+    assert processor.translate_text("Grøn te") == "Grøn te"
+    assert processor.translate_html_content("<p>Grøn te</p>") == "<p>Grøn te</p>"
+    assert fake.batches == []
+
+    print("✅ Same-language runs make no requests")
+
+
+def test_html_text_nodes_in_one_batch():
+    """Test that all text nodes of an HTML cell are translated with one batch request."""
+    fake = BatchCountingTranslator()
+    processor = make_processor(fake)
+
+    html_text = "<ul><li>Green tea</li><li> Black tea </li><li>Green tea</li></ul><script>var x;</script>"
+    result = processor.translate_html_content(html_text)
+
+    assert result == "<ul><li>[da] Green tea</li><li> [da] Black tea </li><li>[da] Green tea</li></ul><script>var x;</script>"
+    assert fake.batches == [["Green tea", "Black tea"]]
+
+    print("✅ HTML text nodes share one batch")
+
+
+def test_xml_html_text_nodes_in_one_batch():
+    """Test that the XML HTML paths send all text of an element in one batch request."""
+    fake = BatchCountingTranslator()
+    xml_processor = XMLProcessor(make_processor(fake))
+
+    soup = BeautifulSoup('<p>Green tea</p><p> Black tea </p><p ignore="true">Keep</p>', 'html.parser')
+    xml_processor._translate_soup_text_nodes(soup)
+    assert str(soup) == '<p>[da] Green tea</p><p> [da] Black tea </p><p ignore="true">Keep</p>'
+    assert fake.batches == [["Green tea", "Black tea"]]
+
+    result = xml_processor._translate_html_fallback('<p>Green tea</p><b ignore="true">Keep</b><i>Oolong</i>', {})
+    assert result == '<p>[da] Green tea</p><b ignore="true">Keep</b><i>[da] Oolong</i>'
+    # "Green tea" is answered from the memo filled by the first batch
+    assert fake.batches[1:] == [["Oolong"]]
+
+    print("✅ XML HTML text nodes share one batch")
+
+
+def test_html_walk_prunes_ignored_and_non_text_nodes():
+    """Test that ignored subtrees, style blocks and comments are not collected for translation."""
+    fake = BatchCountingTranslator()
+    processor = make_processor(fake)
+
+    html_text = '<!-- note --><div><p>Hello there</p><div IGNORE="true"><p>Keep me</p></div><style>p{}</style>Tail text</div>'
+    result = processor.translate_html_content(html_text)
+
+    assert result == '<!-- note --><div><p>[da] Hello there</p><div ignore="true"><p>Keep me</p></div><style>p{}</style>[da] Tail text</div>'
+    assert fake.batches == [["Hello there", "Tail text"]]
+
+    print("✅ HTML walk skips ignored subtrees and comments")
+
+
+def test_repeated_html_cells_parsed_once():
+    """Test that a repeated HTML cell is parsed and translated only once."""
+    processor = make_processor(BatchCountingTranslator())
+    parsed = []
+    translate_html = processor._translate_html
+    processor._translate_html = lambda html: parsed.append(html) or translate_html(html)
+
+    html = '<p>Free shipping</p>'
+    assert processor.translate_html_content(html) == '<p>[da] Free shipping</p>'
+    assert processor.translate_html_content(html) == '<p>[da] Free shipping</p>'
+    assert parsed == [html]
+
+    print("✅ Repeated HTML cells come from the memo")
+
+
+def test_regex_fallback_single_batch():
+    """Test that the regex HTML fallback translates every text span with one batch."""
+    fake = BatchCountingTranslator()
+    processor = make_processor(fake)
+
+    result = processor._translate_html_with_regex('<p> Hello </p><b>x</b><i>Hello</i> tail <br>')
+
+    assert result == '<p>[da] Hello</p><b>x</b><i>[da] Hello</i>[da] tail<br>'
+    assert fake.batches == [["Hello", "tail"]]
+
+    print("✅ Regex fallback batches its text spans")
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__]))
@@ -10,7 +10,7 @@ from pathlib import Path
 # Add project directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from translator3000 import CSVTranslator
+from translator3000 import get_translator
 
 def benchmark_translation():
     """Benchmark the current translation system."""
@@ -18,7 +18,7 @@ def benchmark_translation():
     print("=== Translation Speed & Retry Mechanism Benchmark ===\n")
     
     # Test with current improved settings
-    translator = CSVTranslator(source_lang='en', target_lang='da')
+    translator = get_translator('en', 'da')
     
     test_data = [
         "Hello world",
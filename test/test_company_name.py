@@ -9,13 +9,13 @@ from pathlib import Path
 # Add project directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from translator3000 import CSVTranslator
+from translator3000 import get_translator
 
 def test_company_name():
     """Test that company names are handled correctly with glossary."""
     
     # Create translator instance
-    translator = CSVTranslator(source_lang='en', target_lang='da')
+    translator = get_translator('en', 'da')
     
     # Test multiple cases where company name might get capitalized
     test_cases = [
@@ -85,5 +85,111 @@ Product C;Premium quality product;39.99"""
     
     print("Test completed!")
 
+def test_detect_csv_delimiter(tmp_path):
+    """Test the byte sniffer used by batch mode."""
+    from translator3000.cli import detect_csv_delimiter, CSV_SNIFF_BYTES
+
+    cases = {
+        "semicolon_with_commas.csv": ("Name;Description\nTea;Green, organic\nMint;Fresh\n", ';'),
+        "comma.csv": ("Name,Price\nTea,10\nMint,8\n", ','),
+        "tab.csv": ("Name\tPrice\nTea\t10\n", '\t'),
+        "empty.csv": ("", ','),
+        # A row cut off at the end of the sample is not counted
+        "long.csv": ("a;b\n" * (CSV_SNIFF_BYTES // 4 - 1) + "x," * 100 + "\n", ';'),
+    }
+    for name, (content, expected) in cases.items():
+        path = tmp_path / name
+        path.write_text(content, encoding='utf-8')
+        assert detect_csv_delimiter(str(path)) == expected, name
+
+    print("✅ Delimiters detected from a byte sample")
+
+
+def test_detect_csv_encoding(tmp_path):
+    """Test that non-UTF-8 files are detected and translated without garbling."""
+    from translator3000.cli import detect_csv_encoding
+    from translator3000.processors.csv_processor import CSVProcessor
+
+    text = "Navn;Beskrivelse\nGrøn te;Økologisk blanding med æble\n" * 50
+    utf8_file = tmp_path / "utf8.csv"
+    utf8_file.write_bytes(text.encode('utf-8'))
+    bom_file = tmp_path / "bom.csv"
+    bom_file.write_bytes(text.encode('utf-8-sig'))
+    legacy_file = tmp_path / "legacy.csv"
+    legacy_file.write_bytes(text.encode('cp1252'))
+
+    assert detect_csv_encoding(str(utf8_file)) == 'utf-8'
+    assert detect_csv_encoding(str(bom_file)) == 'utf-8-sig'
+    encoding = detect_csv_encoding(str(legacy_file))
+    assert "Grøn te" in legacy_file.read_bytes().decode(encoding)
+
+    # The detected encoding is used for the full read; the output is UTF-8
+    processor = CSVProcessor('da', 'en', delay_between_requests=0)
+    processor.translators = []
+    processor.translation_cache = None
+    output_file = tmp_path / "out.csv"
+    success, _ = processor.translate_csv(str(legacy_file), str(output_file), ['Navn'], delimiter=';', encoding=encoding)
+    assert success
+    assert output_file.read_text(encoding='utf-8').splitlines()[1] == "Grøn te;Økologisk blanding med æble;Grøn te"
+
+    print(f"✅ Non-UTF-8 CSV detected as {encoding}")
+
+
+def test_csv_input_single_empty_file(tmp_path, monkeypatch):
+    """Test that an empty CSV falls through to the manual delimiter prompt instead of raising."""
+    from translator3000.cli import get_csv_input_single
+
+    empty_file = tmp_path / "empty.csv"
+    empty_file.write_text("", encoding='utf-8')
+    monkeypatch.setattr('builtins.input', lambda prompt="": "")
+
+    assert get_csv_input_single(empty_file, str(empty_file), tmp_path, {}) == {}
+
+    print("✅ Empty CSV handled by the manual delimiter fallback")
+
+
+def test_detect_text_columns():
+    """Test that only columns starting with substantial text are picked for translation."""
+    from translator3000.cli import detect_text_columns
+
+    df = pd.DataFrame({
+        'Id': [1, 2],
+        'Ean': ["5701234567890", "5701234567891"],
+        'Name': [None, "Grüner Tee mit Minze"],
+        'Russian': ["Зелёный чай с мятой", None],
+        'Unit': ["pcs", "pcs"],
+    })
+    assert detect_text_columns(df) == ['Name', 'Russian']
+    assert detect_text_columns(df.iloc[:0]) == []
+
+    # Underscores and digits are word characters but not letters
+    codes = pd.DataFrame({'Sku': ["0000_1234_5678"], 'Ref': ["____________"], 'Note': ["Øl fra 1998_"]})
+    assert detect_text_columns(codes) == ['Note']
+
+    # A single long value does not make a column of short codes a text column
+    mixed = pd.DataFrame({
+        'Unit': ["pcs", "kg", "Bundle of twelve", "pcs"],
+        'Description': ["Green tea", "Fresh mint leaves", "Black tea from Assam", "Chai spice mix"],
+    })
+    assert detect_text_columns(mixed) == ['Description']
+
+    # Columns read with the string dtype are picked like object columns
+    typed = pd.DataFrame({'Sku': pd.array(["0000_1234"], dtype='string'),
+                          'Name': pd.array(["Grüner Tee mit Minze"], dtype='string')})
+    assert detect_text_columns(typed) == ['Name']
+
+    print("✅ Text columns detected from the preview rows")
+
+
 if __name__ == "__main__":
+    import tempfile
     test_csv_auto_detection()
+    test_detect_text_columns()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        test_detect_csv_delimiter(Path(temp_dir))
+    with tempfile.TemporaryDirectory() as temp_dir:
+        test_detect_csv_encoding(Path(temp_dir))
+    with tempfile.TemporaryDirectory() as temp_dir:
+        import pytest
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            test_csv_input_single_empty_file(Path(temp_dir), monkeypatch)
@@ -4,11 +4,13 @@ Test the CSV processor with the .0 fix
 """
 import sys
 import os
+import tempfile
+from pathlib import Path
 sys.path.insert(0, os.path.abspath('.'))
 
-from translator3000.translator import CSVTranslator
+from translator3000.translator import get_translator
 
-def test_csv_processor_fix():
+def test_csv_processor_fix(tmp_path):
     """Test the CSV processor with the .0 fix."""
     print("=== Testing CSV Processor Fix ===")
     
@@ -18,18 +20,19 @@ def test_csv_processor_fix():
 7131525;Product B;
 9999999;Product C;50000"""
     
-    with open("test_processor_fix.csv", "w", encoding="utf-8") as f:
-        f.write(test_csv_content)
+    input_file = tmp_path / "test_processor_fix.csv"
+    output_file = tmp_path / "test_processor_output.csv"
+    input_file.write_text(test_csv_content, encoding="utf-8")
     
     print("Original CSV:")
     print(test_csv_content)
     
     # Use the CSV processor to translate only the 'name' column
-    translator = CSVTranslator(source_lang='en', target_lang='da')
+    translator = get_translator('en', 'da')
     
     success, chars = translator.translate_csv(
-        input_file="test_processor_fix.csv",
-        output_file="test_processor_output.csv",
+        input_file=str(input_file),
+        output_file=str(output_file),
         columns_to_translate=["name"],  # Only translate name, not id or price
         delimiter=";"
     )
@@ -38,8 +41,7 @@ def test_csv_processor_fix():
         print(f"\n✓ Translation completed! {chars} characters translated.")
         
         # Read the output
-        with open("test_processor_output.csv", "r", encoding="utf-8") as f:
-            output = f.read()
+        output = output_file.read_text(encoding="utf-8")
         print("\nOutput CSV:")
         print(output)
         
@@ -50,13 +52,7 @@ def test_csv_processor_fix():
             print("\n✅ SUCCESS: Numbers preserved correctly!")
     else:
         print("\n❌ Translation failed!")
-    
-    # Clean up
-    for file in ["test_processor_fix.csv", "test_processor_output.csv"]:
-        try:
-            os.remove(file)
-        except:
-            pass
 
 if __name__ == "__main__":
-    test_csv_processor_fix()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        test_csv_processor_fix(Path(temp_dir))
@@ -9,8 +9,9 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 from translator3000.processors.csv_processor import CSVProcessor
 import pandas as pd
 import tempfile
+from pathlib import Path
 
-def test_csv_space_preservation():
+def test_csv_space_preservation(tmp_path):
     """Test that spaces around translated text are preserved in CSV processing."""
     
     print("🧪 Testing space preservation in CSV HTML translation...")
@@ -75,87 +76,76 @@ def test_csv_space_preservation():
     
     df = pd.DataFrame(test_data)
     
-    # Create temporary CSV files
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as input_file:
-        df.to_csv(input_file.name, index=False, encoding='utf-8')
-        input_path = input_file.name
-    
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as output_file:
-        output_path = output_file.name
+    # Per-test temporary CSV files, cleaned up by pytest
+    input_path = str(tmp_path / "input.csv")
+    output_path = str(tmp_path / "output.csv")
+    df.to_csv(input_path, index=False, encoding='utf-8')
+
+    # Translate the CSV
+    success, char_count = csv_processor.translate_csv(
+        input_path, 
+        output_path, 
+        columns_to_translate=['description']
+    )
     
-    try:
-        # Translate the CSV
-        success, char_count = csv_processor.translate_csv(
-            input_path, 
-            output_path, 
-            columns_to_translate=['description']
-        )
+    if success:
+        # Read the result
+        result_df = pd.read_csv(output_path, encoding='utf-8')
         
-        if success:
-            # Read the result
-            result_df = pd.read_csv(output_path, encoding='utf-8')
-            
-            print("📄 Original CSV descriptions:")
-            for i, desc in enumerate(df['description']):
-                print(f"  Row {i+1}: {desc}")
-            
-            print("\n📄 Translated CSV descriptions:")
-            for i, desc in enumerate(result_df['description_translated']):
-                print(f"  Row {i+1}: {desc}")
-            
-            # Check space preservation in CSV results
-            print("\n🔍 Analyzing space preservation in CSV results:")
-            
-            success_count = 0
-            total_checks = 0
-            
-            for i, translated_desc in enumerate(result_df['description_translated']):
-                if i == 0:  # micare<strong>...</strong>For case
-                    total_checks += 1
-                    if 'micare<strong' in translated_desc and '</strong>For' in translated_desc:
-                        print(f"✅ Row {i+1}: Spaces around <strong> tag preserved")
-                        success_count += 1
-                    else:
-                        print(f"❌ Row {i+1}: Spaces around <strong> tag lost!")
-                        
-                elif i == 1:  # <em>...</em> case
-                    total_checks += 1
-                    if ' <em>' in translated_desc and '</em> ' in translated_desc:
-                        print(f"✅ Row {i+1}: Spaces around <em> tag preserved")
-                        success_count += 1
-                    else:
-                        print(f"❌ Row {i+1}: Spaces around <em> tag lost!")
-                        
-                elif i == 2:  # <span>...</span> case
-                    total_checks += 1
-                    if ' <span>' in translated_desc and '</span> ' in translated_desc:
-                        print(f"✅ Row {i+1}: Spaces around <span> tag preserved")
-                        success_count += 1
-                    else:
-                        print(f"❌ Row {i+1}: Spaces around <span> tag lost!")
-            
-            print(f"\n📊 Summary: {success_count}/{total_checks} space preservation checks passed")
-            
-            if success_count == total_checks:
-                print("🎉 SUCCESS: All spaces properly preserved in CSV processing!")
-                return True
-            else:
-                print("❌ Some space preservation issues found in CSV processing")
-                return False
+        print("📄 Original CSV descriptions:")
+        for i, desc in enumerate(df['description']):
+            print(f"  Row {i+1}: {desc}")
+        
+        print("\n📄 Translated CSV descriptions:")
+        for i, desc in enumerate(result_df['description_translated']):
+            print(f"  Row {i+1}: {desc}")
+        
+        # Check space preservation in CSV results
+        print("\n🔍 Analyzing space preservation in CSV results:")
+        
+        success_count = 0
+        total_checks = 0
+        
+        for i, translated_desc in enumerate(result_df['description_translated']):
+            if i == 0:  # micare<strong>...</strong>For case
+                total_checks += 1
+                if 'micare<strong' in translated_desc and '</strong>For' in translated_desc:
+                    print(f"✅ Row {i+1}: Spaces around <strong> tag preserved")
+                    success_count += 1
+                else:
+                    print(f"❌ Row {i+1}: Spaces around <strong> tag lost!")
+                    
+            elif i == 1:  # <em>...</em> case
+                total_checks += 1
+                if ' <em>' in translated_desc and '</em> ' in translated_desc:
+                    print(f"✅ Row {i+1}: Spaces around <em> tag preserved")
+                    success_count += 1
+                else:
+                    print(f"❌ Row {i+1}: Spaces around <em> tag lost!")
+                    
+            elif i == 2:  # <span>...</span> case
+                total_checks += 1
+                if ' <span>' in translated_desc and '</span> ' in translated_desc:
+                    print(f"✅ Row {i+1}: Spaces around <span> tag preserved")
+                    success_count += 1
+                else:
+                    print(f"❌ Row {i+1}: Spaces around <span> tag lost!")
+        
+        print(f"\n📊 Summary: {success_count}/{total_checks} space preservation checks passed")
+        
+        if success_count == total_checks:
+            print("🎉 SUCCESS: All spaces properly preserved in CSV processing!")
+            return True
         else:
-            print("❌ CSV translation failed!")
+            print("❌ Some space preservation issues found in CSV processing")
             return False
-        
-    finally:
-        # Clean up temporary files
-        try:
-            os.unlink(input_path)
-            os.unlink(output_path)
-        except:
-            pass
+    else:
+        print("❌ CSV translation failed!")
+        return False
 
 if __name__ == "__main__":
-    success = test_csv_space_preservation()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        success = test_csv_space_preservation(Path(temp_dir))
     if success:
         print("\n✅ CSV space preservation test passed!")
     else:
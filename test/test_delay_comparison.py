@@ -49,8 +49,8 @@ def test_translation_services():
             
             start_time = time.time()
             
-            for i, phrase in enumerate(test_phrases, 1):
-                translated = translator.translate_text(phrase)
+            translations = translator.translate_batch(test_phrases)
+            for i, (phrase, translated) in enumerate(zip(test_phrases, translations), 1):
                 print(f"  {i}. '{phrase}' -> '{translated}'")
             
             total_time = time.time() - start_time
@@ -88,6 +88,24 @@ def test_service_fallback():
     except Exception as e:
         print(f"✗ Fallback test failed: {e}")
 
+def test_delay_settings():
+    """Test switching request delays on one translator instead of rebuilding it per setting."""
+    
+    print("\n=== Delay Settings Test ===")
+    
+    translator = CSVTranslator(source_lang='en', target_lang='da')
+    
+    delay_settings = [(0.0, "none"), (0.01, "fast"), (0.05, "default"), (0.1, "slow")]
+    for delay_seconds, delay_name in delay_settings:
+        translator.set_delay(delay_seconds)
+        assert translator.delay == delay_seconds
+        assert translator.csv_processor.delay == delay_seconds
+        
+        start_time = time.time()
+        translator.translate_batch(["Hello world", "This is a test"])
+        print(f"  {delay_name} ({delay_seconds}s): {time.time() - start_time:.3f}s")
+
 if __name__ == "__main__":
     test_translation_services()
     test_service_fallback()
+    test_delay_settings()
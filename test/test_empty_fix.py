@@ -11,8 +11,9 @@ from translator3000.processors.xml_processor import XMLProcessor
 from translator3000.processors.csv_processor import CSVProcessor
 import xml.etree.ElementTree as ET
 import tempfile
+from pathlib import Path
 
-def test_empty_elements_no_cdata():
+def test_empty_elements_no_cdata(tmp_path):
     """Test that empty elements don't get CDATA wrapped."""
     csv_processor = CSVProcessor()
     processor = XMLProcessor(csv_processor)
@@ -30,88 +31,76 @@ def test_empty_elements_no_cdata():
     <Body></Body>
 </root>'''
     
-    # Create temporary files
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.xml', delete=False) as input_file:
-        input_file.write(xml_content)
-        input_path = input_file.name
+    # Per-test temporary files, cleaned up by pytest
+    input_path = str(tmp_path / "input.xml")
+    output_path = str(tmp_path / "output.xml")
+    (tmp_path / "input.xml").write_text(xml_content, encoding="utf-8")
+
+    # Process the XML
+    success, char_count = processor.translate_xml_sequential(input_path, output_path)
+    
+    if not success:
+        print("✗ Translation failed")
+        return False
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.xml', delete=False) as output_file:
-        output_path = output_file.name
+    # Read the result
+    with open(output_path, 'r', encoding='utf-8') as f:
+        result = f.read()
     
+    print("Original XML:")
+    print(xml_content)
+    print("\nProcessed XML:")
+    print(result)
+    
+    # Check that output is valid XML
     try:
-        # Process the XML
-        success, char_count = processor.translate_xml_sequential(input_path, output_path)
-        
-        if not success:
-            print("✗ Translation failed")
-            return False
-        
-        # Read the result
-        with open(output_path, 'r', encoding='utf-8') as f:
-            result = f.read()
-        
-        print("Original XML:")
-        print(xml_content)
-        print("\nProcessed XML:")
-        print(result)
-        
-        # Check that output is valid XML
-        try:
-            ET.fromstring(result)
-            print("\n✓ Output XML is valid")
-        except ET.ParseError as e:
-            print(f"\n✗ Output XML is invalid: {e}")
-            return False
-        
-        # Check that empty elements don't have CDATA
-        empty_elements_with_cdata = []
-        lines = result.split('\n')
-        for line in lines:
-            if '<![CDATA[]]>' in line or '<![CDATA[   ]]>' in line or ('<![CDATA[' in line and ']]>' in line and not line.strip().replace('<![CDATA[', '').replace(']]>', '').strip()):
-                empty_elements_with_cdata.append(line.strip())
-        
-        if empty_elements_with_cdata:
-            print(f"\n✗ Found empty CDATA sections:")
-            for elem in empty_elements_with_cdata:
-                print(f"  {elem}")
-            return False
-        else:
-            print("\n✓ No empty CDATA sections found")
-        
-        # Check specific patterns
-        issues = []
-        if '<Title><![CDATA[]]></Title>' in result:
-            issues.append("Empty Title has CDATA")
-        if '<Description><![CDATA[   ]]></Description>' in result:
-            issues.append("Whitespace-only Description has CDATA")
-        if '<Content><![CDATA[]]></Content>' in result:
-            issues.append("Empty Content has CDATA")
-        if '<Image><![CDATA[]]></Image>' in result:
-            issues.append("Empty Image has CDATA")
-        if '<URL><![CDATA[]]></URL>' in result:
-            issues.append("Empty URL has CDATA")
-        if '<Body><![CDATA[]]></Body>' in result:
-            issues.append("Empty Body has CDATA")
-        
-        if issues:
-            print(f"\n✗ Issues found:")
-            for issue in issues:
-                print(f"  {issue}")
-            return False
-        else:
-            print("\n✓ All empty elements are handled correctly")
-        
-        return True
-        
-    finally:
-        # Clean up temporary files
-        try:
-            os.unlink(input_path)
-            os.unlink(output_path)
-        except:
-            pass
+        ET.fromstring(result)
+        print("\n✓ Output XML is valid")
+    except ET.ParseError as e:
+        print(f"\n✗ Output XML is invalid: {e}")
+        return False
+    
+    # Check that empty elements don't have CDATA
+    empty_elements_with_cdata = []
+    lines = result.split('\n')
+    for line in lines:
+        if '<![CDATA[]]>' in line or '<![CDATA[   ]]>' in line or ('<![CDATA[' in line and ']]>' in line and not line.strip().replace('<![CDATA[', '').replace(']]>', '').strip()):
+            empty_elements_with_cdata.append(line.strip())
+    
+    if empty_elements_with_cdata:
+        print(f"\n✗ Found empty CDATA sections:")
+        for elem in empty_elements_with_cdata:
+            print(f"  {elem}")
+        return False
+    else:
+        print("\n✓ No empty CDATA sections found")
+    
+    # Check specific patterns
+    issues = []
+    if '<Title><![CDATA[]]></Title>' in result:
+        issues.append("Empty Title has CDATA")
+    if '<Description><![CDATA[   ]]></Description>' in result:
+        issues.append("Whitespace-only Description has CDATA")
+    if '<Content><![CDATA[]]></Content>' in result:
+        issues.append("Empty Content has CDATA")
+    if '<Image><![CDATA[]]></Image>' in result:
+        issues.append("Empty Image has CDATA")
+    if '<URL><![CDATA[]]></URL>' in result:
+        issues.append("Empty URL has CDATA")
+    if '<Body><![CDATA[]]></Body>' in result:
+        issues.append("Empty Body has CDATA")
+    
+    if issues:
+        print(f"\n✗ Issues found:")
+        for issue in issues:
+            print(f"  {issue}")
+        return False
+    else:
+        print("\n✓ All empty elements are handled correctly")
+    
+    return True
 
-def test_elements_with_content_get_cdata():
+def test_elements_with_content_get_cdata(tmp_path):
     """Test that elements with actual content still get CDATA when appropriate."""
     csv_processor = CSVProcessor()
     processor = XMLProcessor(csv_processor)
@@ -125,62 +114,50 @@ def test_elements_with_content_get_cdata():
     <Description>&lt;p&gt;Escaped HTML&lt;/p&gt;</Description>
 </root>'''
     
-    # Create temporary files
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.xml', delete=False) as input_file:
-        input_file.write(xml_content)
-        input_path = input_file.name
+    # Per-test temporary files, cleaned up by pytest
+    input_path = str(tmp_path / "input.xml")
+    output_path = str(tmp_path / "output.xml")
+    (tmp_path / "input.xml").write_text(xml_content, encoding="utf-8")
+
+    # Process the XML
+    success, char_count = processor.translate_xml_sequential(input_path, output_path)
+    
+    if not success:
+        print("✗ Translation failed")
+        return False
+    
+    # Read the result
+    with open(output_path, 'r', encoding='utf-8') as f:
+        result = f.read()
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.xml', delete=False) as output_file:
-        output_path = output_file.name
+    print("\nTesting elements with content:")
+    print("Original XML:")
+    print(xml_content)
+    print("\nProcessed XML:")
+    print(result)
     
+    # Check that output is valid XML
     try:
-        # Process the XML
-        success, char_count = processor.translate_xml_sequential(input_path, output_path)
-        
-        if not success:
-            print("✗ Translation failed")
-            return False
-        
-        # Read the result
-        with open(output_path, 'r', encoding='utf-8') as f:
-            result = f.read()
-        
-        print("\nTesting elements with content:")
-        print("Original XML:")
-        print(xml_content)
-        print("\nProcessed XML:")
-        print(result)
-        
-        # Check that output is valid XML
-        try:
-            ET.fromstring(result)
-            print("\n✓ Output XML is valid")
-        except ET.ParseError as e:
-            print(f"\n✗ Output XML is invalid: {e}")
-            return False
-        
-        # Check that HTML content elements have CDATA
-        has_banner_cdata = '<Banner><![CDATA[' in result
-        has_summary_cdata = '<Summary><![CDATA[' in result
-        has_description_cdata = '<Description><![CDATA[' in result
-        
-        print(f"\n✓ Banner has CDATA: {has_banner_cdata}")
-        print(f"✓ Summary has CDATA: {has_summary_cdata}")
-        print(f"✓ Description has CDATA: {has_description_cdata}")
-        
-        # Title with plain text should not need CDATA unless it originally had it
-        title_needs_cdata = '<Title><![CDATA[' in result
-        print(f"✓ Title has CDATA: {title_needs_cdata}")
-        
-        return True
-        
-    finally:
-        # Clean up temporary files
-        try:
-            os.unlink(input_path)
-            os.unlink(output_path)
-        except:
-            pass
+        ET.fromstring(result)
+        print("\n✓ Output XML is valid")
+    except ET.ParseError as e:
+        print(f"\n✗ Output XML is invalid: {e}")
+        return False
+    
+    # Check that HTML content elements have CDATA
+    has_banner_cdata = '<Banner><![CDATA[' in result
+    has_summary_cdata = '<Summary><![CDATA[' in result
+    has_description_cdata = '<Description><![CDATA[' in result
+    
+    print(f"\n✓ Banner has CDATA: {has_banner_cdata}")
+    print(f"✓ Summary has CDATA: {has_summary_cdata}")
+    print(f"✓ Description has CDATA: {has_description_cdata}")
+    
+    # Title with plain text should not need CDATA unless it originally had it
+    title_needs_cdata = '<Title><![CDATA[' in result
+    print(f"✓ Title has CDATA: {title_needs_cdata}")
+    
+    return True
     
     # XML with HTML content that should get CDATA
     xml_content = '''<?xml version="1.0" encoding="UTF-8"?>
@@ -191,12 +168,55 @@ def test_elements_with_content_get_cdata():
     <Description>&lt;p&gt;Escaped HTML&lt;/p&gt;</Description>
 </root>'''
 
+def test_save_indents_without_reparsing(tmp_path):
+    """Test that saving indents the structure but keeps HTML and mixed content intact."""
+    processor = XMLProcessor(CSVProcessor())
+    
+    xml_content = '<root><Item Id="1"><Banner><p>Hello</p></Banner><Note>Plain</Note><Mixed>Text <b>bold</b> tail</Mixed></Item></root>'
+    tree = ET.ElementTree(ET.fromstring(xml_content))
+    output_path = tmp_path / "output.xml"
+    processor._save_xml_with_structure_preservation(tree, str(output_path), xml_content)
+    
+    assert output_path.read_text(encoding='utf-8') == (
+        '<?xml version="1.0" encoding="utf-8"?>\n'
+        '<root>\n'
+        '    <Item Id="1">\n'
+        '        <Banner><![CDATA[<p>Hello</p>]]></Banner>\n'
+        '        <Note>Plain</Note>\n'
+        '        <Mixed>Text <b>bold</b> tail</Mixed>\n'
+        '    </Item>\n'
+        '</root>\n'
+    )
+    print("✓ Saved XML is indented without touching HTML or mixed content")
+
+def test_save_keeps_entities_inside_cdata(tmp_path):
+    """Test that only the serializer's own escaping is undone inside CDATA sections."""
+    processor = XMLProcessor(CSVProcessor())
+    
+    xml_content = '<root><Description><![CDATA[<p>Tea&nbsp;&amp;&nbsp;mint</p>]]></Description><Note>Salt &lt;1%</Note></root>'
+    tree = ET.ElementTree(ET.fromstring(xml_content))
+    output_path = tmp_path / "output.xml"
+    processor._save_xml_with_structure_preservation(tree, str(output_path), xml_content)
+    
+    output = output_path.read_text(encoding='utf-8')
+    assert '<p>Tea&nbsp;' in output and '&nbsp;mint</p>' in output
+    assert '<Note>Salt &lt;1%</Note>' in output
+    print("✓ Entities written by the source survive CDATA restoration")
+
 if __name__ == "__main__":
     print("Testing empty elements handling...")
-    test1_passed = test_empty_elements_no_cdata()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        test1_passed = test_empty_elements_no_cdata(Path(temp_dir))
+    
+    print("\n" + "="*60)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        test2_passed = test_elements_with_content_get_cdata(Path(temp_dir))
     
     print("\n" + "="*60)
-    test2_passed = test_elements_with_content_get_cdata()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        test_save_indents_without_reparsing(Path(temp_dir))
+    with tempfile.TemporaryDirectory() as temp_dir:
+        test_save_keeps_entities_inside_cdata(Path(temp_dir))
     
     print("\n" + "="*60)
     if test1_passed and test2_passed:
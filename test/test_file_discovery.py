@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Test script to verify discovery of CSV and XML files in the source directory.
+"""
+
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from translator3000.utils.file_utils import discover_files_and_folders, prefetch_file, PARALLEL_SCAN_MIN_FOLDERS
+
+
+def test_discover_files_and_folders(tmp_path):
+    """Test that root files and nested folder files are found and everything else is skipped."""
+    for relative in ["products.csv", "feed.XML", "notes.txt",
+                     "shop/items.csv", "shop/deep/more.xml", "shop/readme.md",
+                     "empty/readme.md", ".hidden/secret.csv"]:
+        path = tmp_path / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x", encoding="utf-8")
+
+    discovered = discover_files_and_folders(tmp_path)
+
+    assert sorted(entry.path.name for entry in discovered['root_files']) == ["feed.XML", "products.csv"]
+    assert list(discovered['folders']) == ["shop"]
+    assert [entry.path for entry in discovered['folders']['shop']] == [tmp_path / "shop" / "items.csv", tmp_path / "shop" / "deep" / "more.xml"]
+
+    # Relative paths and kinds are computed once during discovery
+    assert sorted((entry.rel, entry.kind) for entry in discovered['root_files']) == [("feed.XML", "XML"), ("products.csv", "CSV")]
+    assert [(entry.rel, entry.kind) for entry in discovered['folders']['shop']] == [
+        (os.path.join("shop", "items.csv"), "CSV"), (os.path.join("shop", "deep", "more.xml"), "XML")
+    ]
+
+    print("✅ CSV and XML files are discovered in the root and in subfolders")
+
+
+def test_discover_many_folders(tmp_path):
+    """Test that folders scanned in parallel keep the same order and contents."""
+    names = [f"shop{i}" for i in range(PARALLEL_SCAN_MIN_FOLDERS + 3)]
+    for name in names:
+        nested = tmp_path / name / "nested"
+        nested.mkdir(parents=True)
+        (tmp_path / name / "items.csv").write_text("x", encoding="utf-8")
+        (nested / "feed.xml").write_text("x", encoding="utf-8")
+
+    discovered = discover_files_and_folders(tmp_path)
+
+    assert sorted(discovered['folders']) == names
+    for name, files in discovered['folders'].items():
+        assert [entry.rel for entry in files] == [os.path.join(name, "items.csv"), os.path.join(name, "nested", "feed.xml")]
+
+    print("✅ Wide source trees are scanned in parallel")
+
+
+def test_discover_deep_folder(tmp_path):
+    """Test that nested folders are scanned depth-first with each folder's files first."""
+    deep = tmp_path.joinpath("shop", *["d"] * 100)
+    deep.mkdir(parents=True)
+    (deep / "feed.xml").write_text("x", encoding="utf-8")
+    (tmp_path / "shop" / "items.csv").write_text("x", encoding="utf-8")
+    (tmp_path / "shop" / "d" / "a").mkdir()
+    (tmp_path / "shop" / "d" / "a" / "more.csv").write_text("x", encoding="utf-8")
+
+    discovered = discover_files_and_folders(tmp_path)
+    paths = [entry.path for entry in discovered['folders']['shop']]
+    assert paths[0] == tmp_path / "shop" / "items.csv"
+    assert sorted(paths[1:]) == sorted([deep / "feed.xml", tmp_path / "shop" / "d" / "a" / "more.csv"])
+
+    print("✅ Files 100 folders deep are discovered")
+
+
+def test_prefetch_file(tmp_path):
+    """Test that prefetching is a harmless hint for existing and missing files."""
+    feed = tmp_path / "feed.xml"
+    feed.write_text("<a/>", encoding="utf-8")
+
+    prefetch_file(feed)
+    prefetch_file(tmp_path / "missing.xml")
+    assert feed.read_text(encoding="utf-8") == "<a/>"
+
+    print("✅ Prefetch hints never fail")
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as temp_dir:
+        test_discover_files_and_folders(Path(temp_dir))
+    with tempfile.TemporaryDirectory() as temp_dir:
+        test_discover_many_folders(Path(temp_dir))
+    with tempfile.TemporaryDirectory() as temp_dir:
+        test_discover_deep_folder(Path(temp_dir))
+    with tempfile.TemporaryDirectory() as temp_dir:
+        test_prefetch_file(Path(temp_dir))
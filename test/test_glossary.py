@@ -7,6 +7,11 @@ import pandas as pd
 import re
 from pathlib import Path
 
+import pytest
+
+# These tests share the project-level glossary.csv; keep them on one pytest-xdist worker
+pytestmark = pytest.mark.xdist_group("glossary_file")
+
 PROJECT_ROOT = Path(__file__).parent.parent
 
 def load_glossary():
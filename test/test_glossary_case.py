@@ -8,11 +8,16 @@ import os
 import tempfile
 import logging
 
+import pytest
+
 # Add the project root to Python path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from translator3000.processors.csv_processor import CSVProcessor
 
+# These tests share the project-level glossary.csv; keep them on one pytest-xdist worker
+pytestmark = pytest.mark.xdist_group("glossary_file")
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the glossary helpers in translator3000.utils.text_utils.
+"""
+
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from translator3000.processors import csv_processor
+from translator3000.processors.csv_processor import CSVProcessor
+from translator3000.utils.text_utils import (
+    Glossary, load_glossary, apply_glossary_replacements, compile_glossary_pattern, classify_case, case_variants, preserve_case,
+    CASE_AS_IS, CASE_UPPER, CASE_LOWER, CASE_TITLE
+)
+
+
+def write_glossary(temp_dir, rows):
+    """Write a glossary CSV with the given (source, target, keep_case) rows."""
+    glossary_file = Path(temp_dir) / "glossary.csv"
+    lines = ["source;target;keep_case"] + [";".join(row) for row in rows]
+    glossary_file.write_text("\n".join(lines) + "\n", encoding='utf-8')
+    return glossary_file
+
+
+def test_case_dispatch():
+    """Test that case classes index the precomputed replacement variants."""
+    assert classify_case("HELLO") == CASE_UPPER
+    assert classify_case("hello") == CASE_LOWER
+    assert classify_case("Hello") == CASE_TITLE
+    assert classify_case("hELLo") == CASE_AS_IS
+
+    variants = case_variants("grøn te")
+    for original in ("GREEN TEA", "green tea", "Green Tea", "gREEN tEA"):
+        assert variants[classify_case(original)] == preserve_case(original, "grøn te")
+
+    print("✅ Case classes select the same variant as preserve_case")
+
+
+def test_glossary_keep_case():
+    """Test glossary replacement with and without keep_case."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        glossary = load_glossary(write_glossary(temp_dir, [
+            ("tea", "te", "false"),
+            ("iPhone", "iPhone", "true"),
+        ]))
+
+        assert apply_glossary_replacements("TEA and Tea and tea", glossary) == "TE and Te and te"
+        assert apply_glossary_replacements("IPHONE cover", glossary) == "iPhone cover"
+
+    print("✅ Glossary replacements respect keep_case")
+
+
+def test_glossary_union_pass():
+    """Test that the combined glossary pattern keeps case, prefers longer terms and resolves chains."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        glossary = load_glossary(write_glossary(temp_dir, [
+            ("tea", "te", "false"),
+            ("green tea", "grøn te", "false"),
+            ("api", "API key", "false"),
+            ("key", "nøgle", "false"),
+            ("kit", "KIT", "true"),
+        ]))
+
+    assert apply_glossary_replacements("Green Tea, tea and teapot", glossary) == "Grøn te, te and teapot"
+    assert apply_glossary_replacements("Api and API", glossary) == "Api nøgle and API NØGLE"
+    assert apply_glossary_replacements("kit, Kit and kits", glossary) == "KIT, KIT and kits"
+    assert apply_glossary_replacements("", glossary) == ""
+
+    print("✅ Glossary terms are replaced in one combined pass")
+
+
+def test_glossary_compiled_once():
+    """Test that a loaded glossary compiles its pattern once and recompiles after changes."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        glossary = load_glossary(write_glossary(temp_dir, [("tea", "te", "false")]))
+
+    assert isinstance(glossary, Glossary)
+    compiled = glossary.compiled()
+    assert apply_glossary_replacements("Black tea", glossary) == "Black te"
+    assert glossary.compiled() is compiled
+
+    glossary['coffee'] = {'target': 'kaffe', 'keep_case': False}
+    assert glossary.compiled() is not compiled
+    assert apply_glossary_replacements("tea or coffee", glossary) == "te or kaffe"
+
+    del glossary['tea']
+    assert apply_glossary_replacements("tea or coffee", glossary) == "tea or kaffe"
+
+    print("✅ Loaded glossaries compile their pattern once")
+
+
+def test_glossary_csv_parsing():
+    """Test that quoted fields, comments and malformed lines are handled by the CSV reader."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        glossary = load_glossary(write_glossary(temp_dir, [
+            ('"tea; green"', "grøn te", "false"),
+            ("# comment", "", ""),
+            ("", "", ""),
+            ("only", "two"),
+            ("iPhone", "iPhone", "true"),
+        ]))
+
+    assert set(glossary) == {'tea; green', 'iphone'}
+    assert glossary['tea; green']['target'] == "grøn te"
+    assert glossary['iphone']['keep_case'] is True
+
+    print("✅ Glossary CSV rows are parsed with csv.reader")
+
+
+def test_large_glossary_patterns_compiled_once():
+    """Test that glossaries larger than re's cache reuse their compiled patterns and chains."""
+    assert compile_glossary_pattern("tea") is compile_glossary_pattern("tea")
+
+    processor = CSVProcessor('en', 'da')
+    glossary = {f'term{i}': {'target': f'T{i}', 'keep_case': True, 'original_source': f'term{i}'}
+                for i in range(600)}
+    glossary['api'] = {'target': 'API term5', 'keep_case': False, 'original_source': 'API'}
+    glossary['term5'] = glossary.pop('term5')  # Listed after 'api', so its replacement chains
+    processor.glossary = glossary
+
+    assert processor._apply_glossary_replacements("term1 and api") == "T1 and API T5"
+
+    print("✅ Large glossaries compile each pattern once")
+
+
+def test_processor_glossary_replacement_semantics():
+    """Test that keep_case=False terms match without word boundaries and targets chain into later terms."""
+    processor = CSVProcessor('en', 'da')
+    processor.glossary = {
+        'kit': {'target': 'KIT', 'keep_case': True, 'original_source': 'KIT'},
+        'api': {'target': 'API-nøgle', 'keep_case': False, 'original_source': 'API'},
+        'nøgle': {'target': 'key', 'keep_case': False, 'original_source': 'nøgle'},
+    }
+
+    assert processor._apply_glossary_replacements("No terms here") == "No terms here"
+    assert processor._apply_glossary_replacements("A kit with an Api") == "A KIT with an API-key"
+    assert processor._apply_glossary_replacements("Kit og NØGLE") == "KIT og key"
+    assert processor._apply_glossary_replacements("api, API and xApi") == "API-key, API-key and xAPI-key"
+
+    print("✅ Processor glossary matches inside words and chains targets")
+
+
+def test_processor_glossary_single_pass():
+    """Test that the combined glossary pattern prefers longer terms and is rebuilt on assignment."""
+    processor = CSVProcessor('en', 'da')
+    processor.glossary = {
+        'tea': {'target': 'te', 'keep_case': False, 'original_source': 'tea'},
+        'green tea': {'target': 'grøn te', 'keep_case': False, 'original_source': 'green tea'},
+    }
+
+    # The shorter term is listed first but must not split the longer one
+    assert processor._apply_glossary_replacements("Green Tea and tea") == "grøn te and te"
+
+    processor.glossary = {}
+    assert processor._apply_glossary_replacements("Green Tea") == "Green Tea"
+
+    print("✅ Glossary terms are matched longest first in one pass")
+
+
+def test_processor_glossary_automaton_matches_regex(monkeypatch):
+    """Test that the Aho-Corasick scan replaces exactly what the combined regex replaces."""
+    pytest.importorskip("ahocorasick")
+    glossary = {
+        'kit': {'target': 'KIT', 'keep_case': True, 'original_source': 'KIT'},
+        'api': {'target': 'API-nøgle', 'keep_case': False, 'original_source': 'API'},
+        'nøgle': {'target': 'key', 'keep_case': False, 'original_source': 'nøgle'},
+        'tea': {'target': 'te', 'keep_case': False, 'original_source': 'tea'},
+        'green tea': {'target': 'grøn te', 'keep_case': False, 'original_source': 'green tea'},
+        'c++': {'target': 'C++', 'keep_case': True, 'original_source': 'C++'},
+    }
+    texts = ["No terms here", "A kit with an Api", "Kit og NØGLE", "api, API and xApi",
+             "Green Tea and tea", "kits and _kit and kit_2 and (kit)", "c++ or C++x", "İstanbul kit"]
+
+    processor = CSVProcessor('en', 'da')
+    processor.glossary = glossary
+    assert processor._glossary_automaton is not None
+    with_automaton = [processor._apply_glossary_replacements(text) for text in texts]
+
+    monkeypatch.setattr(csv_processor, 'AHOCORASICK_AVAILABLE', False)
+    processor.glossary = glossary
+    assert processor._glossary_automaton is None
+    assert with_automaton == [processor._apply_glossary_replacements(text) for text in texts]
+
+    print("✅ Aho-Corasick glossary scan agrees with the regex")
+
+
+def test_glossary_first_character_prefilter():
+    """Test that texts without any term's first character skip the glossary scan."""
+    class FailingPattern:
+        def sub(self, *args):
+            raise AssertionError("glossary pattern should not run")
+
+    processor = CSVProcessor('en', 'da')
+    processor.glossary = {
+        'xylo': {'target': 'Xylo', 'keep_case': True, 'original_source': 'Xylo'},
+        'ßtrasse': {'target': 'street', 'keep_case': False, 'original_source': 'ßtrasse'},
+    }
+    assert processor._glossary_first_chars == frozenset({'x', 's'})
+    assert processor._apply_glossary_replacements("XYLO and \u1e9eTRASSE") == "Xylo and street"
+
+    processor._glossary_pattern = FailingPattern()
+    processor._glossary_automaton = None
+    assert processor._apply_glossary_replacements("Green tea") == "Green tea"
+
+    glossary = {'xylo': {'target': 'Xylo', 'keep_case': True}}
+    assert apply_glossary_replacements("Green tea", glossary) == "Green tea"
+    assert apply_glossary_replacements("a XYLO", glossary) == "a Xylo"
+
+    print("✅ Texts without any term's first character skip the scan")
+
+
+if __name__ == "__main__":
+    test_case_dispatch()
+    test_glossary_keep_case()
+    test_glossary_union_pass()
+    test_glossary_compiled_once()
+    test_glossary_csv_parsing()
+    test_large_glossary_patterns_compiled_once()
+    test_processor_glossary_replacement_semantics()
+    test_processor_glossary_single_pass()
+    test_processor_glossary_automaton_matches_regex(pytest.MonkeyPatch())
+    test_glossary_first_character_prefilter()
@@ -11,7 +11,7 @@ import logging
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from translator3000.processors.csv_processor import CSVProcessor
-from translator3000.processors.xml_processor import XMLProcessor
+from translator3000.processors.xml_processor import XMLProcessor, is_ignore_marked, IGNORE_ATTRIBUTE_PATTERN, iter_cdata_regions, scan_cdata_element_tags
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
@@ -69,5 +69,56 @@ def test_ignore_case_and_cdata():
     
     return success
 
+def test_ignore_attribute_detection():
+    """Test that the ignore attribute helpers match any casing of ignore="true"."""
+    assert is_ignore_marked({'Ignore': 'True'})
+    assert is_ignore_marked({'ignore': 'true'})
+    assert is_ignore_marked({'id': '1', 'IGNORE': 'TRUE'})
+    assert not is_ignore_marked({'ignore': 'false'})
+    assert not is_ignore_marked({})
+    
+    assert IGNORE_ATTRIBUTE_PATTERN.search(' Ignore="True"')
+    assert IGNORE_ATTRIBUTE_PATTERN.search(" id='1' ignore='true'")
+    assert not IGNORE_ATTRIBUTE_PATTERN.search(' ignore="false"')
+    print("✅ Ignore attribute detection works for all casings")
+
+def test_cdata_prescan():
+    """Test that the byte-level CDATA scan finds the CDATA-wrapped elements."""
+    data = b'<a><b x="1"><![CDATA[<p>hi</p>]]></b><c>plain</c><d><![CDATA[x]]></d></a>'
+    regions = list(iter_cdata_regions(data))
+    assert [data[start:end] for start, end in regions] == [b'<p>hi</p>', b'x']
+    
+    input_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_ignore_case_fix.xml")
+    assert scan_cdata_element_tags(input_file) == {'image', 'description', 'url'}
+    print("✅ CDATA pre-scan finds CDATA-wrapped elements")
+
+def test_ignored_html_subtree_is_pruned():
+    """Test that text inside an ignore-marked HTML subtree is never sent for translation."""
+    from bs4 import BeautifulSoup
+    
+    class EchoTranslator:
+        def __init__(self):
+            self.calls = []
+        
+        def translate(self, text):
+            self.calls.append(text)
+            return f"[da] {text}"
+    
+    csv_processor = CSVProcessor('en', 'da')
+    fake = EchoTranslator()
+    csv_processor.translators = [('deep_translator', fake)]
+    csv_processor.translation_cache = None
+    xml_processor = XMLProcessor(csv_processor)
+    
+    soup = BeautifulSoup('<p>Hello there</p><div Ignore="True"><p>Keep <b>this</b></p></div><p>Goodbye</p>', 'html.parser')
+    xml_processor._translate_soup_text_nodes(soup)
+    
+    assert fake.calls == ['Hello there', 'Goodbye']
+    assert str(soup) == '<p>[da] Hello there</p><div ignore="True"><p>Keep <b>this</b></p></div><p>[da] Goodbye</p>'
+    print("✅ Ignore-marked HTML subtrees are skipped")
+
 if __name__ == "__main__":
+    test_ignore_attribute_detection()
+    test_cdata_prescan()
+    test_ignored_html_subtree_is_pruned()
     test_ignore_case_and_cdata()
@@ -10,6 +10,11 @@ from translator3000.utils.text_utils import load_glossary, apply_glossary_replac
 from translator3000.processors.csv_processor import CSVProcessor
 from pathlib import Path
 
+import pytest
+
+# These tests share the project-level glossary.csv; keep them on one pytest-xdist worker
+pytestmark = pytest.mark.xdist_group("glossary_file")
+
 def test_kit_glossary_behavior():
     """Test that KIT with keep_case=True works correctly."""
     print("=== Testing KIT Glossary Behavior ===")
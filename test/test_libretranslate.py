@@ -74,6 +74,27 @@ def test_service_fallback():
     except Exception as e:
         print(f"✗ Fallback test failed: {e}")
 
+def test_selfhost_check_is_cached():
+    """Test that the self-hosted availability probe runs once within its TTL."""
+    from translator3000.services import libre_translate
+    
+    print("\n=== Self-hosted Check Cache Test ===")
+    
+    probes = []
+    original_check = libre_translate._check_libretranslate_selfhost
+    libre_translate._check_libretranslate_selfhost = lambda url, timeout: probes.append(url) or False
+    libre_translate._selfhost_checks.clear()
+    try:
+        for _ in range(3):
+            assert libre_translate.is_libretranslate_selfhost_available() is False
+        assert len(probes) == 1
+    finally:
+        libre_translate._check_libretranslate_selfhost = original_check
+        libre_translate._selfhost_checks.clear()
+    
+    print("✓ Self-hosted availability probed once for repeated checks")
+
 if __name__ == "__main__":
     test_libretranslate_integration()
     test_service_fallback()
+    test_selfhost_check_is_cached()
@@ -68,31 +68,32 @@ def test_multithreading_performance():
     # Test single-threaded approach
     print("Testing SINGLE-THREADED translation...")
     start_time = time.time()
-    single_threaded_result = translator._translate_column_single_threaded(df, 'Product')
+    single_threaded_result, _ = translator.csv_processor._translate_column_single_threaded(df, 'Product')
     single_threaded_time = time.time() - start_time
     
     print(f"Single-threaded time: {single_threaded_time:.2f}s")
-    print(f"Sample results: {single_threaded_result.head(3).tolist()}")
+    print(f"Sample results: {single_threaded_result[:3]}")
     print()
     
     # Test multithreaded approach with different worker counts
     for workers in [2, 4, 6]:
         print(f"Testing MULTITHREADED translation ({workers} workers)...")
         start_time = time.time()
-        multithreaded_result = translator.translate_column_multithreaded(df, 'Product', max_workers=workers)
+        multithreaded_result, _ = translator.translate_column_multithreaded(df, 'Product', max_workers=workers)
         multithreaded_time = time.time() - start_time
         
         speedup = single_threaded_time / multithreaded_time if multithreaded_time > 0 else 0
         
         print(f"Multithreaded time ({workers} workers): {multithreaded_time:.2f}s")
         print(f"Speedup: {speedup:.1f}x faster")
-        print(f"Sample results: {multithreaded_result.head(3).tolist()}")
+        print(f"Sample results: {multithreaded_result[:3]}")
+        assert len(multithreaded_result) == len(df)
         print()
     
     # Test the automatic selection logic
     print("Testing AUTOMATIC threading selection...")
     start_time = time.time()
-    auto_result = translator.translate_column(df, 'Description', use_multithreading=True, max_workers=4)
+    auto_result, _ = translator.translate_column(df, 'Description', use_multithreading=True, max_workers=4)
     auto_time = time.time() - start_time
     
     auto_speedup = single_threaded_time / auto_time if auto_time > 0 else 0
@@ -113,5 +114,49 @@ def test_multithreading_performance():
     print("  ✅ Automatic fallback to single-threaded")
     print("  ✅ Thread-safe progress tracking")
 
+def test_duplicate_values_translated_once():
+    """Test that repeated column values only reach the translation service once."""
+    
+    class CountingTranslator:
+        def __init__(self):
+            self.calls = []
+        
+        def translate(self, text):
+            self.calls.append(text)
+            return f"[da] {text}"
+    
+    translator = CSVTranslator(source_lang='en', target_lang='da')
+    fake = CountingTranslator()
+    translator.csv_processor.translators = [('deep_translator', fake)]
+    translator.csv_processor.translation_cache = None
+    
+    df = pd.DataFrame({'Product': ['Red Wine', 'Olive Oil', 'Red Wine', None, 'Red Wine', 'Olive Oil']})
+    result, _ = translator.translate_column_multithreaded(df, 'Product', max_workers=3)
+    
+    assert result[:3] == ['[da] Red Wine', '[da] Olive Oil', '[da] Red Wine']
+    assert pd.isna(result[3])
+    assert result[4:] == ['[da] Red Wine', '[da] Olive Oil']
+    assert sorted(fake.calls) == ['Olive Oil', 'Red Wine']
+    print("✅ Duplicate values are translated once")
+
+def test_failed_value_keeps_original():
+    """Test that one failing value keeps its text without stopping the other rows."""
+    translator = CSVTranslator(source_lang='en', target_lang='da')
+    processor = translator.csv_processor
+    
+    def translate_text(text):
+        if text == 'Broken':
+            raise RuntimeError("service error")
+        return f"[da] {text}"
+    processor.translate_text = translate_text
+    
+    df = pd.DataFrame({'Product': ['Red Wine', 'Broken', 'Olive Oil', 'Broken']})
+    result, _ = processor.translate_column_multithreaded(df, 'Product', max_workers=2)
+    
+    assert result == ['[da] Red Wine', 'Broken', '[da] Olive Oil', 'Broken']
+    print("✅ Failed values keep their original text")
+
 if __name__ == "__main__":
     test_multithreading_performance()
+    test_duplicate_values_translated_once()
+    test_failed_value_keeps_original()
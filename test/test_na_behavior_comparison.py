@@ -2,12 +2,20 @@
 """
 Demonstrate the difference between old and new behavior for number formatting
 """
+import io
 import sys
 import os
 sys.path.insert(0, os.path.abspath('..'))
 
+import numpy as np
 import pandas as pd
 
+def render_csv(df):
+    """Serialize a DataFrame the way the translator writes it and return the text."""
+    buffer = io.StringIO()
+    df.to_csv(buffer, index=False, sep=';')
+    return buffer.getvalue()
+
 def test_na_behavior():
     """Test the difference between keep_default_na=True vs False."""
     print("=== Demonstrating keep_default_na Behavior ===")
@@ -22,46 +30,42 @@ def test_na_behavior():
     print(test_csv_content)
     print()
     
-    # Write test file
-    with open("test_na_behavior.csv", "w", encoding="utf-8") as f:
-        f.write(test_csv_content)
+    # Encode once; both variants parse the same bytes
+    raw = test_csv_content.encode('utf-8')
     
     print("=== OLD BEHAVIOR (keep_default_na=True - default) ===")
-    df_old = pd.read_csv("test_na_behavior.csv", encoding='utf-8', delimiter=';')
+    df_old = pd.read_csv(io.BytesIO(raw), encoding='utf-8', delimiter=';')
     print("DataFrame dtypes:")
     print(df_old.dtypes)
     print("\nDataFrame content:")
     print(df_old)
     print("\nEmpty cells become:")
-    for col in df_old.columns:
-        for i, val in enumerate(df_old[col]):
-            if pd.isna(val):
-                print(f"  Row {i}, Column '{col}': {val} (type: {type(val)})")
+    old_values = df_old.to_numpy(dtype=object)
+    for i, j in np.argwhere(df_old.isna().to_numpy()):
+        val = old_values[i, j]
+        print(f"  Row {i}, Column '{df_old.columns[j]}': {val} (type: {type(val)})")
     
     # Save and read back
-    df_old.to_csv("test_na_old_output.csv", index=False, encoding='utf-8', sep=';')
-    with open("test_na_old_output.csv", "r", encoding="utf-8") as f:
-        old_result = f.read()
+    old_result = render_csv(df_old)
     print("\nAfter save/read cycle:")
     print(old_result)
     
     print("\n" + "="*60)
     print("=== NEW BEHAVIOR (keep_default_na=False - our fix) ===")
-    df_new = pd.read_csv("test_na_behavior.csv", encoding='utf-8', delimiter=';', keep_default_na=False)
+    df_new = pd.read_csv(io.BytesIO(raw), encoding='utf-8', delimiter=';', keep_default_na=False)
     print("DataFrame dtypes:")
     print(df_new.dtypes)
     print("\nDataFrame content:")
     print(df_new)
     print("\nEmpty cells become:")
-    for col in df_new.columns:
-        for i, val in enumerate(df_new[col]):
-            if val == '' or pd.isna(val):
-                print(f"  Row {i}, Column '{col}': '{val}' (type: {type(val)})")
+    empty_mask = df_new.eq('') | df_new.isna()
+    new_values = df_new.to_numpy(dtype=object)
+    for i, j in np.argwhere(empty_mask.to_numpy()):
+        val = new_values[i, j]
+        print(f"  Row {i}, Column '{df_new.columns[j]}': '{val}' (type: {type(val)})")
     
     # Save and read back
-    df_new.to_csv("test_na_new_output.csv", index=False, encoding='utf-8', sep=';')
-    with open("test_na_new_output.csv", "r", encoding="utf-8") as f:
-        new_result = f.read()
+    new_result = render_csv(df_new)
     print("\nAfter save/read cycle:")
     print(new_result)
     
@@ -76,13 +80,6 @@ def test_na_behavior():
         print("❌ NEW behavior: Found .0 in numbers")
     else:
         print("✅ NEW behavior: No .0 found - issue fixed!")
-    
-    # Clean up
-    for file in ["test_na_behavior.csv", "test_na_old_output.csv", "test_na_new_output.csv"]:
-        try:
-            os.remove(file)
-        except:
-            pass
 
 if __name__ == "__main__":
     test_na_behavior()
@@ -9,7 +9,7 @@ from pathlib import Path
 # Add project directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from translator3000 import generate_output_filename, generate_output_directory, get_language_name
+from translator3000.utils.language_utils import generate_output_filename, generate_output_directory, get_language_name
 
 def test_naming_conventions():
     """Test the new naming conventions for files and directories."""
@@ -19,12 +19,12 @@ def test_naming_conventions():
     # Test cases for different language codes
     test_languages = ['sv', 'da', 'nl', 'de', 'fr']
     test_files = ['products.csv', 'inventory.xml', 'catalog.csv']
+    lang_names = {lang: get_language_name(lang) for lang in test_languages}
     
     print("1. Root File Naming (filename - Language.ext):")
     print("-" * 50)
     for lang in test_languages:
-        lang_name = get_language_name(lang)
-        print(f"Language: {lang} ({lang_name})")
+        print(f"Language: {lang} ({lang_names[lang]})")
         for filename in test_files:
             new_name = generate_output_filename(filename, lang, is_root_file=True)
             print(f"  {filename} -> {new_name}")
@@ -55,9 +55,8 @@ def test_naming_conventions():
     test_folders = ['products', 'categories', 'suppliers']
     for folder in test_folders:
         for lang in test_languages:
-            lang_name = get_language_name(lang)
             target_dir = generate_output_directory(base_dir, folder, lang, is_batch_folder=True)
-            print(f"  {folder} -> {lang} ({lang_name}): {target_dir}")
+            print(f"  {folder} -> {lang} ({lang_names[lang]}): {target_dir}")
         print()
 
 if __name__ == "__main__":
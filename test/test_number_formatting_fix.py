@@ -2,11 +2,14 @@
 """
 Test the CSV processor with actual data to verify the .0 number fix
 """
+import io
 import sys
 import os
 sys.path.insert(0, os.path.abspath('..'))
 
-from translator3000.translator import CSVTranslator
+import pandas as pd
+
+from translator3000.translator import get_translator
 
 def test_actual_csv_with_numbers():
     """Test CSV translation with actual data to verify number formatting."""
@@ -22,17 +25,14 @@ def test_actual_csv_with_numbers():
     print("Test CSV content:")
     print(test_csv_content)
     
-    # Write test file
-    with open("test_number_formatting.csv", "w", encoding="utf-8") as f:
-        f.write(test_csv_content)
-    
     # Initialize translator with semicolon delimiter
-    translator = CSVTranslator(source_lang='en', target_lang='da')
+    translator = get_translator('en', 'da')
     
-    # Translate only the Description column
+    # Translate only the Description column (in-memory buffers instead of files)
+    output = io.StringIO()
     success, chars = translator.translate_csv(
-        input_file="test_number_formatting.csv",
-        output_file="test_number_formatting_translated.csv", 
+        input_file=io.StringIO(test_csv_content),
+        output_file=output, 
         columns_to_translate=["Description"],
         delimiter=";"
     )
@@ -40,28 +40,21 @@ def test_actual_csv_with_numbers():
     if success:
         print(f"✓ Translation completed successfully! {chars} characters translated.")
         
-        # Read and show the result
-        with open("test_number_formatting_translated.csv", "r", encoding="utf-8") as f:
-            result = f.read()
+        # Show the result
+        result = output.getvalue()
         print("\nTranslated CSV content:")
         print(result)
         
         # Check for .0 in numeric columns
-        lines = result.strip().split('\n')
-        for i, line in enumerate(lines[1:], 1):  # Skip header
-            if '.0;' in line:
-                print(f"⚠️  Warning: Found .0 in line {i}: {line}")
-            else:
-                print(f"✓ Line {i} looks good: {line}")
+        df_out = pd.read_csv(io.StringIO(result), sep=';', dtype=str, keep_default_na=False)
+        dot_zero_rows = df_out.apply(lambda column: column.str.match(r'^\d+\.0$')).any(axis=1)
+        if dot_zero_rows.any():
+            for i in dot_zero_rows[dot_zero_rows].index:
+                print(f"⚠️  Warning: Found .0 in line {i + 1}: {';'.join(df_out.iloc[i])}")
+        else:
+            print(f"✓ All {len(df_out)} lines look good")
     else:
         print("✗ Translation failed!")
-    
-    # Clean up
-    try:
-        os.remove("test_number_formatting.csv")
-        os.remove("test_number_formatting_translated.csv") 
-    except:
-        pass
 
 if __name__ == "__main__":
     test_actual_csv_with_numbers()
@@ -2,11 +2,14 @@
 """
 Test the exact scenario from the original issue: "7131526;7131525;30000;" becoming "7131526;7131525.0;30000;"
 """
+import io
 import sys
 import os
 sys.path.insert(0, os.path.abspath('..'))
 
-from translator3000.translator import CSVTranslator
+import pandas as pd
+
+from translator3000.translator import get_translator
 
 def test_original_issue():
     """Test the exact scenario that was causing .0 to be added."""
@@ -20,39 +23,26 @@ def test_original_issue():
     print("Original CSV:")
     print(test_csv_content)
     
-    # Write test file
-    with open("test_original_issue.csv", "w", encoding="utf-8") as f:
-        f.write(test_csv_content)
-    
     # Test WITHOUT translating any columns (to see if numbers still get .0 added)
-    translator = CSVTranslator(source_lang='en', target_lang='da')
+    translator = get_translator('en', 'da')
     
     print("\n=== Test 1: No columns translated (just read/write) ===")
+    output = io.StringIO()
     success, chars = translator.translate_csv(
-        input_file="test_original_issue.csv",
-        output_file="test_original_issue_output.csv", 
+        input_file=io.StringIO(test_csv_content),
+        output_file=output, 
         columns_to_translate=[],  # No columns to translate
         delimiter=";"
     )
     
-    if success:
-        with open("test_original_issue_output.csv", "r", encoding="utf-8") as f:
-            result = f.read()
-        print("Result after read/write cycle:")
-        print(result)
-        
-        # Check specifically for the pattern from your issue
-        if "7131525.0" in result:
-            print("❌ ISSUE REPRODUCED: Found .0 in numbers!")
-        else:
-            print("✅ ISSUE FIXED: No .0 found in numbers!")
+    assert success, "CSV read/write cycle failed"
+    result = output.getvalue()
     
-    # Clean up
-    try:
-        os.remove("test_original_issue.csv")
-        os.remove("test_original_issue_output.csv") 
-    except:
-        pass
+    # Check specifically for the pattern from your issue
+    df_out = pd.read_csv(io.StringIO(result), sep=';', dtype=str, keep_default_na=False)
+    has_dot_zero = df_out.apply(lambda column: column.str.match(r'^\d+\.0$')).any().any()
+    assert not has_dot_zero, f"ISSUE REPRODUCED: Found .0 in numbers!\n{result}"
 
 if __name__ == "__main__":
     test_original_issue()
+    print("✅ ISSUE FIXED: No .0 found in numbers!")
@@ -5,24 +5,23 @@ This test verifies that all paragraphs in HTML content are correctly translated,
 especially focusing on the first paragraph which was previously not being translated.
 """
 
-import os
 import sys
 import logging
+import tempfile
 from pathlib import Path
 
+import pytest
+
 # Add the parent directory to the path to be able to import modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from translator3000.processors.csv_processor import CSVProcessor
-from translator3000.processors.xml_processor import XMLProcessor
 from translator3000.utils.logging_utils import setup_logging
-from translator3000.config import load_config
 
 # Set up logging
 setup_logging()
 logger = logging.getLogger(__name__)
 
-def test_paragraph_translation():
+def test_paragraph_translation(csv_processor, xml_processor, monkeypatch):
     """Test that all paragraphs in HTML content are translated correctly."""
     
     # Create a simple XML file with HTML content containing multiple paragraphs
@@ -34,37 +33,21 @@ def test_paragraph_translation():
 </root>
 """
     
-    # Create test files
-    test_input_file = "test_paragraph_translation_input.xml"
-    test_output_file = "test_paragraph_translation_output.xml"
-    
-    # Write the test XML to a file
-    with open(test_input_file, "w", encoding="utf-8") as f:
-        f.write(test_xml)
-    
-    # Load configuration
-    load_config()
-    
-    # Create processors
-    csv_processor = CSVProcessor()
-    xml_processor = XMLProcessor(csv_processor)
-    
-    # Set mock translation for testing
-    csv_processor.translate_text = lambda text: f"[TRANSLATED] {text}"
-    
-    # Translate the XML
-    success, chars = xml_processor.translate_xml(test_input_file, test_output_file)
-    
-    # Read the output file
-    with open(test_output_file, "r", encoding="utf-8") as f:
-        output_content = f.read()
+    # Set mock translation for testing (undone automatically after the test)
+    monkeypatch.setattr(csv_processor, 'translate_text', lambda text: f"[TRANSLATED] {text}")
+    # HTML text nodes are sent together through the batch entry point
+    monkeypatch.setattr(csv_processor, 'translate_texts',
+                        lambda texts, max_workers=None: [f"[TRANSLATED] {text}" for text in texts])
     
-    # Clean up
-    try:
-        os.remove(test_input_file)
-        os.remove(test_output_file)
-    except:
-        pass
+    # The XML processor reads and writes by path, so use a self-cleaning temp directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        test_input_file = Path(temp_dir) / "test_paragraph_translation_input.xml"
+        test_output_file = Path(temp_dir) / "test_paragraph_translation_output.xml"
+        test_input_file.write_text(test_xml, encoding="utf-8")
+        
+        # Translate the XML
+        success, chars = xml_processor.translate_xml(str(test_input_file), str(test_output_file))
+        output_content = test_output_file.read_text(encoding="utf-8")
     
     # Check results
     logger.info(f"Translation success: {success}")
@@ -79,4 +62,4 @@ def test_paragraph_translation():
     logger.info("All paragraphs were successfully translated!")
 
 if __name__ == "__main__":
-    test_paragraph_translation()
+    sys.exit(pytest.main([__file__]))
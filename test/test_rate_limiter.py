@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the shared request rate limiter.
+"""
+
+import sys
+import os
+import time
+import concurrent.futures
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from translator3000.services import TokenBucket
+from translator3000.processors.csv_processor import CSVProcessor
+
+
+def test_rate_holds_across_threads():
+    """Test that worker threads together stay under the configured rate."""
+    bucket = TokenBucket(rate=50, capacity=1)
+
+    start = time.monotonic()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda _: bucket.acquire(), range(11)))
+    elapsed = time.monotonic() - start
+
+    # One token is available at once, the other ten arrive at 50 per second
+    assert elapsed >= 0.19
+    print(f"✅ 11 requests from 4 threads took {elapsed:.2f}s at 50 req/s")
+
+
+def test_slow_requests_do_not_sleep():
+    """Test that time spent on the network refills the bucket."""
+    bucket = TokenBucket(rate=20, capacity=1)
+    bucket.acquire()
+    time.sleep(0.06)  # A request slower than the 50ms spacing
+
+    start = time.monotonic()
+    bucket.acquire()
+    assert time.monotonic() - start < 0.01
+
+    # A disabled limiter never waits
+    unlimited = TokenBucket(rate=0)
+    start = time.monotonic()
+    for _ in range(1000):
+        unlimited.acquire()
+    assert time.monotonic() - start < 0.1
+
+    print("✅ Slow requests are not followed by an extra pause")
+
+
+def test_processor_rate_follows_delay():
+    """Test that the processor derives its rate from the delay and rebuilds it on set_delay."""
+    processor = CSVProcessor('en', 'da', delay_between_requests=0)
+    assert processor._limiter.rate == 0
+
+    processor.set_delay(0.5)
+    assert processor.delay == 0.5
+    assert processor._limiter.rate > 0
+
+    print("✅ Processor limiter follows the request delay")
+
+
+if __name__ == "__main__":
+    test_rate_holds_across_threads()
+    test_slow_requests_do_not_sleep()
+    test_processor_rate_follows_delay()
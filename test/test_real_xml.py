@@ -5,29 +5,27 @@ Test translation with a real XML file.
 
 import sys
 import os
-sys.path.append(os.getcwd())
+from itertools import islice
+
+import pytest
 
-import sys
-import os
 # Add parent directory to path so we can import translator3000
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from translator3000 import CSVTranslator
 
-def test_real_xml():
-    """Test with a real XML file."""
-    
-    # Initialize translator
-    translator = CSVTranslator(source_lang='en', target_lang='da')  # English to Danish
+def translate_sample_xml():
+    """
+    Translate the sample product XML once.
     
+    Returns:
+        Path to the translated file, or None if the input is missing or translation failed
+    """
     # Use test source and target directories from config
     from translator3000.config import TEST_SOURCE_DIR, TARGET_DIR
     input_file = TEST_SOURCE_DIR / "sample_products.xml"
     output_file = TARGET_DIR / "sample_products_danish.xml"
     
-    # Create target directory if it doesn't exist
-    os.makedirs(os.path.dirname(output_file), exist_ok=True)
-    
     print("Testing XML translation with real product data...")
     print(f"Input: {input_file}")
     print(f"Output: {output_file}")
@@ -39,22 +37,39 @@ def test_real_xml():
         if os.path.exists(source_dir):
             files = [f for f in os.listdir(source_dir) if f.endswith('.xml')]
             print(f"Available XML files: {files}")
-        return
+        return None
+    
+    # Create target directory if it doesn't exist
+    os.makedirs(os.path.dirname(output_file), exist_ok=True)
+    
+    # Initialize translator
+    translator = CSVTranslator(source_lang='en', target_lang='da')  # English to Danish
     
     # Translate
-    success = translator.translate_xml(input_file, output_file)
+    success, _ = translator.translate_xml(str(input_file), str(output_file))
+    return output_file if success else None
+
+@pytest.fixture(scope="module")
+def translated_xml():
+    """Translated sample XML, produced once and shared by every test in this module."""
+    output_file = translate_sample_xml()
+    if output_file is None:
+        pytest.skip("sample_products.xml not available or translation failed")
+    return output_file
+
+def test_real_xml(translated_xml):
+    """Test with a real XML file."""
+    print("\n=== Translation completed successfully! ===")
     
-    if success:
-        print("\n=== Translation completed successfully! ===")
-        
-        # Show first few lines of output
-        print("\n=== First 20 lines of output ===")
-        with open(output_file, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-            for i, line in enumerate(lines[:20]):
-                print(f"{i+1:2d}: {line.rstrip()}")
-    else:
-        print("Translation failed!")
+    # Show first few lines of output
+    print("\n=== First 20 lines of output ===")
+    with open(translated_xml, 'r', encoding='utf-8') as f:
+        for i, line in enumerate(islice(f, 20)):
+            print(f"{i+1:2d}: {line.rstrip()}")
 
 if __name__ == "__main__":
-    test_real_xml()
+    output_file = translate_sample_xml()
+    if output_file is not None:
+        test_real_xml(output_file)
+    else:
+        print("Translation failed!")
@@ -10,6 +10,8 @@ Test script to verify the robust XML processor with BeautifulSoup handles:
 import sys
 import os
 import logging
+import tempfile
+from pathlib import Path
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))  # Go up one directory to find translator3000
 
 from translator3000.processors.xml_processor import XMLProcessor
@@ -18,17 +20,13 @@ from translator3000.processors.csv_processor import CSVProcessor
 # Enable debug logging to see what's happening
 logging.basicConfig(level=logging.DEBUG, format='%(levelname)s - %(message)s')
 
-def test_ignore_attribute():
+def test_ignore_attribute(xml_processor, tmp_path):
     """Test that elements with ignore='true' are not translated."""
     
     print("🧪 Testing XML processor with ignore attribute...")
     
-    # Initialize processors
-    csv_processor = CSVProcessor('en', 'da')  # English to Danish for testing
-    xml_processor = XMLProcessor(csv_processor)
-    
-    input_file = "test_ignore_attribute.xml"
-    output_file = "test_ignore_attribute_translated.xml"
+    input_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_ignore_attribute.xml")
+    output_file = str(tmp_path / "test_ignore_attribute_translated.xml")
     
     print(f"📖 Input file: {input_file}")
     print(f"💾 Output file: {output_file}")
@@ -44,74 +42,49 @@ def test_ignore_attribute():
     
     # Translate the XML
     success, chars_translated = xml_processor.translate_xml(input_file, output_file)
+    assert success, "Translation failed"
     
-    if success:
-        print(f"✅ Translation completed successfully!")
-        print(f"📏 Characters translated: {chars_translated}")
-        
-        # Read and display the result
-        with open(output_file, 'r', encoding='utf-8') as f:
-            result = f.read()
-        
-        print("\n📄 Translated XML content:")
-        print("=" * 50)
-        print(result)
-        print("=" * 50)
-        
-        # Check for ignore behavior more accurately
-        print("\n🔍 Analyzing ignore attribute behavior:")
-        
-        # Check XML-level ignore elements
-        if '<Description ignore="true">This should NOT be translated</Description>' in result:
-            print("✅ XML-level ignore working: Description element not translated")
-        else:
-            print("❌ XML-level ignore failed: Description element was translated")
-            
-        if '<Title>This nested title should NOT be translated</Title>' in result:
-            print("✅ XML-level ignore working: Nested ignored section not translated")
-        else:
-            print("❌ XML-level ignore failed: Nested ignored section was translated")
-        
-        # Check HTML-level ignore elements (within CDATA)
-        if 'This div content should NOT be translated' in result:
-            print("✅ HTML-level ignore working: Div with ignore='true' not translated")
-        else:
-            print("❌ HTML-level ignore failed: Div with ignore='true' was translated")
-            
-        if 'This list item should NOT be translated' in result:
-            print("✅ HTML-level ignore working: List item with ignore='true' not translated")
-        else:
-            print("❌ HTML-level ignore failed: List item with ignore='true' was translated")
-        
-        # Check that non-ignored content WAS translated
-        if 'Dette skal oversættes' in result:
-            print("✅ Translation working: Non-ignored content was translated")
-        else:
-            print("❌ Translation failed: Non-ignored content was not translated")
-            
-        # Check that ignored content stayed in English
-        english_phrases_that_should_stay = [
-            "This should NOT be translated",
-            "This div content should NOT be translated", 
-            "This list item should NOT be translated",
-            "This nested title should NOT be translated",
-            "This nested description should NOT be translated"
-        ]
-        
-        ignored_correctly = 0
-        for phrase in english_phrases_that_should_stay:
-            if phrase in result:
-                ignored_correctly += 1
-        
-        print(f"\n📊 Summary: {ignored_correctly}/{len(english_phrases_that_should_stay)} ignored phrases correctly preserved")
-        
-        if ignored_correctly == len(english_phrases_that_should_stay):
-            print("🎉 SUCCESS: All ignore attributes working correctly!")
-        else:
-            print("⚠️  Some ignore attributes may not be working properly")
-            
-    else:
-        print("❌ Translation failed!")
+    with open(output_file, 'r', encoding='utf-8') as f:
+        result = f.read()
+    
+    # XML-level ignore elements
+    assert '<Description ignore="true">This should NOT be translated</Description>' in result, \
+        "XML-level ignore failed: Description element was translated"
+    assert '<Title>This nested title should NOT be translated</Title>' in result, \
+        "XML-level ignore failed: Nested ignored section was translated"
+    
+    # HTML-level ignore elements (within CDATA)
+    assert 'This div content should NOT be translated' in result, \
+        "HTML-level ignore failed: Div with ignore='true' was translated"
+    assert 'This list item should NOT be translated' in result, \
+        "HTML-level ignore failed: List item with ignore='true' was translated"
+    
+    # Ignored content stays in English
+    english_phrases_that_should_stay = [
+        "This should NOT be translated",
+        "This div content should NOT be translated", 
+        "This list item should NOT be translated",
+        "This nested title should NOT be translated",
+        "This nested description should NOT be translated"
+    ]
+    missing = [phrase for phrase in english_phrases_that_should_stay if phrase not in result]
+    assert not missing, f"Ignored phrases were translated: {missing}"
 
 if __name__ == "__main__":
-    test_ignore_attribute()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        test_ignore_attribute(XMLProcessor(CSVProcessor('en', 'da')), Path(temp_dir))
+        with open(Path(temp_dir) / "test_ignore_attribute_translated.xml", 'r', encoding='utf-8') as f:
+            result = f.read()
+    
+    print(f"✅ Translation completed successfully!")
+    print("\n📄 Translated XML content:")
+    print("=" * 50)
+    print(result)
+    print("=" * 50)
+    
+    # Non-ignored content is only translated when a translation service is reachable
+    if 'Dette skal oversættes' in result:
+        print("✅ Translation working: Non-ignored content was translated")
+    else:
+        print("❌ Translation failed: Non-ignored content was not translated")
+    print("🎉 SUCCESS: All ignore attributes working correctly!")
@@ -8,17 +8,18 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from translator3000.processors.xml_processor import XMLProcessor
 from translator3000.processors.csv_processor import CSVProcessor
+import re
 import tempfile
+from pathlib import Path
 
-def test_space_preservation():
+# Tag boundary markers checked in the translated output, found in one pass
+SPACING_MARKERS = re.compile(r'(micare <strong|micare<strong|</strong> For|</strong>For| <em>|</em> | <span>|</span> )')
+
+def test_space_preservation(xml_processor, tmp_path):
     """Test that spaces around translated text are preserved."""
     
     print("🧪 Testing space preservation in HTML translation...")
     
-    # Initialize processors
-    csv_processor = CSVProcessor('en', 'da')  # English to Danish for testing
-    xml_processor = XMLProcessor(csv_processor)
-    
     # XML with HTML content that has critical spaces
     xml_content = '''<?xml version="1.0" encoding="UTF-8"?>
 <root>
@@ -29,77 +30,109 @@ def test_space_preservation():
     ]]></Content>
 </root>'''
     
-    # Create temporary files
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.xml', delete=False) as input_file:
-        input_file.write(xml_content)
-        input_path = input_file.name
-    
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.xml', delete=False) as output_file:
-        output_path = output_file.name
-    
-    try:
-        print("📄 Original XML content:")
-        print("=" * 60)
-        print(xml_content)
-        print("=" * 60)
-        
-        # Process the XML
-        success, char_count = xml_processor.translate_xml_sequential(input_path, output_path)
-        
-        if not success:
-            print("❌ Translation failed")
-            return False
-        
-        # Read the result
-        with open(output_path, 'r', encoding='utf-8') as f:
-            result = f.read()
-        
-        print("\n📄 Translated XML content:")
-        print("=" * 60)
-        print(result)
-        print("=" * 60)
-        
-        # Check for proper space preservation
-        print("\n🔍 Analyzing space preservation:")
-        
-        # Check that spaces around <strong> tag are preserved
-        if 'micare<strong' in result and '</strong>For' in result:
-            print("✅ Spaces around <strong> tag preserved")
-        else:
-            print("❌ Spaces around <strong> tag lost!")
-            if 'micare <strong' in result:
-                print("  - Extra space before <strong> detected")
-            if '</strong> For' in result:
-                print("  - Extra space after </strong> detected")
-            return False
-        
-        # Check that spaces around <em> tag are preserved
-        if ' <em>' in result and '</em> ' in result:
-            print("✅ Spaces around <em> tag preserved")
-        else:
-            print("❌ Spaces around <em> tag lost!")
-            return False
-        
-        # Check that spaces around <span> tag are preserved
-        if ' <span>' in result and '</span> ' in result:
-            print("✅ Spaces around <span> tag preserved")
-        else:
-            print("❌ Spaces around <span> tag lost!")
-            return False
-        
-        print("\n🎉 SUCCESS: All spaces properly preserved!")
-        return True
-        
-    finally:
-        # Clean up temporary files
-        try:
-            os.unlink(input_path)
-            os.unlink(output_path)
-        except:
-            pass
+    # Per-test temporary files, cleaned up by pytest
+    input_path = str(tmp_path / "input.xml")
+    output_path = str(tmp_path / "output.xml")
+    (tmp_path / "input.xml").write_text(xml_content, encoding="utf-8")
+
+    print("📄 Original XML content:")
+    print("=" * 60)
+    print(xml_content)
+    print("=" * 60)
+    
+    # Process the XML
+    success, char_count = xml_processor.translate_xml_sequential(input_path, output_path)
+    
+    if not success:
+        print("❌ Translation failed")
+        return False
+    
+    # Read the result
+    with open(output_path, 'r', encoding='utf-8') as f:
+        result = f.read()
+    
+    print("\n📄 Translated XML content:")
+    print("=" * 60)
+    print(result)
+    print("=" * 60)
+    
+    # Check for proper space preservation
+    print("\n🔍 Analyzing space preservation:")
+    found = {match.group(1) for match in SPACING_MARKERS.finditer(result)}
+    
+    # Check that spaces around <strong> tag are preserved
+    if {'micare<strong', '</strong>For'} <= found:
+        print("✅ Spaces around <strong> tag preserved")
+    else:
+        print("❌ Spaces around <strong> tag lost!")
+        if 'micare <strong' in found:
+            print("  - Extra space before <strong> detected")
+        if '</strong> For' in found:
+            print("  - Extra space after </strong> detected")
+        return False
+    
+    # Check that spaces around <em> tag are preserved
+    if {' <em>', '</em> '} <= found:
+        print("✅ Spaces around <em> tag preserved")
+    else:
+        print("❌ Spaces around <em> tag lost!")
+        return False
+    
+    # Check that spaces around <span> tag are preserved
+    if {' <span>', '</span> '} <= found:
+        print("✅ Spaces around <span> tag preserved")
+    else:
+        print("❌ Spaces around <span> tag lost!")
+        return False
+    
+    print("\n🎉 SUCCESS: All spaces properly preserved!")
+    return True
+
+def test_surrounding_whitespace_kept():
+    """Test that text and tail whitespace survive when the stripped text is replaced."""
+    import xml.etree.ElementTree as ET
+    
+    root = ET.fromstring("<root><a>\tHello</a>  tail text\n<b>plain</b></root>")
+    processor = XMLProcessor(CSVProcessor('en', 'da'))
+    text_elements = []
+    processor._collect_text_elements(root, text_elements, set())
+    
+    by_original = {text_data['original']: text_data for text_data in text_elements}
+    assert set(by_original) == {'Hello', 'tail text', 'plain'}
+    for original, text_data in by_original.items():
+        processor._apply_translation_to_element(text_data, original.upper())
+    
+    a, b = root
+    assert a.text == "\tHELLO"
+    assert a.tail == "  TAIL TEXT\n"
+    assert b.text == "PLAIN"
+    print("✅ Leading and trailing whitespace preserved")
+
+
+def test_indent_deep_tree():
+    """Test that indenting skips protected tags and handles nesting beyond the recursion limit."""
+    import xml.etree.ElementTree as ET
+    from translator3000.processors.xml_processor import indent_structure
+    
+    root = ET.fromstring("<root><a><b>t</b></a><content><p>x</p></content></root>")
+    indent_structure(root, skip_tags={'content'})
+    assert ET.tostring(root, encoding='unicode') == (
+        "<root>\n    <a>\n        <b>t</b>\n    </a>\n    <content><p>x</p></content>\n</root>"
+    )
+    
+    deep = element = ET.Element('root')
+    for _ in range(sys.getrecursionlimit() + 100):
+        element = ET.SubElement(element, 'node')
+    indent_structure(deep)
+    assert element.tail.startswith('\n')
+    print("✅ Deep trees are indented without recursion")
+
 
 if __name__ == "__main__":
-    success = test_space_preservation()
+    test_surrounding_whitespace_kept()
+    test_indent_deep_tree()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        success = test_space_preservation(XMLProcessor(CSVProcessor('en', 'da')), Path(temp_dir))
     if success:
         print("\n✅ Space preservation test passed!")
     else:
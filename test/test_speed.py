@@ -5,12 +5,13 @@ Test the new retry mechanism and faster translation speeds.
 
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add project directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from translator3000 import CSVTranslator
+from translator3000 import get_translator
 
 def test_translation_speed():
     """Test the new faster translation with retry mechanism."""
@@ -18,7 +19,7 @@ def test_translation_speed():
     print("=== Testing Translation Speed & Retry Mechanism ===\n")
     
     # Create translator with new faster default delay (0.05s instead of 0.1s)
-    translator = CSVTranslator(source_lang='en', target_lang='da')
+    translator = get_translator('en', 'da')
     
     # Test texts
     test_texts = [
@@ -40,18 +41,12 @@ def test_translation_speed():
     
     total_start = time.time()
     
-    for i, text in enumerate(test_texts, 1):
-        start_time = time.time()
-        
-        # This will use the new _translate_with_retry method automatically
-        translated = translator.translate_text(text)
-        
-        end_time = time.time()
-        duration = end_time - start_time
-        
+    # One batched request for all texts; the request delay is applied once
+    translations = translator.translate_batch(test_texts)
+    
+    for i, (text, translated) in enumerate(zip(test_texts, translations), 1):
         print(f"{i}. Original:  '{text}'")
         print(f"   Translated: '{translated}'")
-        print(f"   Time: {duration:.3f}s")
         print()
     
     total_time = time.time() - total_start
@@ -63,6 +58,15 @@ def test_translation_speed():
     print(f"  Estimated improvement: ~50% faster base delay")
     print(f"  Retry protection: Automatic recovery from API failures")
     
+    # Per-text requests are independent, so threads overlap their network latency
+    concurrent_start = time.time()
+    with ThreadPoolExecutor(max_workers=min(8, len(test_texts))) as executor:
+        concurrent_translations = list(executor.map(translator.translate_text, test_texts))
+    concurrent_time = time.time() - concurrent_start
+    
+    assert len(concurrent_translations) == len(test_texts)
+    print(f"  Concurrent per-text requests: {concurrent_time:.3f}s total")
+    
     print("\nRetry mechanism features:")
     print("  - Exponential backoff: 50ms -> 150ms -> 350ms")
     print("  - 50ms extra delay per retry attempt")
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the persistent translation cache.
+"""
+
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from translator3000.services.translation_cache import TranslationCache, MemoCache
+from translator3000.processors.csv_processor import CSVProcessor
+from translator3000.translator import CSVTranslator
+
+
+class CountingTranslator:
+    """Fake translation service that records how often it is called."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def translate(self, text):
+        self.calls += 1
+        return f"[da] {text}"
+
+
+class FlakyTranslator(CountingTranslator):
+    """Fake translation service that returns nothing while it is down."""
+
+    def __init__(self):
+        super().__init__()
+        self.down = True
+
+    def translate(self, text):
+        return None if self.down else super().translate(text)
+
+
+def test_cache_persists_translations():
+    """Test that cached translations survive closing and reopening the cache."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache_file = Path(temp_dir) / "cache.sqlite"
+
+        cache = TranslationCache(cache_file)
+        assert cache.get('en', 'da', 'Hello world') is None
+
+        cache.put('en', 'da', 'Hello world', 'Hej verden')
+        assert cache.get('en', 'da', 'Hello world') == 'Hej verden'
+        assert cache.get('en', 'sv', 'Hello world') is None
+        cache.close()
+
+        reopened = TranslationCache(cache_file)
+        assert reopened.get('en', 'da', 'Hello world') == 'Hej verden'
+        reopened.close()
+
+    print("✅ Translations persist across cache instances")
+
+
+def test_cache_batch_lookup():
+    """Test that get_many returns buffered and committed hits and leaves out misses."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = TranslationCache(Path(temp_dir) / "cache.sqlite")
+        cache.LOOKUP_CHUNK = 2
+        cache.put('en', 'da', 'Green tea', 'Grøn te')
+        cache.put('en', 'da', 'Black tea', 'Sort te')
+        cache.flush()
+        cache.put('en', 'da', 'White tea', 'Hvid te')  # Still buffered
+
+        found = cache.get_many('en', 'da', ['Green tea', 'Black tea', 'White tea', 'Red tea'])
+        assert found == {'Green tea': 'Grøn te', 'Black tea': 'Sort te', 'White tea': 'Hvid te'}
+        assert cache.get_many('en', 'sv', ['Green tea']) == {}
+        cache.close()
+
+    print("✅ Batch lookup finds buffered and committed translations")
+
+
+def test_cache_uses_write_ahead_log():
+    """Test that the cache database is opened in WAL mode with relaxed syncing."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = TranslationCache(Path(temp_dir) / "cache.sqlite")
+        assert cache._connection.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+        assert cache._connection.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        cache.close()
+
+    print("✅ Cache database uses write-ahead logging")
+
+
+def test_processor_uses_cache():
+    """Test that the CSV processor only calls the service on cache misses."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        processor = CSVProcessor('en', 'da')
+        fake = CountingTranslator()
+        processor.translators = [('deep_translator', fake)]
+        processor.translation_cache = TranslationCache(Path(temp_dir) / "cache.sqlite")
+
+        assert processor._translate_plain_text("Organic green tea") == "[da] Organic green tea"
+        assert processor._translate_plain_text("Organic green tea") == "[da] Organic green tea"
+        assert fake.calls == 1
+
+        processor.translation_cache.close()
+
+    print("✅ Processor serves repeated text from the cache")
+
+
+def test_processor_close_releases_cache():
+    """Test that closing or dropping a processor flushes its cache and releases the connection."""
+    import gc
+    import weakref
+    from translator3000.services import translation_cache
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache_file = Path(temp_dir) / "cache.sqlite"
+
+        with CSVProcessor('en', 'da') as processor:
+            cache = processor.translation_cache = TranslationCache(cache_file)
+            cache.put('en', 'da', 'Green tea', 'Grøn te')
+            assert cache in translation_cache._open_caches
+        assert processor.translation_cache is None
+        assert cache not in translation_cache._open_caches
+
+        # An unreferenced cache is not kept alive until exit, and still writes its buffer
+        dropped = TranslationCache(cache_file)
+        dropped.put('en', 'da', 'Black tea', 'Sort te')
+        dropped_ref = weakref.ref(dropped)
+        del dropped
+        gc.collect()
+        assert dropped_ref() is None
+
+        reopened = TranslationCache(cache_file)
+        assert reopened.get_many('en', 'da', ['Green tea', 'Black tea']) == {'Green tea': 'Grøn te', 'Black tea': 'Sort te'}
+        reopened.close()
+
+    print("✅ Processor caches are released on close and when dropped")
+
+
+def test_processor_memo_before_persistent_cache():
+    """Test that the in-memory memo answers repeats before the persistent cache and the services."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        processor = CSVProcessor('en', 'da')
+        fake = CountingTranslator()
+        processor.translators = [('deep_translator', fake)]
+        cache = TranslationCache(Path(temp_dir) / "cache.sqlite")
+        cache.put('en', 'da', 'Green tea', 'Grøn te')
+        processor.translation_cache = cache
+
+        # A persistent cache hit is copied into the memo
+        assert processor._translate_plain_text("Green tea") == "Grøn te"
+        assert processor._cache[('en', 'da', 'Green tea')] == "Grøn te"
+
+        # Batches only send texts missing from both caches
+        cache.close()
+        processor.translation_cache = None
+        assert processor._translate_plain_batch(["Green tea", "Black tea"]) == ["Grøn te", "[da] Black tea"]
+        assert processor._translate_plain_text("Black tea") == "[da] Black tea"
+        assert fake.calls == 1
+
+    print("✅ Processor memo serves repeats without cache or service lookups")
+
+
+def test_memo_drops_oldest_entries():
+    """Test that the memo stays bounded and falls back to the persistent cache for evicted text."""
+    memo = MemoCache(max_size=2)
+    memo['a'] = 1
+    memo['b'] = 2
+    memo['a'] = 3  # Updating an entry does not evict
+    memo['c'] = 4
+    assert list(memo) == ['b', 'c']
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        processor = CSVProcessor('en', 'da')
+        fake = CountingTranslator()
+        processor.translators = [('deep_translator', fake)]
+        processor.translation_cache = TranslationCache(Path(temp_dir) / "cache.sqlite")
+        processor._cache = MemoCache(max_size=1)
+
+        processor._translate_plain_text("Green tea")
+        processor._translate_plain_text("Black tea")
+        assert len(processor._cache) == 1
+        assert processor._translate_plain_text("Green tea") == "[da] Green tea"
+        assert fake.calls == 2
+
+        processor.translation_cache.close()
+
+    print("✅ Memo stays bounded and evicted text comes from the cache file")
+
+
+def test_translator_retries_after_outage():
+    """Test that CSVTranslator does not keep serving the fallback it returned while the services were down."""
+    translator = CSVTranslator('en', 'da')
+    processor = translator.csv_processor
+    processor.translation_cache = None
+    service = FlakyTranslator()
+    processor.translators = [("Fake", service)]
+
+    assert translator.translate_text(" Hello world ") == "Hello world"
+    service.down = False
+    assert translator.translate_text(" Hello world ") == "[da] Hello world"
+    assert translator.translate_text(" Hello world ") == "[da] Hello world"
+    assert service.calls == 1
+
+    print("✅ Translator retries text that failed while the services were down")
+
+
+if __name__ == "__main__":
+    test_cache_persists_translations()
+    test_cache_batch_lookup()
+    test_cache_uses_write_ahead_log()
+    test_processor_uses_cache()
+    test_processor_close_releases_cache()
+    test_processor_memo_before_persistent_cache()
+    test_memo_drops_oldest_entries()
+    test_translator_retries_after_outage()
@@ -19,8 +19,9 @@ logging.basicConfig(level=logging.INFO,
                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def test_xml_cdata_fix():
+def test_xml_cdata_fix(xml_pipeline):
     """Test the fix for XML CDATA handling for Banner/Title content."""
+    csv_processor, xml_processor = xml_pipeline
     
     # Test file paths - using source directly since TEST_SOURCE_DIR may be customized
     source_dir = Path(__file__).parent.parent / "source"
@@ -32,10 +33,6 @@ def test_xml_cdata_fix():
         logger.error(f"Test source file not found: {source_file}")
         return False
     
-    # Initialize processors
-    csv_processor = CSVProcessor("en", "no", delay_between_requests=0.01)
-    xml_processor = XMLProcessor(csv_processor)
-    
     # Translate the XML file
     logger.info(f"Testing XML CDATA Banner/Title fix with source: {source_file}")
     success, chars = xml_processor.translate_xml(
@@ -53,4 +50,5 @@ def test_xml_cdata_fix():
         return False
 
 if __name__ == "__main__":
-    test_xml_cdata_fix()
+    csv_processor = CSVProcessor("en", "no", delay_between_requests=0.01)
+    test_xml_cdata_fix((csv_processor, XMLProcessor(csv_processor)))
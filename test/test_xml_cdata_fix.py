@@ -32,8 +32,10 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def test_xml_cdata_translation():
+def test_xml_cdata_translation(xml_pipeline):
     """Test XML translation with CDATA sections."""
+    csv_processor, xml_processor = xml_pipeline
+    
     # Test translating a file with CDATA sections
     source_lang = 'en'
     target_lang = 'no'  # Norwegian
@@ -42,15 +44,6 @@ def test_xml_cdata_translation():
     input_file = Path(__file__).parent.parent / "source" / "test_html_xml.xml"
     output_file = TARGET_DIR / "test_cdata_fix.xml"
     
-    # Create processors
-    csv_processor = CSVProcessor(
-        source_lang=source_lang,
-        target_lang=target_lang,
-        delay_between_requests=0.01  # Fast for testing
-    )
-    
-    xml_processor = XMLProcessor(csv_processor)
-    
     # Translate the file
     logger.info(f"Testing XML CDATA translation from {source_lang} to {target_lang}")
     logger.info(f"Input file: {input_file}")
@@ -75,6 +68,7 @@ def test_xml_cdata_translation():
 
 if __name__ == "__main__":
     try:
-        test_xml_cdata_translation()
+        csv_processor = CSVProcessor("en", "no", delay_between_requests=0.01)
+        test_xml_cdata_translation((csv_processor, XMLProcessor(csv_processor)))
     except Exception as e:
         logger.exception(f"Error during test: {e}")
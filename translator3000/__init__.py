@@ -17,7 +17,7 @@ Usage:
 """
 
 # Import from the new modular implementation
-from .translator import CSVTranslator
+from .translator import CSVTranslator, get_translator
 from .config import load_config, CONFIG
 
 # Import compatibility constants and functions
@@ -31,7 +31,7 @@ __version__ = "3.0.0"
 __author__ = "Translator3000 Team"
 
 __all__ = [
-    'CSVTranslator', 'CONFIG', 'load_config',
+    'CSVTranslator', 'get_translator', 'CONFIG', 'load_config',
     'get_optimized_translation_services', 'get_translation_services',
     'TRANSLATION_SERVICES', 'AVAILABLE_TRANSLATORS'
 ]
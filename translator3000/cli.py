@@ -5,14 +5,19 @@ Command Line Interface for Translator3000
 Interactive CLI for the Translator3000 translation package.
 """
 
+import codecs
+import concurrent.futures
+import re
+import statistics
 import sys
 import time
 import xml.etree.ElementTree as ET
+from collections import defaultdict
 from pathlib import Path
 from typing import Dict, List, Optional
 
 from .translator import CSVTranslator
-from .config import load_config, SOURCE_DIR, TARGET_DIR
+from .config import load_config, get_config, SOURCE_DIR, TARGET_DIR
 from .utils.logging_utils import setup_logging, get_logger
 from .utils.language_utils import get_language_suffix
 
@@ -20,9 +25,34 @@ from .utils.language_utils import get_language_suffix
 logger = get_logger(__name__)
 
 # Import modular components
-from .utils.file_utils import discover_files_and_folders, print_discovered_files
+from .utils.file_utils import FileEntry, discover_files_and_folders, print_discovered_files, prefetch_file
 from .utils.language_utils import get_language_name, SUPPORTED_LANGUAGES
 
+# Bytes read to detect the delimiter of a CSV file, and the delimiters considered
+CSV_SNIFF_BYTES = 65536
+CSV_DELIMITER_CANDIDATES = (',', ';', '\t', '|')
+
+# Options shared by every CSV preview read, so all of them use the C parser
+CSV_PREVIEW_READ_KWARGS = {'engine': 'c', 'low_memory': False, 'cache_dates': True}
+
+# Batch results are written to the console every this many files, or at least this often
+BATCH_REPORT_FILES = 20
+BATCH_REPORT_SECONDS = 1.0
+
+# Auto-detected text columns are judged on this many preview rows: at least half of their
+# non-empty values must be longer than TEXT_COLUMN_MIN_LENGTH and contain a letter
+TEXT_COLUMN_SAMPLE_ROWS = 50
+TEXT_COLUMN_MIN_LENGTH = 10
+TEXT_COLUMN_MIN_SHARE = 0.5
+LETTER_PATTERN = re.compile(r'[^\W\d_]')
+
+# Try to import charset-normalizer for detecting the encoding of non-UTF-8 CSV files
+try:
+    from charset_normalizer import from_bytes
+    CHARSET_DETECTION_AVAILABLE = True
+except ImportError:
+    CHARSET_DETECTION_AVAILABLE = False
+
 
 def main():
     """Main interactive workflow for the translation script."""
@@ -110,39 +140,107 @@ def process_batch_mode(translator: CSVTranslator, user_input: Dict) -> tuple[boo
     folder_choice = user_input['folder_choice']
     target_lang = user_input['target_lang']
     
-    # Determine which files to process
-    files_to_process = []
+    # Group the files to process by location
+    groups = defaultdict(list)  # location -> [FileEntry]
     
-    if folder_choice['type'] == 'root':
-        files_to_process = [(f, 'root') for f in discovered['root_files']]
-    elif folder_choice['type'] == 'folder':
+    if folder_choice['type'] in ('root', 'all'):
+        groups['root'].extend(discovered['root_files'])
+    if folder_choice['type'] == 'folder':
         folder_name = folder_choice['folder_name']
-        files_to_process = [(f, folder_name) for f in discovered['folders'][folder_name]]
+        groups[folder_name].extend(discovered['folders'][folder_name])
     elif folder_choice['type'] == 'all':
-        # Add root files
-        files_to_process.extend([(f, 'root') for f in discovered['root_files']])
-        # Add folder files
         for folder_name, files in discovered['folders'].items():
-            files_to_process.extend([(f, folder_name) for f in files])
+            groups[folder_name].extend(files)
     
     success_count = 0
-    total_files = len(files_to_process)
+    total_files = sum(len(entries) for entries in groups.values())
     total_chars = 0
     
-    print(f"\n📊 Processing {total_files} files...")
+    # Files wait on the network, not the CPU, so several are translated at once. They share
+    # one translator, whose request limits keep the combined load within the provider's limits.
+    max_workers = max(1, min(get_config()['batch_file_workers'], total_files))
+    print(f"\n📊 Processing {total_files} files ({max_workers} at a time)...")
     
-    for idx, (file_path, location) in enumerate(files_to_process, 1):
-        print(f"\n[{idx}/{total_files}] Processing: {file_path.name}")
+    jobs = []  # (entry, location, output_dir) in the order the workers pick them up
+    for location, entries in groups.items():
+        if not entries:
+            continue
         
-        # Generate output directory and filename
+        # Each target folder is created once, before its files are handed to the workers
         if location == 'root':
             output_dir = TARGET_DIR
-            output_filename = generate_output_filename(file_path.name, target_lang, is_root_file=True)
         else:
             output_dir = generate_output_directory(TARGET_DIR, location, target_lang, is_batch_folder=True)
-            output_filename = generate_output_filename(file_path.name, target_lang, is_root_file=False)
-        
+            print(f"[FOLDER] Target folder: {output_dir}")
         output_dir.mkdir(parents=True, exist_ok=True)
+        jobs.extend((entry, location, output_dir) for entry in entries)
+    
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Progress lines use the relative path computed once at discovery
+        futures = {}
+        for i, (entry, location, output_dir) in enumerate(jobs):
+            # The file max_workers places further on is picked up when this one finishes
+            prefetch_path = jobs[i + max_workers][0].path if i + max_workers < len(jobs) else None
+            future = executor.submit(process_batch_file, translator, entry.path, location, target_lang,
+                                     output_dir, prefetch_path)
+            futures[future] = entry
+        
+        # Result lines are buffered and written together, so files finishing in quick
+        # succession cost one console write instead of several flushes each
+        report = []
+        last_report = time.monotonic()
+        for done, future in enumerate(concurrent.futures.as_completed(futures), 1):
+            rel = futures[future].rel
+            _, output_filename, success, file_chars = future.result()
+            report.append(f"\n[{done}/{total_files}] Finished: {rel}")
+            
+            # Add to total characters and display result
+            if file_chars > 0:
+                total_chars += file_chars
+                report.append(f"  📏 Characters translated: {file_chars:,}")
+            
+            if success:
+                success_count += 1
+                report.append(f"✅ {rel} -> {output_filename}")
+            else:
+                report.append(f"❌ Failed to process {rel}")
+            
+            if (done % BATCH_REPORT_FILES == 0 or done == total_files
+                    or time.monotonic() - last_report >= BATCH_REPORT_SECONDS):
+                sys.stdout.write('\n'.join(report) + '\n')
+                sys.stdout.flush()
+                report.clear()
+                last_report = time.monotonic()
+    
+    print(f"\n📊 Batch processing complete: {success_count}/{total_files} files processed successfully")
+    return success_count > 0, total_chars
+
+
+def process_batch_file(translator: CSVTranslator, file_path: Path, location: str, target_lang: str,
+                       output_dir: Path, prefetch_path: Optional[Path] = None) -> tuple[Path, str, bool, int]:
+    """
+    Translate one file of a batch run into its target folder.
+    
+    Safe to run from several threads at once: failures are logged and reported
+    in the result instead of being raised.
+    
+    Args:
+        translator: Translator shared by the batch
+        file_path: File to translate
+        location: 'root' or the name of the source folder holding the file
+        target_lang: Target language code
+        output_dir: Existing target folder for the file
+        prefetch_path: File this worker is likely to translate next, read ahead by the kernel
+    
+    Returns:
+        Tuple of (file_path, output_filename, success, characters_translated)
+    """
+    if prefetch_path is not None:
+        prefetch_file(prefetch_path)
+    
+    output_filename = generate_output_filename(file_path.name, target_lang, is_root_file=location == 'root')
+    
+    try:
         output_file = output_dir / output_filename
         
         # Process file based on type and get character counts from translation services
@@ -150,39 +248,17 @@ def process_batch_mode(translator: CSVTranslator, user_input: Dict) -> tuple[boo
         file_chars = 0
         
         if file_path.suffix.lower() == '.csv':
-            # Auto-detect delimiter first
-            delimiter = detect_csv_delimiter(str(file_path))
-            
-            # Auto-detect text columns
-            import pandas as pd
-            df = pd.read_csv(file_path, nrows=5, delimiter=delimiter)
-            text_columns = []
-            for col in df.columns:
-                if df[col].dtype == 'object':  # Text columns
-                    sample_text = df[col].dropna().astype(str).iloc[0] if not df[col].dropna().empty else ""
-                    if len(sample_text) > 10:  # Likely to be translatable text
-                        text_columns.append(col)
-            
-            print(f"  🔤 Auto-detected text columns: {text_columns}")
-            
+            # Delimiter and text columns are detected once, inside process_csv_file_batch
             success, file_chars = process_csv_file_batch(translator, file_path, output_file)
             
         elif file_path.suffix.lower() == '.xml':
             success, file_chars = translator.translate_xml(str(file_path), str(output_file))
         
-        # Add to total characters and display result
-        if file_chars > 0:
-            total_chars += file_chars
-            print(f"  📏 Characters translated: {file_chars:,}")
-        
-        if success:
-            success_count += 1
-            print(f"✅ {file_path.name} -> {output_filename}")
-        else:
-            print(f"❌ Failed to process {file_path.name}")
+        return file_path, output_filename, success, file_chars
     
-    print(f"\n📊 Batch processing complete: {success_count}/{total_files} files processed successfully")
-    return success_count > 0, total_chars
+    except Exception as e:
+        logger.error(f"Error processing {file_path}: {e}")
+        return file_path, output_filename, False, 0
 
 
 def process_csv_file_batch(translator: CSVTranslator, input_file: Path, output_file: Path) -> tuple[bool, int]:
@@ -190,27 +266,22 @@ def process_csv_file_batch(translator: CSVTranslator, input_file: Path, output_f
     try:
         import pandas as pd
         
-        # Auto-detect delimiter
+        # Auto-detect encoding and delimiter
+        encoding = detect_csv_encoding(str(input_file))
         delimiter = detect_csv_delimiter(str(input_file))
-        print(f"  📄 Detected delimiter: '{delimiter}'")
+        print(f"  📄 {input_file.name}: detected delimiter: '{delimiter}' ({encoding})")
         
-        # Read CSV to analyze columns
-        df = pd.read_csv(input_file, nrows=5, delimiter=delimiter)
+        # Read a sample of rows to analyze columns
+        df = pd.read_csv(input_file, nrows=TEXT_COLUMN_SAMPLE_ROWS, delimiter=delimiter, encoding=encoding, **CSV_PREVIEW_READ_KWARGS)
         
         # Auto-detect text columns (columns likely to contain translatable text)
-        text_columns = []
-        for col in df.columns:
-            if df[col].dtype == 'object':  # Text columns
-                # Check if column contains substantial text (not just codes/IDs)
-                sample_text = df[col].dropna().astype(str).iloc[0] if not df[col].dropna().empty else ""
-                if len(sample_text) > 10:  # Likely to be translatable text
-                    text_columns.append(col)
+        text_columns = detect_text_columns(df)
         
         if not text_columns:
             print(f"  ⚠️  No suitable text columns found for translation")
             return False, 0
         
-        print(f"  🔤 Auto-detected text columns: {text_columns}")
+        print(f"  🔤 {input_file.name}: auto-detected text columns: {text_columns}")
         
         # Generate column suffix based on target language
         suffix = get_language_suffix(translator.target_lang)
@@ -221,7 +292,8 @@ def process_csv_file_batch(translator: CSVTranslator, input_file: Path, output_f
             output_file=str(output_file),
             columns_to_translate=text_columns,
             append_suffix=suffix,
-            delimiter=delimiter
+            delimiter=delimiter,
+            encoding=encoding
         )
         
         return success, chars_translated
@@ -231,6 +303,36 @@ def process_csv_file_batch(translator: CSVTranslator, input_file: Path, output_f
         return False, 0
 
 
+def detect_text_columns(df) -> List[str]:
+    """
+    Pick the columns of a preview DataFrame that hold translatable text.
+    
+    Args:
+        df: First rows of the CSV file (up to TEXT_COLUMN_SAMPLE_ROWS are used)
+        
+    Returns:
+        Names of the text columns, in file order
+    """
+    text_df = df.select_dtypes(include=['object', 'string']).head(TEXT_COLUMN_SAMPLE_ROWS)
+    return [column for column in text_df.columns if _is_text_column(text_df[column])]
+
+
+def _is_text_column(series) -> bool:
+    """
+    Check whether a column sample holds text rather than codes, IDs or numbers.
+    
+    At least TEXT_COLUMN_MIN_SHARE of the non-empty values must be longer than
+    TEXT_COLUMN_MIN_LENGTH and contain a letter. Values are checked with
+    vectorized string operations, so a larger sample costs next to nothing.
+    """
+    values = series.dropna().astype(str)
+    values = values[values.str.strip() != '']
+    if values.empty:
+        return False
+    is_text = (values.str.len() > TEXT_COLUMN_MIN_LENGTH) & values.str.contains(LETTER_PATTERN)
+    return is_text.mean() >= TEXT_COLUMN_MIN_SHARE
+
+
 def process_single_file_mode(translator: CSVTranslator, user_input: Dict) -> tuple[bool, int]:
     """Process a single file based on user selection."""
     selected_file = user_input['selected_file']
@@ -253,7 +355,8 @@ def process_single_file_mode(translator: CSVTranslator, user_input: Dict) -> tup
             output_file=str(output_file),
             columns_to_translate=columns_to_translate,
             append_suffix=suffix,
-            delimiter=delimiter
+            delimiter=delimiter,
+            encoding=user_input['encoding']
         )
     elif selected_file.suffix.lower() == '.xml':
         print("🏷️  Processing XML file...")
@@ -270,42 +373,90 @@ def process_single_file_mode(translator: CSVTranslator, user_input: Dict) -> tup
 
 def detect_csv_delimiter(file_path: str) -> str:
     """
-    Auto-detect CSV delimiter by analyzing the first few lines.
+    Auto-detect CSV delimiter from the first CSV_SNIFF_BYTES of the file.
+    
+    The delimiter of a well-formed CSV occurs equally often on every line, so the
+    candidate whose per-line count varies least wins; ties go to the candidate
+    found more often per line.
     
     Args:
         file_path: Path to the CSV file
         
     Returns:
-        Detected delimiter (comma or semicolon)
+        Detected delimiter (comma, semicolon, tab or pipe)
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            # Read first few lines to analyze
-            sample_lines = []
-            for i, line in enumerate(f):
-                if i >= 3:  # Analyze first 3 lines
-                    break
-                sample_lines.append(line.strip())
+        with open(file_path, 'rb') as f:
+            sample = f.read(CSV_SNIFF_BYTES)
         
-        if not sample_lines:
-            return ","  # Default to comma
+        lines = sample.split(b'\n')
+        if len(sample) == CSV_SNIFF_BYTES and len(lines) > 1:
+            lines = lines[:-1]  # The last line may be cut off mid-row
+        lines = [line for line in lines if line.strip()]
         
-        # Count commas and semicolons in the sample
-        comma_count = sum(line.count(',') for line in sample_lines)
-        semicolon_count = sum(line.count(';') for line in sample_lines)
+        if not lines:
+            return ","  # Default to comma
         
-        # Return the more frequent delimiter
-        if semicolon_count > comma_count:
-            logger.debug(f"Auto-detected semicolon delimiter (commas: {comma_count}, semicolons: {semicolon_count})")
-            return ";"
-        else:
-            logger.debug(f"Auto-detected comma delimiter (commas: {comma_count}, semicolons: {semicolon_count})")
-            return ","
+        best_delimiter = ","
+        best_score = None
+        for delimiter in CSV_DELIMITER_CANDIDATES:
+            counts = [line.count(delimiter.encode()) for line in lines]
+            mean = sum(counts) / len(counts)
+            if mean == 0:
+                continue
+            score = (statistics.pstdev(counts), -mean)
+            if best_score is None or score < best_score:
+                best_delimiter, best_score = delimiter, score
+        
+        logger.debug(f"Auto-detected delimiter {best_delimiter!r} from {len(lines)} lines")
+        return best_delimiter
             
     except Exception as e:
         logger.warning(f"Error detecting CSV delimiter: {e}. Using comma as default.")
         return ","
 
+def detect_csv_encoding(file_path: str) -> str:
+    """
+    Detect the text encoding of a CSV file from its first CSV_SNIFF_BYTES.
+    
+    UTF-8 (with or without BOM) is recognised directly; anything else is
+    identified by charset-normalizer when it is installed, falling back to
+    cp1252, the usual encoding of European spreadsheet exports.
+    
+    Args:
+        file_path: Path to the CSV file
+        
+    Returns:
+        Python codec name to read the file with
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            sample = f.read(CSV_SNIFF_BYTES)
+    except OSError as e:
+        logger.warning(f"Error detecting CSV encoding: {e}. Using UTF-8 as default.")
+        return 'utf-8'
+    
+    if sample.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    try:
+        # The incremental decoder accepts a character cut off at the end of the sample
+        codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        pass
+    
+    encoding = 'cp1252'
+    if CHARSET_DETECTION_AVAILABLE:
+        matches = from_bytes(sample)
+        best = matches.best()
+        # Short Western European samples decode equally well as cp1250/cp1252/...;
+        # among equally clean matches, keep cp1252 rather than an arbitrary code page
+        if best is not None and not any('cp1252' in match.could_be_from_charset
+                                        for match in matches if match.chaos == best.chaos):
+            encoding = best.encoding
+    logger.info(f"Detected non-UTF-8 CSV encoding: {encoding}")
+    return encoding
+
 # CLI helper functions using modular components
 
 def get_language_preferences() -> Dict[str, str]:
@@ -428,8 +579,8 @@ def get_batch_processing_input() -> Dict[str, any]:
             print(f"Processing all {files_to_process} files from all locations.")
         
         # For batch mode, we need to handle CSV column selection differently
-        if any(f.suffix.lower() == '.csv' for f in discovered['root_files']) or \
-           any(any(f.suffix.lower() == '.csv' for f in files) for files in discovered['folders'].values()):
+        if any(entry.kind == 'CSV' for entry in discovered['root_files']) or \
+           any(any(entry.kind == 'CSV' for entry in files) for files in discovered['folders'].values()):
             print("\n[CSV] CSV Column Selection:")
             print("Since multiple CSV files may have different structures,")
             print("you'll be prompted for column selection for each CSV file during processing.")
@@ -448,7 +599,7 @@ def get_batch_processing_input() -> Dict[str, any]:
         return get_single_file_input(discovered, lang_prefs)
 
 
-def get_batch_folder_selection(discovered: Dict[str, List[Path]]) -> Dict[str, any]:
+def get_batch_folder_selection(discovered: Dict[str, List[FileEntry]]) -> Dict[str, any]:
     """Get user selection for which folders to process in batch mode."""
     print("\nBatch folder selection:")
     
@@ -498,7 +649,7 @@ def get_batch_folder_selection(discovered: Dict[str, List[Path]]) -> Dict[str, a
             print("Invalid input! Please enter a number.")
 
 
-def get_single_file_input(discovered: Dict[str, List[Path]], lang_prefs: Dict) -> Dict[str, any]:
+def get_single_file_input(discovered: Dict[str, List[FileEntry]], lang_prefs: Dict) -> Dict[str, any]:
     """Get input for single file processing mode."""
     import pandas as pd
     
@@ -507,14 +658,14 @@ def get_single_file_input(discovered: Dict[str, List[Path]], lang_prefs: Dict) -
     file_locations = []  # Track where each file is located
     
     # Add root files
-    for file_path in discovered['root_files']:
-        all_files.append(file_path)
+    for entry in discovered['root_files']:
+        all_files.append(entry)
         file_locations.append('root')
     
     # Add folder files
     for folder_name, files in discovered['folders'].items():
-        for file_path in files:
-            all_files.append(file_path)
+        for entry in files:
+            all_files.append(entry)
             file_locations.append(folder_name)
     
     if not all_files:
@@ -522,25 +673,23 @@ def get_single_file_input(discovered: Dict[str, List[Path]], lang_prefs: Dict) -
         return {}
     
     print("Select a file to translate:")
-    for i, (file_path, location) in enumerate(zip(all_files, file_locations), 1):
-        file_type = "CSV" if file_path.suffix.lower() == ".csv" else "XML"
+    for i, (entry, location) in enumerate(zip(all_files, file_locations), 1):
         if location == 'root':
-            print(f"  {i}. {file_path.name} ({file_type}) [root]")
+            print(f"  {i}. {entry.rel} ({entry.kind}) [root]")
         else:
-            relative_path = file_path.relative_to(SOURCE_DIR)
-            print(f"  {i}. {relative_path} ({file_type}) [in {location}/]")
+            print(f"  {i}. {entry.rel} ({entry.kind}) [in {location}/]")
     print()
     
     # Get file selection
     if len(all_files) == 1:
-        selected_file = all_files[0]
+        selected_file = all_files[0].path
         selected_location = file_locations[0]
         print(f"Auto-selected: {selected_file.name}")
     else:
         try:
             choice = int(input("Select a file (enter number): ").strip())
             if 1 <= choice <= len(all_files):
-                selected_file = all_files[choice - 1]
+                selected_file = all_files[choice - 1].path
                 selected_location = file_locations[choice - 1]
             else:
                 print("Invalid selection!")
@@ -575,20 +724,22 @@ def get_csv_input_single(selected_file: Path, input_file: str, output_dir: Path,
     """Get CSV-specific input parameters for single file mode."""
     import pandas as pd
     
-    # Auto-detect CSV delimiter (same logic as batch mode)
+    # Auto-detect CSV encoding and delimiter
     print("\nAuto-detecting CSV delimiter...")
+    encoding = detect_csv_encoding(input_file)
     delimiters = [',', ';']
     df_preview = None
     chosen_delimiter = ','
     
     for delimiter in delimiters:
         try:
-            df_test = pd.read_csv(input_file, nrows=5, delimiter=delimiter)
+            df_test = pd.read_csv(input_file, nrows=5, delimiter=delimiter, encoding=encoding, **CSV_PREVIEW_READ_KWARGS)
             if len(df_test.columns) > 1:  # Good indication of correct delimiter
-                df_preview = pd.read_csv(input_file, nrows=0, delimiter=delimiter)
+                df_preview = df_test.iloc[:0]
                 chosen_delimiter = delimiter
                 break
-        except:
+        except (UnicodeDecodeError, LookupError, ValueError):
+            # ValueError covers pandas' ParserError and EmptyDataError; LookupError an unknown codec
             continue
     
     if df_preview is None:
@@ -605,7 +756,8 @@ def get_csv_input_single(selected_file: Path, input_file: str, output_dir: Path,
             chosen_delimiter = ","
         
         try:
-            df_preview = pd.read_csv(input_file, nrows=0, delimiter=chosen_delimiter)
+            df_preview = pd.read_csv(input_file, nrows=0, delimiter=chosen_delimiter, encoding=encoding,
+                                     **CSV_PREVIEW_READ_KWARGS)
         except Exception as e:
             print(f"Error reading CSV file with {chosen_delimiter} delimiter: {e}")
             return {}
@@ -672,6 +824,7 @@ def get_csv_input_single(selected_file: Path, input_file: str, output_dir: Path,
         'output_file': output_file,
         'columns_to_translate': columns_to_translate,
         'delimiter': chosen_delimiter,
+        'encoding': encoding,
         'append_suffix': suffix,
         'source_lang': lang_prefs['source_lang'],
         'target_lang': lang_prefs['target_lang'],
@@ -21,12 +21,22 @@ PROJECT_ROOT = Path(__file__).parent.parent
 # Performance optimized settings - see PERFORMANCE.md for detailed analysis
 DEFAULT_CONFIG = {
     'delay': 5,  # milliseconds between requests (optimal: 4.6 trans/sec vs 3.7 at 50ms)
+    'requests_per_second': 0,  # Cap on requests across all workers (0 = derive from delay)
     'max_retries': 3,
     'retry_base_delay': 20,
     'csv_max_workers': 6,
     'xml_max_workers': 6,
     'multithreading_threshold': 2,
+    'batch_file_workers': 8,  # Files translated at the same time in batch mode
+    'max_concurrent_requests': 8,  # Translation requests in flight at once across all threads
     'progress_interval': 10,
+    'batch_translation': True,  # Send CSV column texts to the services in batches
+    'batch_max_chars': 5000,  # Character budget per batch request
+    'batch_max_items': 100,  # Maximum texts per batch request
+    'packed_requests': True,  # Join batch texts into one request for services without a batch endpoint
+    'csv_chunk_size': 50000,  # Rows read, translated and written per CSV chunk
+    'csv_use_pyarrow': True,  # Parse large CSV files with pyarrow when it is installed
+    'csv_pyarrow_min_bytes': 5 * 1024 * 1024,  # Smaller files are parsed by pandas
     'source_directory': '',  # Empty string means use default "source" folder
     'source_directory_test': '',  # Empty string means use default source directory
     'target_directory': '',  # Empty string means use default "target" folder
@@ -36,7 +46,10 @@ DEFAULT_CONFIG = {
     'libretranslate_selfhost_timeout': 2,
     'libretranslate_selfhost_url': 'http://localhost:5000/translate',
     'libretranslate_url': 'https://libretranslate.com/translate',
-    'libretranslate_api_key': ''
+    'libretranslate_api_key': '',
+    'translation_cache_enabled': True,
+    'translation_cache_file': 'translation_cache.sqlite',  # Relative paths are resolved from the project root
+    'translation_memo_size': 200000  # Translations kept in memory in front of the cache file
 }
 
 # Supported languages for translation
@@ -6,25 +6,82 @@ HTML content detection, and glossary replacements.
 """
 
 import pandas as pd
+import numpy as np
+import concurrent.futures
+import contextlib
+import functools
 import logging
+import os
 import re
+import threading
 import time
 from typing import List, Optional, Dict, Any
 from pathlib import Path
 
-from ..config import get_config, SUPPORTED_LANGUAGES
-from ..services import LibreTranslateService, DeepTranslatorService, GoogleTransService
+from ..config import get_config, SUPPORTED_LANGUAGES, PROJECT_ROOT
+from ..services import LibreTranslateService, DeepTranslatorService, GoogleTransService, TranslationCache, MemoCache, TokenBucket, RateLimitError
 from ..services.libre_translate import is_libretranslate_selfhost_available
+from .xml_processor import is_ignore_marked
 
 # Try to import BeautifulSoup for HTML processing
 try:
     from bs4 import BeautifulSoup
+    from bs4.element import NavigableString, PreformattedString, Tag
     HTML_PARSER_AVAILABLE = True
 except ImportError:
     HTML_PARSER_AVAILABLE = False
 
+# Try to import pyarrow for faster CSV parsing
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Try to import pyahocorasick for single-scan glossary matching
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Any tag-like markup marks a text as HTML content
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+
+# Text between a closing '>' and the next '<'
+HTML_TEXT_PATTERN = re.compile(r'>([^<]+)<')
+
+# Text inside these tags is never shown as page text and is not translated
+NON_TEXT_PARENT_TAGS = frozenset({'script', 'style', 'meta', 'title'})
+
+# Text without letters (numbers, prices, SKUs, dashes), URLs and e-mail addresses
+# comes back from the services unchanged
+NON_TRANSLATABLE_PATTERN = re.compile(r'^(?:[\W\d_]+|https?://\S+|\S+@\S+\.\S+)$')
+
+# Number of leading cells sampled to decide whether a column can contain HTML
+HTML_SAMPLE_SIZE = 32
+
+# Packed requests join texts with the Unicode record separator symbol on its own line
+PACK_SEPARATOR = '\n\u241E\n'
+PACK_SPLIT_PATTERN = re.compile(r'\s*\u241E\s*')
+
+# Packages whose batch call sends one request per text; their batches are packed instead
+PACKED_SERVICE_PACKAGES = frozenset({'deep_translator'})
+
+# Longest packed request accepted by the Google Translate web endpoint
+PACK_MAX_CHARS = 5000
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Check whether a service error means the provider is throttling requests (HTTP 429)."""
+    if isinstance(error, RateLimitError):
+        return True
+    message = str(error).lower()
+    return type(error).__name__ == 'TooManyRequests' or '429' in message or 'too many requests' in message
+
 
 class CSVProcessor:
     """Handles CSV file translation with multiple translation services."""
@@ -56,14 +113,62 @@ class CSVProcessor:
         self.target_lang = target_lang
         
         logger.info(f"CSV Processor configured: {SUPPORTED_LANGUAGES[source_lang]} -> {SUPPORTED_LANGUAGES[target_lang]}")
+        
+        # With the same language on both sides every request would come back unchanged
+        self._identity = source_lang == target_lang
+        if self._identity:
+            logger.warning("Source and target language are the same - texts are kept without translation requests")
         logger.info(f"Request delay: {self.delay*1000:.1f}ms between requests")
         
+        # Shared by all worker threads, so the request rate holds across the whole process
+        self._limiter = self._make_rate_limiter()
+        
+        # Caps requests in flight across every thread sharing this processor (files, columns, batches)
+        self._request_slots = threading.BoundedSemaphore(config['max_concurrent_requests'])
+        
+        # The HTML backend is chosen once here instead of on every HTML cell
+        if HTML_PARSER_AVAILABLE:
+            self._translate_html = self._translate_html_with_beautifulsoup
+        else:
+            self._translate_html = self._translate_html_with_regex
+        
         # Initialize translation services
         self.translators = []
         self._initialize_translators()
         
         # Load glossary
         self.glossary = self._load_glossary()
+        
+        # Open the persistent translation cache
+        self.translation_cache = self._open_translation_cache()
+        
+        # Bounded in-memory memo in front of the persistent cache, keyed by (source_lang, target_lang, text)
+        self._cache = MemoCache(config['translation_memo_size'])
+    
+    def _make_rate_limiter(self) -> TokenBucket:
+        """
+        Build the request rate limiter from the configuration.
+        
+        requests_per_second caps the rate directly. When it is 0 the rate follows
+        the request delay: csv_max_workers requests per delay, the rate the
+        workers reached when each of them slept the delay after its request.
+        """
+        config = get_config()
+        workers = config['csv_max_workers']
+        rate = config['requests_per_second']
+        if rate <= 0:
+            rate = workers / self.delay if self.delay > 0 else 0
+        return TokenBucket(rate, capacity=workers)
+    
+    def set_delay(self, delay_seconds: float):
+        """
+        Change the delay between translation requests.
+        
+        Args:
+            delay_seconds: Delay in seconds between translation requests
+        """
+        self.delay = delay_seconds
+        self._limiter = self._make_rate_limiter()
     
     def _initialize_translators(self):
         """Initialize available translation services in order of preference."""
@@ -112,6 +217,23 @@ class CSVProcessor:
         
         logger.info(f"Active translation services: {[name for name, _ in self.translators]}")
     
+    def _open_translation_cache(self) -> Optional[TranslationCache]:
+        """Open the persistent translation cache if it is enabled in the config."""
+        config = get_config()
+        if not config.get('translation_cache_enabled', True):
+            logger.info("Translation cache disabled")
+            return None
+        
+        cache_file = Path(config.get('translation_cache_file', 'translation_cache.sqlite'))
+        if not cache_file.is_absolute():
+            cache_file = PROJECT_ROOT / cache_file
+        
+        try:
+            return TranslationCache(cache_file)
+        except Exception as e:
+            logger.warning(f"Could not open translation cache {cache_file}: {e}")
+            return None
+    
     def _load_glossary(self) -> Dict[str, Dict[str, str]]:
         """Load glossary for custom translations with case preservation support."""
         config = get_config()
@@ -127,11 +249,12 @@ class CSVProcessor:
                 
                 # Check for standard format columns (source, target, keep_case)
                 if 'source' in df.columns and 'target' in df.columns:
-                    # Use the standard format
-                    for _, row in df.iterrows():
-                        source = str(row['source']).strip()
-                        target = str(row['target']).strip()
-                        keep_case = str(row.get('keep_case', 'False')).strip().lower() == 'true'
+                    # Use the standard format; zip over the columns instead of building a Series per row
+                    keep_case_values = df['keep_case'] if 'keep_case' in df.columns else ['False'] * len(df)
+                    for source, target, keep_case in zip(df['source'], df['target'], keep_case_values):
+                        source = str(source).strip()
+                        target = str(target).strip()
+                        keep_case = str(keep_case).strip().lower() == 'true'
                         
                         if source and target:
                             # Store both original case and lowercase for lookup
@@ -144,9 +267,9 @@ class CSVProcessor:
                 
                 # Check for alternative format columns (original, translation)
                 elif 'original' in df.columns and 'translation' in df.columns:
-                    for _, row in df.iterrows():
-                        original = str(row['original']).strip()
-                        translation = str(row['translation']).strip()
+                    for original, translation in zip(df['original'], df['translation']):
+                        original = str(original).strip()
+                        translation = str(translation).strip()
                         if original and translation:
                             glossary[original.lower()] = {
                                 'target': translation,
@@ -165,58 +288,120 @@ class CSVProcessor:
         
         return glossary
     
+    def flush_translation_cache(self):
+        """Write buffered translations to the persistent cache."""
+        if self.translation_cache is not None:
+            self.translation_cache.flush()
+    
+    def close(self):
+        """Flush and close the persistent translation cache; later translations run without it."""
+        if self.translation_cache is not None:
+            self.translation_cache.close()
+            self.translation_cache = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
     def translate_csv(self, 
                      input_file: str, 
                      output_file: str, 
                      columns_to_translate: List[str],
                      append_suffix: str = "_translated",
-                     delimiter: str = ",") -> tuple[bool, int]:
+                     delimiter: str = ",",
+                     encoding: str = "utf-8") -> tuple[bool, int]:
         """
         Translate specified columns in a CSV file.
         
         Args:
             input_file: Path to input CSV file
-            output_file: Path to output CSV file
+            output_file: Path to output CSV file, or an open text file to write to
             columns_to_translate: List of column names to translate
             append_suffix: Suffix to append to translated column names
             delimiter: CSV delimiter
+            encoding: Encoding of the input file (output is always UTF-8)
             
         Returns:
             Tuple of (success, characters_translated)
         """
         try:
-            # Read the CSV file
+            # Stream the CSV in chunks so only one chunk is in memory at a time
             logger.info(f"Reading CSV file: {input_file} (delimiter: '{delimiter}')")
-            df = pd.read_csv(input_file, encoding='utf-8', delimiter=delimiter, keep_default_na=False)
-            logger.info(f"Loaded {len(df)} rows and {len(df.columns)} columns")
-            
-            # Validate columns exist
-            missing_columns = [col for col in columns_to_translate if col not in df.columns]
-            if missing_columns:
-                logger.error(f"Missing columns: {missing_columns}")
-                return False, 0
+            reader = self._read_csv_chunks(input_file, delimiter, encoding)
             
-            # Create result DataFrame
-            result_df = df.copy()
             total_characters_translated = 0
+            total_rows = 0
+            original_columns = 0
             
-            # Translate each specified column
-            for column in columns_to_translate:
-                logger.info(f"Starting translation of column: {column}")
-                translated_column, column_chars = self.translate_column(df, column)
-                total_characters_translated += column_chars
+            # Reading the next chunk and writing the previous one run on their own threads,
+            # so disk I/O overlaps with the network-bound translation of the current chunk.
+            # Each pool has one worker, which keeps reads and writes in file order.
+            with contextlib.ExitStack() as output_stack, \
+                 concurrent.futures.ThreadPoolExecutor(max_workers=1) as read_pool, \
+                 concurrent.futures.ThreadPoolExecutor(max_workers=1) as write_pool:
+                output = None
+                next_chunk = read_pool.submit(next, reader, None)
+                pending_write = None
+                chunk_num = 0
                 
-                # Add translated column with suffix
-                new_column_name = f"{column}{append_suffix}"
-                result_df[new_column_name] = translated_column
-            
-            # Save the result
-            logger.info(f"Saving translated CSV to: {output_file} (delimiter: '{delimiter}')")
-            result_df.to_csv(output_file, index=False, encoding='utf-8', sep=delimiter)
+                while True:
+                    chunk = next_chunk.result()
+                    if chunk is None:
+                        break
+                    next_chunk = read_pool.submit(next, reader, None)
+                    
+                    if chunk_num == 0:
+                        # Validate columns exist before anything is written
+                        missing_columns = [col for col in columns_to_translate if col not in chunk.columns]
+                        if missing_columns:
+                            logger.error(f"Missing columns: {missing_columns}")
+                            return False, 0
+                        original_columns = len(chunk.columns)
+                        
+                        # One handle for the whole run, written by the write pool in file order;
+                        # an already open file-like output is used as it is
+                        logger.info(f"Saving translated CSV to: {output_file} (delimiter: '{delimiter}')")
+                        if hasattr(output_file, 'write'):
+                            output = output_file
+                        else:
+                            output = output_stack.enter_context(open(output_file, 'w', encoding='utf-8', newline=''))
+                    
+                    total_rows += len(chunk)
+                    logger.info(f"Loaded chunk {chunk_num + 1}: {len(chunk)} rows and {len(chunk.columns)} columns")
+                    
+                    # Translate the specified columns together, so text shared between them is sent once
+                    logger.info(f"Starting translation of columns: {columns_to_translate}")
+                    translated_columns = self.translate_columns(chunk, columns_to_translate)
+                    new_columns = {}
+                    for column in columns_to_translate:
+                        translated_column, column_chars = translated_columns[column]
+                        total_characters_translated += column_chars
+                        new_columns[f"{column}{append_suffix}"] = translated_column
+                    
+                    # Add the suffixed columns in one step; the original columns are shared, not copied
+                    chunk = chunk.assign(**new_columns)
+                    
+                    # Surface a failed write of the previous chunk before queueing the next one
+                    if pending_write is not None:
+                        pending_write.result()
+                    
+                    # The first chunk writes the header, later chunks only add rows
+                    pending_write = write_pool.submit(self._write_chunk, chunk, output, chunk_num == 0, delimiter)
+                    
+                    # Commit the chunk's new translations so an interrupted run keeps them
+                    self.flush_translation_cache()
+                    final_columns = len(chunk.columns)
+                    chunk_num += 1
+                
+                if pending_write is not None:
+                    pending_write.result()
             
             logger.info("Translation completed successfully!")
-            logger.info(f"Original columns: {len(df.columns)}")
-            logger.info(f"Final columns: {len(result_df.columns)}")
+            logger.info(f"Rows translated: {total_rows}")
+            logger.info(f"Original columns: {original_columns}")
+            logger.info(f"Final columns: {final_columns}")
             logger.info(f"Characters translated: {total_characters_translated}")
             
             return True, total_characters_translated
@@ -228,28 +413,258 @@ class CSVProcessor:
             logger.error(f"Error during translation: {e}")
             return False, 0
     
-    def translate_column(self, df: pd.DataFrame, column: str) -> tuple[List[str], int]:
-        """Translate all texts in a DataFrame column."""
-        translated_texts = []
-        total_chars = 0
+    @staticmethod
+    def _write_chunk(chunk: pd.DataFrame, output, header: bool, delimiter: str):
+        """Append a translated chunk to the open output file and flush it, so finished rows survive a crash."""
+        chunk.to_csv(output, header=header, index=False, sep=delimiter)
+        output.flush()
+    
+    def _read_csv_chunks(self, input_file, delimiter: str, encoding: str = 'utf-8'):
+        """
+        Open a CSV file as an iterator of DataFrame chunks of at most csv_chunk_size rows.
         
-        for i, text in enumerate(df[column]):
+        Files of csv_pyarrow_min_bytes and more are parsed by pyarrow's multithreaded
+        reader when it is installed and csv_use_pyarrow is enabled; everything else
+        uses pandas' C reader. Both read every cell as text, so the output does not
+        depend on which reader ran.
+        """
+        config = get_config()
+        chunk_size = config['csv_chunk_size']
+        if (config['csv_use_pyarrow'] and PYARROW_AVAILABLE and isinstance(input_file, (str, Path))
+                and os.path.getsize(input_file) >= config['csv_pyarrow_min_bytes']):
+            return self._read_csv_chunks_arrow(input_file, delimiter, chunk_size, encoding)
+        return pd.read_csv(input_file, encoding=encoding, delimiter=delimiter, dtype=str,
+                           keep_default_na=False, engine='c', chunksize=chunk_size)
+    
+    @staticmethod
+    def _read_csv_chunks_arrow(input_file, delimiter: str, chunk_size: int, encoding: str = 'utf-8'):
+        """Yield DataFrame chunks parsed by pyarrow, with every column read as text."""
+        read_options = pacsv.ReadOptions(encoding=encoding)
+        parse_options = pacsv.ParseOptions(delimiter=delimiter)
+        
+        # Every column is read as a string, so cells are written back exactly as they were read
+        with pacsv.open_csv(input_file, read_options=read_options, parse_options=parse_options) as probe:
+            column_names = probe.schema.names
+        convert_options = pacsv.ConvertOptions(
+            column_types={name: pa.string() for name in column_names},
+            strings_can_be_null=False
+        )
+        
+        batches = []
+        rows = 0
+        with pacsv.open_csv(input_file, read_options=read_options, parse_options=parse_options,
+                            convert_options=convert_options) as reader:
+            for batch in reader:
+                batches.append(batch)
+                rows += batch.num_rows
+                if rows >= chunk_size:
+                    yield pa.Table.from_batches(batches).to_pandas()
+                    batches = []
+                    rows = 0
+        if batches:
+            yield pa.Table.from_batches(batches).to_pandas()
+    
+    def translate_column(self, df: pd.DataFrame, column: str, use_multithreading: bool = True, max_workers: int = None) -> tuple[List[str], int]:
+        """
+        Translate all texts in a DataFrame column.
+        
+        Args:
+            df: DataFrame containing the data
+            column: Name of the column to translate
+            use_multithreading: Whether to use worker threads for larger columns
+            max_workers: Number of worker threads (uses config if None)
+            
+        Returns:
+            Tuple of (translated_texts, characters_translated)
+        """
+        config = get_config()
+        if max_workers is None:
+            max_workers = config['csv_max_workers']
+        
+        if config['batch_translation']:
+            return self._translate_column_batched(df, column, max_workers if use_multithreading else 1)
+        if use_multithreading and max_workers > 1 and len(df) > config['multithreading_threshold']:
+            return self.translate_column_multithreaded(df, column, max_workers)
+        return self._translate_column_single_threaded(df, column)
+    
+    def translate_columns(self, df: pd.DataFrame, columns: List[str], max_workers: int = None) -> Dict[str, tuple[List[str], int]]:
+        """
+        Translate several DataFrame columns together.
+        
+        With batch translation enabled, the distinct texts of all columns are
+        translated in one pass, so text shared between columns is sent once and
+        the batches of every column are in flight at the same time.
+        
+        Args:
+            df: DataFrame containing the data
+            columns: Names of the columns to translate
+            max_workers: Number of batches in flight at once (uses config if None)
+            
+        Returns:
+            Dictionary mapping each column to (translated_texts, characters_translated)
+        """
+        config = get_config()
+        if max_workers is None:
+            max_workers = config['csv_max_workers']
+        
+        if config['batch_translation']:
+            return self._translate_columns_batched(df, columns, max_workers)
+        return {column: self.translate_column(df, column, max_workers=max_workers) for column in columns}
+    
+    def _translate_column_batched(self, df: pd.DataFrame, column: str, max_workers: int = None) -> tuple[List[str], int]:
+        """Translate all texts in a DataFrame column with batched service requests."""
+        return self._translate_columns_batched(df, [column], max_workers)[column]
+    
+    def _translate_columns_batched(self, df: pd.DataFrame, columns: List[str], max_workers: int = None) -> Dict[str, tuple[List[str], int]]:
+        """Translate DataFrame columns with batched service requests, sending each distinct plain text once."""
+        plans = {}  # column -> (as_text, plain_mask, html_mask, total_chars)
+        plain_texts = {}  # Distinct plain texts of all columns, in first-seen order
+        
+        for column in columns:
+            series = df[column]
+            as_text, mask = self._non_empty_cells(series)
+            total_chars = int(as_text[mask].str.len().sum())
+            
+            # Columns are usually all plain or all HTML: when the leading cells hold no markup
+            # the column is treated as plain, otherwise every cell is classified in one pass.
+            # translate_batch still routes any stray HTML cell through translate_text.
+            sample = as_text[mask].head(HTML_SAMPLE_SIZE)
+            if sample.str.contains('<', regex=False).any():
+                is_html = as_text.str.contains(HTML_TAG_PATTERN, na=False).to_numpy()
+            else:
+                is_html = np.zeros(len(series), dtype=bool)
+            plain_mask = mask & ~is_html
+            html_mask = mask & is_html
+            
+            logger.info(f"Translating column: {column} ({mask.sum()} of {len(series)} cells, {html_mask.sum()} HTML, batched)")
+            plain_texts.update(dict.fromkeys(as_text[plain_mask]))
+            plans[column] = (as_text, plain_mask, html_mask, total_chars)
+        
+        unique_texts = list(plain_texts)
+        translated_by_text = dict(zip(unique_texts, self.translate_texts(unique_texts, max_workers)))
+        
+        results = {}
+        html_by_text = {}  # Shared across columns, like the plain texts
+        for column, (as_text, plain_mask, html_mask, total_chars) in plans.items():
+            translated_texts = df[column].to_numpy(dtype=object, copy=True)
+            # Series.map broadcasts the distinct translations back to every row in one lookup pass
+            translated_texts[plain_mask] = as_text[plain_mask].map(translated_by_text).to_numpy(dtype=object)
+            
+            if html_mask.any():
+                html_texts = as_text[html_mask]
+                for text in html_texts.unique():
+                    if text not in html_by_text:
+                        html_by_text[text] = self.translate_text(text)
+                translated_texts[html_mask] = html_texts.map(html_by_text).to_numpy(dtype=object)
+            
+            results[column] = (translated_texts.tolist(), total_chars)
+        
+        return results
+    
+    @staticmethod
+    def _non_empty_cells(series: pd.Series) -> tuple[pd.Series, np.ndarray]:
+        """
+        Find the cells of a column that need translating, for the whole column at once.
+        
+        Returns:
+            Tuple of (cells as strings, boolean mask of the non-NaN, non-blank cells).
+            Cells outside the mask keep their original value and are not counted.
+        """
+        as_text = series.astype(str)
+        mask = (series.notna() & (as_text.str.strip() != '')).to_numpy()
+        return as_text, mask
+    
+    def _translate_column_single_threaded(self, df: pd.DataFrame, column: str) -> tuple[List[str], int]:
+        """Translate all texts in a DataFrame column one row at a time, translating repeated values once."""
+        series = df[column]
+        as_text, mask = self._non_empty_cells(series)
+        total_chars = int(as_text[mask].str.len().sum())
+        
+        values = series.to_numpy(dtype=object)
+        translated_texts = values.copy()  # Empty cells and failed rows keep their original value
+        translated_by_text = {}  # Repeated cells reuse the first translation
+        
+        for i in mask.nonzero()[0]:
+            text = values[i]
             try:
-                # Count characters of original text
-                if text and not pd.isna(text):
-                    total_chars += len(str(text))
+                if text in translated_by_text:
+                    translated_texts[i] = translated_by_text[text]
+                    continue
                 
                 translated = self.translate_text(text)
-                translated_texts.append(translated)
-                
-                # Add delay between requests
-                if i < len(df) - 1:  # Don't delay after the last request
-                    time.sleep(self.delay)
+                translated_texts[i] = translated
+                if isinstance(text, str):
+                    translated_by_text[text] = translated
                     
             except Exception as e:
                 logger.warning(f"Translation failed for row {i}: {e}")
-                translated_texts.append(text)  # Use original text if translation fails
         
+        return translated_texts.tolist(), total_chars
+    
+    def translate_column_multithreaded(self, df: pd.DataFrame, column: str, max_workers: int = None) -> tuple[List[str], int]:
+        """
+        Translate a DataFrame column using a pool of worker threads.
+        
+        Translation is bound by network latency, so the workers overlap their
+        requests while the services reuse pooled HTTP connections. Each distinct
+        string is translated only once.
+        
+        Args:
+            df: DataFrame containing the data
+            column: Name of the column to translate
+            max_workers: Number of worker threads (uses config if None)
+            
+        Returns:
+            Tuple of (translated_texts, characters_translated)
+        """
+        config = get_config()
+        if max_workers is None:
+            max_workers = config['csv_max_workers']
+        
+        series = df[column]
+        as_text, mask = self._non_empty_cells(series)
+        total_chars = int(as_text[mask].str.len().sum())
+        values = series.tolist()
+        
+        # Repeated strings are translated once and fanned back out to every row sharing them;
+        # empty cells never become jobs
+        rows_by_text = {}
+        jobs = []  # (value, row indices)
+        for idx in mask.nonzero()[0].tolist():
+            text = values[idx]
+            if isinstance(text, str):
+                if text in rows_by_text:
+                    rows_by_text[text].append(idx)
+                    continue
+                rows_by_text[text] = [idx]
+                jobs.append((text, rows_by_text[text]))
+            else:
+                jobs.append((text, [idx]))
+        
+        total_jobs = len(jobs)
+        logger.info(f"Translating column: {column} ({total_jobs} unique values of {len(values)} rows, using {max_workers} threads)")
+        
+        def translate_job(job):
+            text, rows = job
+            try:
+                return self.translate_text(text)
+            except Exception as e:
+                # The original text is kept, so one failure does not stop executor.map
+                logger.warning(f"Translation failed for row {rows[0]}: {e}")
+                return text
+        
+        translated_texts = list(values)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Workers only translate; the shared rate limiter paces their requests.
+            # map yields results in job order, so no future-to-rows bookkeeping is needed
+            results = executor.map(translate_job, jobs)
+            for done, ((text, rows), translated) in enumerate(zip(jobs, results), 1):
+                if done % config['progress_interval'] == 0:
+                    logger.info("Progress: %d/%d values processed", done, total_jobs)
+                for idx in rows:
+                    translated_texts[idx] = translated
+        
+        logger.info(f"Completed multithreaded translation of column: {column}")
         return translated_texts, total_chars
     
     def translate_text(self, text: str) -> str:
@@ -267,7 +682,7 @@ class CSVProcessor:
             
             # Check if content contains HTML
             if self.is_html_content(text_with_glossary):
-                logger.debug(f"Detected HTML content, using HTML-aware translation")
+                logger.debug("Detected HTML content, using HTML-aware translation")
                 translated = self.translate_html_content(text_with_glossary)
             else:
                 translated = self._translate_plain_text(text_with_glossary)
@@ -275,27 +690,48 @@ class CSVProcessor:
             # Apply glossary replacements after translation
             final_result = self._apply_glossary_replacements(translated)
                 
-            logger.debug(f"Translated: '{text_str[:50]}...' -> '{final_result[:50]}...'")
+            # Per-cell message: skip the slicing and formatting unless debug logging is on
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Translated: '%s...' -> '%s...'", text_str[:50], final_result[:50])
             return final_result
             
         except Exception as e:
             logger.warning(f"Translation failed for '{text}': {e}")
             return text
     
+    def _get_cached(self, key: tuple) -> Optional[str]:
+        """Look up a translation in the in-memory memo, then in the persistent cache."""
+        cached = self._cache.get(key)
+        if cached is None and self.translation_cache is not None:
+            cached = self.translation_cache.get(*key)
+            if cached is not None:
+                self._cache[key] = cached
+        return cached
+    
+    def _store_cached(self, key: tuple, translated: str):
+        """Remember a successful translation in the memo and the persistent cache."""
+        self._cache[key] = translated
+        if self.translation_cache is not None:
+            self.translation_cache.put(*key, translated)
+    
     def _translate_plain_text(self, text: str) -> str:
-        """Translate plain text using available services with fallback."""
-        import time
+        """Translate plain text using the translation caches, then available services with fallback."""
+        if self._identity or NON_TRANSLATABLE_PATTERN.match(text.strip()):
+            return text
+        
+        key = (self.source_lang, self.target_lang, text)
+        cached = self._get_cached(key)
+        if cached is not None:
+            return cached
         
         for service_name, translator in self.translators:
             try:
-                if service_name == 'libretranslate':
-                    result = translator.translate(text)
-                elif service_name == 'deep_translator':
-                    result = translator.translate(text)
-                elif service_name == 'googletrans':
-                    result = translator.translate(text)
+                # Every service exposes the same translate(text) call, so no per-service dispatch
+                # Throttled requests are retried with backoff; other errors move on to the next service
+                result = self._request_with_retries(translator.translate, text, retry_if=is_rate_limit_error)
                 
                 if result and result.strip():
+                    self._store_cached(key, result)
                     return result
                     
             except Exception as e:
@@ -305,12 +741,241 @@ class CSVProcessor:
         logger.warning(f"All translation services failed for: {text[:50]}...")
         return text
     
+    def translate_texts(self, texts: List[str], max_workers: int = None) -> List[str]:
+        """
+        Translate any number of texts, split into batches that respect the configured size limits.
+        
+        Repeated strings are translated once and values that are not strings go
+        through translate_text. Batches are sent concurrently by worker threads,
+        paced by the shared request rate limiter.
+        
+        Args:
+            texts: Texts to translate
+            max_workers: Number of batches in flight at once (uses config if None)
+            
+        Returns:
+            Translated texts in input order
+        """
+        config = get_config()
+        if max_workers is None:
+            max_workers = config['csv_max_workers']
+        
+        unique_texts = list(dict.fromkeys(text for text in texts if isinstance(text, str)))
+        batches = self._split_batches(unique_texts, config['batch_max_chars'], config['batch_max_items'])
+        
+        translated_by_text = {}
+        workers = max(1, min(max_workers, len(batches)))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            # map yields in submission order, so each result lines up with its batch
+            for batch_num, (batch, translated) in enumerate(zip(batches, executor.map(self.translate_batch, batches)), 1):
+                translated_by_text.update(zip(batch, translated))
+                logger.info("Progress: %d/%d batches processed", batch_num, len(batches))
+        
+        return [
+            translated_by_text[text] if isinstance(text, str) else self.translate_text(text)
+            for text in texts
+        ]
+    
+    @staticmethod
+    def _split_batches(texts: List[str], max_chars: int, max_items: int) -> List[List[str]]:
+        """Group texts into consecutive batches of at most max_items texts and max_chars characters."""
+        batches = []
+        batch = []
+        batch_chars = 0
+        for text in texts:
+            if batch and (len(batch) >= max_items or batch_chars + len(text) > max_chars):
+                batches.append(batch)
+                batch = []
+                batch_chars = 0
+            batch.append(text)
+            batch_chars += len(text)
+        if batch:
+            batches.append(batch)
+        return batches
+    
+    def translate_batch(self, texts: List[str]) -> List[str]:
+        """
+        Translate a list of texts, sending the plain-text ones to the services in one batch.
+        
+        HTML and non-string values go through translate_text one by one. The
+        batch takes a single token from the request rate limiter.
+        
+        Args:
+            texts: Texts to translate
+            
+        Returns:
+            Translated texts in input order
+        """
+        results = list(texts)
+        rows_by_text = {}  # Glossary-applied plain text -> indices sharing it
+        
+        for i, text in enumerate(texts):
+            if not isinstance(text, str) or not text.strip():
+                results[i] = self.translate_text(text)
+                continue
+            
+            text_with_glossary = self._apply_glossary_replacements(text.strip())
+            if self.is_html_content(text_with_glossary):
+                results[i] = self.translate_text(text)
+            else:
+                rows_by_text.setdefault(text_with_glossary, []).append(i)
+        
+        if rows_by_text:
+            plain_texts = list(rows_by_text)
+            for text, translated in zip(plain_texts, self._translate_plain_batch(plain_texts)):
+                final_result = self._apply_glossary_replacements(translated)
+                for i in rows_by_text[text]:
+                    results[i] = final_result
+        
+        return results
+    
+    def _translate_plain_batch(self, texts: List[str]) -> List[str]:
+        """Batch counterpart of _translate_plain_text: cache first, then each service for the remaining texts."""
+        results = list(texts)
+        if self._identity:
+            return results
+        
+        misses = []  # Only texts missing from both caches reach the services
+        for i, text in enumerate(texts):
+            # Text without letters, URLs and e-mail addresses are left as they are without a request
+            if NON_TRANSLATABLE_PATTERN.match(text.strip()):
+                continue
+            cached = self._cache.get((self.source_lang, self.target_lang, text))
+            if cached is not None:
+                results[i] = cached
+            else:
+                misses.append(i)
+        
+        # Texts missing from the memo are looked up in the persistent cache with one query
+        if misses and self.translation_cache is not None:
+            found = self.translation_cache.get_many(self.source_lang, self.target_lang, [texts[i] for i in misses])
+            remaining = []
+            for i in misses:
+                if texts[i] in found:
+                    results[i] = found[texts[i]]
+                    self._cache[(self.source_lang, self.target_lang, texts[i])] = results[i]
+                else:
+                    remaining.append(i)
+            misses = remaining
+        
+        # Decide once per batch, not per service, whether packing is on at all
+        packed_requests = get_config()['packed_requests']
+        for service_name, translator in self.translators:
+            if not misses:
+                break
+            if packed_requests and self._is_packed_service_type(type(translator)):
+                batch = self._translate_packed(service_name, translator, [texts[i] for i in misses])
+            else:
+                try:
+                    batch = self._request_with_retries(translator.translate_batch, [texts[i] for i in misses])
+                except Exception as e:
+                    # One bad string must not fail the whole batch: retry the texts one by one
+                    logger.warning(f"{service_name} batch failed, translating individually: {e}")
+                    batch = [self._translate_single(service_name, translator, texts[i]) for i in misses]
+            
+            remaining = []
+            for i, result in zip(misses, batch):
+                if result and result.strip():
+                    results[i] = result
+                    self._store_cached((self.source_lang, self.target_lang, texts[i]), result)
+                else:
+                    remaining.append(i)
+            misses = remaining
+        
+        if misses:
+            logger.warning(f"All translation services failed for {len(misses)} of {len(texts)} batched texts")
+        return results
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _is_packed_service_type(service_type: type) -> bool:
+        """Check once per service class whether its batch endpoint sends one request per text."""
+        return service_type.__module__.split('.')[0] in PACKED_SERVICE_PACKAGES
+    
+    def _translate_packed(self, service_name: str, translator, texts: List[str]) -> List[Optional[str]]:
+        """
+        Translate texts with one request per pack of separator-joined texts.
+        
+        Texts are packed in order up to PACK_MAX_CHARS. A pack whose response
+        does not split back into one part per text is translated one text at a
+        time instead, as are texts that contain the separator symbol themselves.
+        
+        Returns:
+            Translations in input order, None for each text that failed
+        """
+        results: List[Optional[str]] = [None] * len(texts)
+        packs = []
+        pack = []
+        pack_chars = 0
+        for i, text in enumerate(texts):
+            if '\u241E' in text:
+                results[i] = self._translate_single(service_name, translator, text)
+                continue
+            added = len(text) + (len(PACK_SEPARATOR) if pack else 0)
+            if pack and pack_chars + added > PACK_MAX_CHARS:
+                packs.append(pack)
+                pack = []
+                pack_chars = 0
+                added = len(text)
+            pack.append(i)
+            pack_chars += added
+        if pack:
+            packs.append(pack)
+        
+        for pack in packs:
+            if len(pack) == 1:
+                results[pack[0]] = self._translate_single(service_name, translator, texts[pack[0]])
+                continue
+            
+            try:
+                response = self._request_with_retries(translator.translate, PACK_SEPARATOR.join(texts[i] for i in pack))
+                parts = PACK_SPLIT_PATTERN.split(response.strip()) if response else []
+            except Exception as e:
+                logger.warning(f"{service_name} packed request failed: {e}")
+                parts = []
+            
+            if len(parts) != len(pack):
+                logger.warning(f"{service_name} packed response did not split into {len(pack)} texts, translating individually")
+                parts = [self._translate_single(service_name, translator, texts[i]) for i in pack]
+            for i, part in zip(pack, parts):
+                results[i] = part
+        
+        return results
+    
+    def _request_with_retries(self, request, *args, retry_if=None):
+        """
+        Send a service request, retrying failures with exponential backoff.
+        
+        Each attempt waits for the rate limiter and a request slot. After
+        max_retries failed retries the last exception is raised, as is any
+        exception for which retry_if (when given) returns False.
+        """
+        config = get_config()
+        for attempt in range(config['max_retries'] + 1):
+            self._limiter.acquire()
+            try:
+                with self._request_slots:
+                    return request(*args)
+            except Exception as e:
+                if attempt == config['max_retries'] or (retry_if is not None and not retry_if(e)):
+                    raise
+                backoff = config['retry_base_delay'] / 1000.0 * 2 ** attempt
+                logger.info(f"Request failed ({e}), retrying in {backoff * 1000:.0f}ms")
+                time.sleep(backoff)
+    
+    def _translate_single(self, service_name: str, translator, text: str) -> Optional[str]:
+        """Translate one text with a single service, returning None on failure."""
+        try:
+            return self._request_with_retries(translator.translate, text, retry_if=is_rate_limit_error)
+        except Exception as e:
+            logger.warning(f"{service_name} failed: {e}")
+            return None
+    
     def is_html_content(self, text: str) -> bool:
         """Check if text contains HTML tags."""
         if not text:
             return False
-        html_pattern = re.compile(r'<[^>]+>')
-        return bool(html_pattern.search(str(text)))
+        return bool(HTML_TAG_PATTERN.search(str(text)))
     
     def translate_html_content(self, html_text: str) -> str:
         """Translate HTML content while preserving structure."""
@@ -321,61 +986,71 @@ class CSVProcessor:
             html_str = str(html_text).strip()
             if not html_str:
                 return html_text
-                
-            if HTML_PARSER_AVAILABLE:
-                return self._translate_html_with_beautifulsoup(html_str)
-            else:
-                return self._translate_html_with_regex(html_str)
+            
+            # Repeated HTML cells skip parsing too; their text nodes are in the persistent cache already
+            key = (self.source_lang, self.target_lang, html_str)
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+            
+            translated = self._translate_html(html_str)
+            if translated != html_str:
+                self._cache[key] = translated
+            return translated
                 
         except Exception as e:
             logger.warning(f"HTML translation failed for '{html_text[:50]}...': {e}")
             return html_text
     
     def _translate_html_with_beautifulsoup(self, html_text: str) -> str:
-        """Translate HTML using BeautifulSoup with improved space preservation."""
+        """Translate HTML using BeautifulSoup, sending all text nodes in one batch."""
         try:
             soup = BeautifulSoup(html_text, 'html.parser')
             
-            for text_node in soup.find_all(string=True):
-                if text_node.parent.name not in ['script', 'style', 'meta', 'title']:
-                    original_text = text_node.string
+            # Collect the translatable text nodes first: (node, original text, stripped text).
+            # One walk prunes ignore-marked and non-text tags before descending into them,
+            # instead of scanning every text node's ancestors.
+            text_nodes = []
+            stack = [soup]
+            while stack:
+                node = stack.pop()
+                if isinstance(node, Tag):
+                    if node.name in NON_TEXT_PARENT_TAGS or is_ignore_marked(node.attrs):
+                        continue
+                    stack.extend(reversed(node.contents))
+                elif isinstance(node, NavigableString) and not isinstance(node, PreformattedString):
+                    # Comments, CDATA and doctypes are not page text
+                    original_text = str(node)
                     text_content = original_text.strip()
-                    
                     if text_content and len(text_content) > 1:
-                        # Check if this text node or any parent has ignore attribute
-                        should_ignore = False
-                        current = text_node.parent
-                        
-                        while current and hasattr(current, 'get'):
-                            # Check for ignore attribute (case-insensitive)
-                            ignore_value = current.get('ignore', '') or current.get('Ignore', '')
-                            if ignore_value.lower() == 'true':
-                                should_ignore = True
-                                break
-                            current = current.parent if hasattr(current, 'parent') else None
-                        
-                        if should_ignore:
-                            continue  # Skip translation for ignored elements
-                        
-                        translated = self._translate_plain_text(text_content)
-                        if translated and translated != text_content:
-                            # IMPROVED: Preserve surrounding whitespace more accurately
-                            leading_space = ''
-                            trailing_space = ''
-                            
-                            # Extract leading whitespace - find where content starts
-                            content_start = original_text.find(text_content)
-                            if content_start > 0:
-                                leading_space = original_text[:content_start]
-                            
-                            # Extract trailing whitespace - find where content ends
-                            content_end = content_start + len(text_content)
-                            if content_end < len(original_text):
-                                trailing_space = original_text[content_end:]
-                            
-                            # Replace with translated text preserving exact whitespace
-                            new_text = leading_space + translated + trailing_space
-                            text_node.replace_with(new_text)
+                        text_nodes.append((node, original_text, text_content))
+            
+            if not text_nodes:
+                return str(soup)
+            
+            unique_texts = list(dict.fromkeys(text_content for _, _, text_content in text_nodes))
+            translated_by_text = dict(zip(unique_texts, self._translate_plain_batch(unique_texts)))
+            
+            for text_node, original_text, text_content in text_nodes:
+                translated = translated_by_text[text_content]
+                if translated and translated != text_content:
+                    # IMPROVED: Preserve surrounding whitespace more accurately
+                    leading_space = ''
+                    trailing_space = ''
+                    
+                    # Extract leading whitespace - find where content starts
+                    content_start = original_text.find(text_content)
+                    if content_start > 0:
+                        leading_space = original_text[:content_start]
+                    
+                    # Extract trailing whitespace - find where content ends
+                    content_end = content_start + len(text_content)
+                    if content_end < len(original_text):
+                        trailing_space = original_text[content_end:]
+                    
+                    # Replace with translated text preserving exact whitespace
+                    new_text = leading_space + translated + trailing_space
+                    text_node.replace_with(new_text)
             
             return str(soup)
             
@@ -384,46 +1059,160 @@ class CSVProcessor:
             return self._translate_html_with_regex(html_text)
     
     def _translate_html_with_regex(self, html_text: str) -> str:
-        """Translate HTML using regex (fallback method)."""
+        """Translate HTML using regex (fallback method), sending all text spans in one batch."""
         try:
-            def translate_match(match):
-                text_content = match.group(1).strip()
-                if text_content and len(text_content) > 1:
-                    return self._translate_plain_text(text_content)
-                return text_content
+            # Text between tags: (start, end, stripped text)
+            spans = [
+                (match.start(1), match.end(1), match.group(1).strip())
+                for match in HTML_TEXT_PATTERN.finditer(html_text)
+            ]
+            
+            texts = list(dict.fromkeys(text for _, _, text in spans if len(text) > 1))
+            translated_by_text = dict(zip(texts, self._translate_plain_batch(texts)))
             
-            # Simple regex to find text between tags
-            text_pattern = re.compile(r'>([^<]+)<')
-            translated_html = text_pattern.sub(lambda m: f'>{translate_match(m)}<', html_text)
+            # Splice the replacements in with one join instead of rebuilding the string per match
+            parts = []
+            position = 0
+            for start, end, text in spans:
+                parts.append(html_text[position:start])
+                parts.append(translated_by_text.get(text, text))
+                position = end
+            parts.append(html_text[position:])
             
-            return translated_html
+            return ''.join(parts)
             
         except Exception as e:
             logger.warning(f"Regex HTML translation failed: {e}")
             return html_text
     
+    @property
+    def glossary(self) -> Dict[str, Dict[str, str]]:
+        """Glossary terms keyed by lowercase source term."""
+        return self._glossary
+    
+    @glossary.setter
+    def glossary(self, glossary: Dict[str, Dict[str, str]]):
+        # Compile the combined pattern whenever the glossary is replaced
+        self._glossary = glossary
+        self._glossary_pattern, self._glossary_targets = self._compile_glossary(glossary)
+        self._glossary_automaton = self._build_glossary_automaton(glossary)
+        # A text without any term's first character (case-folded) cannot contain a term
+        self._glossary_first_chars = frozenset(key.casefold()[0] for key in glossary if key)
+    
+    @staticmethod
+    def _glossary_term_pattern(glossary_info: Dict[str, str]) -> str:
+        """Regex source for one glossary term; keep_case terms only match whole words."""
+        term = re.escape(glossary_info['original_source'])
+        return r'\b' + term + r'\b' if glossary_info['keep_case'] else term
+    
+    @classmethod
+    def _compile_glossary(cls, glossary: Dict[str, Dict[str, str]]):
+        """
+        Compile all glossary terms into one case-insensitive alternation.
+        
+        Args:
+            glossary: Glossary dictionary from _load_glossary()
+            
+        Returns:
+            Tuple of (compiled pattern or None, replacement per lowercase term)
+        """
+        if not glossary:
+            return None, {}
+        
+        # Longest terms first, so a term never shadows a longer one that contains it
+        ordered = sorted(glossary, key=len, reverse=True)
+        pattern = re.compile(
+            '|'.join(cls._glossary_term_pattern(glossary[key]) for key in ordered),
+            re.IGNORECASE
+        )
+        
+        # Terms used to be applied one after another, so a target containing a later
+        # term was replaced again; resolve those chains once here instead of per cell
+        keys = list(glossary)
+        targets = {}
+        term_patterns = None  # Compiled on the first chain; re's own cache thrashes beyond 512 terms
+        for index, key in enumerate(keys):
+            target = glossary[key]['target']
+            if pattern.search(target):
+                if term_patterns is None:
+                    term_patterns = [re.compile(cls._glossary_term_pattern(glossary[later_key]), re.IGNORECASE)
+                                     for later_key in keys]
+                for later_key, later_pattern in zip(keys[index + 1:], term_patterns[index + 1:]):
+                    target = later_pattern.sub(lambda match, replacement=glossary[later_key]['target']: replacement,
+                                               target)
+            targets[key] = target
+        
+        return pattern, targets
+    
+    @staticmethod
+    def _build_glossary_automaton(glossary: Dict[str, Dict[str, str]]):
+        """
+        Build an Aho-Corasick automaton over the lowercase glossary terms.
+        
+        Returns:
+            The automaton, or None without pyahocorasick or terms
+        """
+        if not AHOCORASICK_AVAILABLE or not glossary:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for key, glossary_info in glossary.items():
+            automaton.add_word(key, (key, glossary_info['keep_case']))
+        automaton.make_automaton()
+        return automaton
+    
+    @staticmethod
+    def _is_word_boundary(text: str, index: int) -> bool:
+        """Check for a regex-style \\b between text[index - 1] and text[index]."""
+        before = index > 0 and (text[index - 1].isalnum() or text[index - 1] == '_')
+        after = index < len(text) and (text[index].isalnum() or text[index] == '_')
+        return before != after
+    
+    def _apply_glossary_automaton(self, text: str, text_lower: str) -> str:
+        """
+        Replace glossary terms found in one Aho-Corasick scan of the lowercased text.
+        
+        Overlapping hits are resolved like the combined regex: leftmost first,
+        then longest. keep_case terms must start and end on a word boundary.
+        """
+        hits = []  # (start, end, key)
+        for end_index, (key, keep_case) in self._glossary_automaton.iter(text_lower):
+            start, end = end_index - len(key) + 1, end_index + 1
+            if keep_case and not (self._is_word_boundary(text, start) and self._is_word_boundary(text, end)):
+                continue
+            hits.append((start, end, key))
+        if not hits:
+            return text
+        
+        hits.sort(key=lambda hit: (hit[0], hit[0] - hit[1]))
+        parts = []
+        position = 0
+        for start, end, key in hits:
+            if start < position:
+                continue  # Overlaps a term that was already replaced
+            parts.append(text[position:start])
+            parts.append(self._glossary_targets[key])
+            position = end
+        parts.append(text[position:])
+        return ''.join(parts)
+    
     def _apply_glossary_replacements(self, text: str) -> str:
         """Apply glossary term replacements with proper case preservation."""
-        if not self.glossary or not text:
+        if self._glossary_pattern is None or not text:
             return text
         
-        result = text
+        # Most cells hold no term at all; one set check skips the scan for many of them
+        if self._glossary_first_chars.isdisjoint(text.casefold()):
+            return text
         
-        # Apply replacements for each glossary term
-        for source_key, glossary_info in self.glossary.items():
-            target = glossary_info['target']
-            keep_case = glossary_info['keep_case']
-            original_source = glossary_info['original_source']
-            
-            if keep_case:
-                # For keep_case=True, always use the target exactly as specified in glossary
-                # Use regex with word boundaries for accurate matching
-                pattern = re.compile(r'\b' + re.escape(original_source) + r'\b', re.IGNORECASE)
-                result = pattern.sub(target, result)
-            else:
-                # Case-insensitive replacement - replace with exact target
-                # Use regex for case-insensitive replacement
-                pattern = re.compile(re.escape(original_source), re.IGNORECASE)
-                result = pattern.sub(target, result)
+        # The automaton matches on lowercased text, so offsets only line up while lowering keeps the length
+        if self._glossary_automaton is not None:
+            text_lower = text.lower()
+            if len(text_lower) == len(text):
+                return self._apply_glossary_automaton(text, text_lower)
         
-        return result
+        # One scan over the text finds every term
+        targets = self._glossary_targets
+        return self._glossary_pattern.sub(
+            lambda match: targets.get(match.group(0).lower(), match.group(0)), text
+        )
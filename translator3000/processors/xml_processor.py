@@ -7,10 +7,10 @@ Uses BeautifulSoup for HTML content parsing and translation.
 """
 
 import xml.etree.ElementTree as ET
-from xml.dom import minidom
 import logging
+import mmap
 import re
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Set, Tuple
 from pathlib import Path
 from bs4 import BeautifulSoup, NavigableString, Tag, CData
 import html
@@ -19,6 +19,153 @@ from ..config import get_config
 
 logger = logging.getLogger(__name__)
 
+# Matches an ignore="true" attribute (any case, either quote style) in raw tag markup
+IGNORE_ATTRIBUTE_PATTERN = re.compile(r"""\bignore\s*=\s*(["'])true\1""", re.IGNORECASE)
+
+
+def is_ignore_marked(attributes) -> bool:
+    """
+    Check whether an attribute mapping carries ignore="true" (case-insensitive).
+    
+    Args:
+        attributes: Attribute mapping of an ElementTree element or BeautifulSoup tag
+        
+    Returns:
+        True if the element is marked to be skipped during translation
+    """
+    if not attributes:
+        return False
+    for name, value in attributes.items():
+        if name.lower() == 'ignore':
+            return str(value).lower() == 'true'
+    return False
+
+
+CDATA_START = b'<![CDATA['
+CDATA_END = b']]>'
+
+
+def iter_cdata_regions(data):
+    """
+    Yield the byte offsets of every CDATA payload in raw XML.
+    
+    Args:
+        data: Bytes-like XML content (bytes or an mmap)
+        
+    Yields:
+        Tuples of (payload_start, payload_end) byte offsets
+    """
+    pos = 0
+    while True:
+        start = data.find(CDATA_START, pos)
+        if start < 0:
+            return
+        end = data.find(CDATA_END, start + len(CDATA_START))
+        if end < 0:
+            return
+        yield start + len(CDATA_START), end
+        pos = end + len(CDATA_END)
+
+
+def _enclosing_tag_name(data, offset: int) -> Optional[str]:
+    """Return the lowercase name of the start tag that opens right before offset."""
+    pos = offset
+    while True:
+        pos = data.rfind(b'<', 0, pos)
+        if pos < 0:
+            return None
+        if data[pos + 1:pos + 2] not in (b'/', b'!', b'?'):
+            break
+    name_end = pos + 1
+    while data[name_end:name_end + 1] not in (b'', b'>', b'/', b' ', b'\t', b'\r', b'\n'):
+        name_end += 1
+    return data[pos + 1:name_end].decode('utf-8', 'replace').lower() or None
+
+
+def scan_cdata_element_tags(input_file: str) -> Set[str]:
+    """
+    Find the names of the elements whose content is wrapped in CDATA.
+    
+    The file is memory-mapped and searched with bytes.find, so the CDATA
+    payloads themselves are never decoded.
+    
+    Args:
+        input_file: Path to the XML file
+        
+    Returns:
+        Set of lowercase tag names that directly contain a CDATA section
+    """
+    tags = set()
+    with open(input_file, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            return tags
+        with mm:
+            for payload_start, _ in iter_cdata_regions(mm):
+                tag = _enclosing_tag_name(mm, payload_start - len(CDATA_START))
+                if tag:
+                    tags.add(tag)
+    return tags
+
+
+# Tags whose content may be HTML and is wrapped in CDATA on save
+CDATA_WRAP_TAGS = [
+    'Content', 'Description', 'Title', 'Banner', 'Summary', 'Body', 'Text',
+    'Teaser', 'Introduction', 'Conclusion', 'Excerpt', 'Abstract',
+    'Details', 'Info', 'Note', 'Comment', 'Message', 'HTML', 'Image', 'URL'
+]
+
+# A CDATA section in serialized XML
+CDATA_SECTION_PATTERN = re.compile(r'<!\[CDATA\[(.*?)\]\]>', re.DOTALL)
+
+# The only entities ElementTree writes in text content
+SERIALIZER_ENTITIES = {'&amp;': '&', '&lt;': '<', '&gt;': '>'}
+SERIALIZER_ENTITY_PATTERN = re.compile(r'&(?:amp|lt|gt);')
+
+
+def unescape_serialized_text(text: str) -> str:
+    """Undo ElementTree's text escaping in one pass, leaving any other entity (e.g. &nbsp;) as it is."""
+    return SERIALIZER_ENTITY_PATTERN.sub(lambda match: SERIALIZER_ENTITIES[match.group(0)], text)
+
+# Simple HTML content: one opening tag, its text and one closing tag
+SIMPLE_HTML_PATTERN = re.compile(r'^(<[^>]+>)(.*?)(<\/[^>]+>)$', re.DOTALL)
+
+# A tag followed by the text up to the next tag, used by the regex HTML fallback
+TAG_TEXT_PATTERN = re.compile(r'(<[^>]*>)([^<]*)', re.DOTALL)
+
+
+def indent_structure(element, space: str = '    ', level: int = 0, skip_tags: Set[str] = frozenset()):
+    """
+    Indent an ElementTree in place like ET.indent, without touching some subtrees.
+    
+    Args:
+        element: Element whose children are indented
+        space: Whitespace added per indentation level
+        level: Indentation level of element
+        skip_tags: Lowercase tag names whose content is kept exactly as is
+    """
+    # Walk the tree with an explicit stack so deep documents cannot hit the recursion limit
+    stack = [(element, level)]
+    while stack:
+        element, level = stack.pop()
+        if not len(element) or element.tag.lower() in skip_tags:
+            continue
+        
+        child_indentation = '\n' + space * (level + 1)
+        if not element.text or not element.text.strip():
+            element.text = child_indentation
+        
+        for child in element:
+            if not child.tail or not child.tail.strip():
+                child.tail = child_indentation
+            stack.append((child, level + 1))
+        
+        # The last child closes the parent's line at the parent's own level
+        if not child.tail.strip():
+            child.tail = '\n' + space * level
+
 
 class XMLProcessor:
     """Handles XML file translation with BeautifulSoup for robust HTML processing."""
@@ -67,13 +214,14 @@ class XMLProcessor:
             with open(input_file, 'r', encoding='utf-8') as f:
                 raw_xml_content = f.read()
             
-            # Parse the XML file
-            tree = ET.parse(input_file)
-            root = tree.getroot()
+            # Parse the text already in memory instead of reading and decoding the file a second time
+            root = ET.fromstring(raw_xml_content)
+            tree = ET.ElementTree(root)
             
             # Collect all text elements that need translation
             text_elements = []
-            self._collect_text_elements(root, text_elements, raw_xml_content)
+            cdata_tags = scan_cdata_element_tags(input_file)
+            self._collect_text_elements(root, text_elements, cdata_tags)
             
             total_elements = len(text_elements)
             logger.info(f"Found {total_elements} text elements to translate")
@@ -86,6 +234,7 @@ class XMLProcessor:
             
             # Translate elements and apply changes
             success, chars_translated = self._translate_and_apply_robust(text_elements)
+            self.csv_processor.flush_translation_cache()
             
             if not success:
                 logger.error("XML translation failed")
@@ -125,53 +274,70 @@ class XMLProcessor:
         logger.info("Using sequential processing for maximum reliability")
         return self.translate_xml_sequential(input_file, output_file)
 
-    def _collect_text_elements(self, element, text_elements: List, raw_xml: str):
+    def _collect_text_elements(self, element, text_elements: List, cdata_tags: Set[str]):
         """
         Collect all text elements that need translation with robust structure detection.
+        
+        The tree is walked iteratively with an explicit stack, so deep documents
+        cannot hit the recursion limit. Ignore-marked elements are pruned with
+        their whole subtree.
+        
+        Args:
+            element: Root element to collect from
+            text_elements: List the collected elements are appended to
+            cdata_tags: Lowercase tag names that were CDATA-wrapped in the source file
         """
-        # Check if this element should be ignored (case-insensitive)
-        ignore_value = element.get('ignore', '') or element.get('Ignore', '')
-        if ignore_value.lower() == 'true':
-            logger.debug(f"Skipping element marked with ignore=true: {element.tag}")
-            return
+        stack = [element]
+        while stack:
+            element = stack.pop()
             
-        # Process element text content
-        if element.text and element.text.strip():
-            element_path = self._get_element_path(element)
-            element_tag_lower = element.tag.lower()
+            # Check if this element should be ignored (case-insensitive)
+            if is_ignore_marked(element.attrib):
+                logger.debug("Skipping element marked with ignore=true: %s", element.tag)
+                continue
             
-            # Special handling for URL elements
-            if element_tag_lower == 'url':
-                self._handle_url_element(element, text_elements, element_path)
-            else:
-                # Determine content type and collect for translation
-                content_info = self._analyze_content_type(element.text, element_tag_lower, raw_xml)
+            # Strip text and tail once; the stripped values are stored as 'original'
+            text = element.text
+            stripped_text = text.strip() if text else ''
+            tail = element.tail
+            stripped_tail = tail.strip() if tail else ''
+            if stripped_text or stripped_tail:
+                element_path = self._get_element_path(element)
+            
+            # Process element text content
+            if stripped_text:
+                element_tag_lower = element.tag.lower()
+                
+                # Special handling for URL elements
+                if element_tag_lower == 'url':
+                    self._handle_url_element(element, text_elements, element_path)
+                else:
+                    # Determine content type and collect for translation
+                    content_info = self._analyze_content_type(text, element_tag_lower, cdata_tags)
+                    text_elements.append({
+                        'element': element,
+                        'type': 'text',
+                        'original': stripped_text,
+                        'full_text': text,
+                        'element_path': element_path,
+                        'tag': element.tag,
+                        'content_info': content_info
+                    })
+            
+            # Process tail text
+            if stripped_tail:
                 text_elements.append({
                     'element': element,
-                    'type': 'text',
-                    'original': element.text.strip(),
-                    'full_text': element.text,
+                    'type': 'tail',
+                    'original': stripped_tail,
+                    'full_text': tail,
                     'element_path': element_path,
                     'tag': element.tag,
-                    'content_info': content_info
+                    'content_info': {'type': 'plain_text'}
                 })
-        
-        # Process tail text
-        if element.tail and element.tail.strip():
-            element_path = self._get_element_path(element)
-            text_elements.append({
-                'element': element,
-                'type': 'tail',
-                'original': element.tail.strip(),
-                'full_text': element.tail,
-                'element_path': element_path,
-                'tag': element.tag,
-                'content_info': {'type': 'plain_text'}
-            })
-        
-        # Process children recursively
-        for child in element:
-            self._collect_text_elements(child, text_elements, raw_xml)
+            
+            # Children are pushed in reverse so they are visited in document order
+            stack.extend(reversed(element))
 
     def _handle_url_element(self, element, text_elements: List, element_path: str):
         """Handle URL elements with special path structure preservation."""
@@ -204,14 +370,12 @@ class XMLProcessor:
             'content_info': {'type': 'skip'}
         })
 
-    def _analyze_content_type(self, content: str, element_tag: str, raw_xml: str) -> Dict[str, Any]:
+    def _analyze_content_type(self, content: str, element_tag: str, cdata_tags: Set[str]) -> Dict[str, Any]:
         """
         Analyze content to determine the best translation strategy.
         
         Returns detailed information about content type and structure.
         """
-        import re  # Import re for regex operations
-        
         content_info = {
             'type': 'plain_text',
             'has_html': False,
@@ -222,13 +386,9 @@ class XMLProcessor:
             'was_originally_cdata': False  # Track if this was originally in CDATA
         }
         
-        # Check if this element was originally wrapped in CDATA by looking at the raw XML
-        element_pattern = f'<{element_tag}[^>]*>.*?</{element_tag}>'
-        element_matches = re.findall(element_pattern, raw_xml, re.DOTALL | re.IGNORECASE)
-        for match in element_matches:
-            if '<![CDATA[' in match and ']]>' in match:
-                content_info['was_originally_cdata'] = True
-                break
+        # Check if this element was originally wrapped in CDATA (pre-scanned from the raw XML)
+        if element_tag.lower() in cdata_tags:
+            content_info['was_originally_cdata'] = True
         
         # Check for CDATA sections in current content
         if '<![CDATA[' in content and ']]>' in content:
@@ -293,31 +453,46 @@ class XMLProcessor:
     def _translate_and_apply_robust(self, text_elements: List) -> Tuple[bool, int]:
         """
         Translate XML text elements using BeautifulSoup for HTML content.
+        
+        Plain text of the whole document is translated in one batched call;
+        HTML content is translated element by element.
         """
         try:
             total_elements = len(text_elements)
-            total_characters = 0
             
-            for idx, text_data in enumerate(text_elements):
-                if (idx + 1) % self.config['progress_interval'] == 0 or (idx + 1) == total_elements:
-                    logger.info(f"Progress: {idx + 1}/{total_elements} elements processed")
+            # Skip elements marked for no translation
+            text_elements = [text_data for text_data in text_elements if text_data['type'] != 'skip']
+            total_characters = sum(len(text_data['original']) for text_data in text_elements)
+            
+            plain_elements = [
+                text_data for text_data in text_elements
+                if self._is_plain_content(text_data.get('content_info', {}))
+            ]
+            if plain_elements:
+                logger.info("Translating %d plain text elements in batches", len(plain_elements))
+                translated_plain = self.csv_processor.translate_texts(
+                    [text_data['original'] for text_data in plain_elements]
+                )
+                for text_data, translated in zip(plain_elements, translated_plain):
+                    if translated and translated != text_data['original']:
+                        self._apply_translation_to_element(text_data, translated)
+            
+            html_elements = [
+                text_data for text_data in text_elements
+                if not self._is_plain_content(text_data.get('content_info', {}))
+            ]
+            # Progress is logged every 10% of the HTML elements, not per element
+            progress_step = max(1, len(html_elements) // 10)
+            for idx, text_data in enumerate(html_elements):
+                if (idx + 1) % progress_step == 0 or (idx + 1) == len(html_elements):
+                    logger.info("Progress: %d/%d HTML elements processed", idx + 1, len(html_elements))
                 
                 original_text = text_data['original']
-                element_type = text_data['type']
-                element = text_data['element']
-                content_info = text_data.get('content_info', {})
-                
-                # Skip elements marked for no translation
-                if element_type == 'skip':
-                    continue
-                
-                # Count characters for non-skipped elements
-                total_characters += len(original_text)
                 
                 # Perform translation based on content type
                 translated = self._translate_content_robust(
                     original_text, 
-                    content_info, 
+                    text_data.get('content_info', {}), 
                     text_data.get('element_path', ''),
                     text_data.get('tag', '')
                 )
@@ -326,13 +501,19 @@ class XMLProcessor:
                 if translated and translated != original_text:
                     self._apply_translation_to_element(text_data, translated)
    
-            logger.info(f"Robust XML translation completed")
+            logger.info(f"Robust XML translation completed ({total_elements} elements)")
             return True, total_characters
             
         except Exception as e:
             logger.error(f"Robust XML translation failed: {e}")
             return False, 0
 
+    @staticmethod
+    def _is_plain_content(content_info: Dict) -> bool:
+        """Check if content is translated as plain text, i.e. without BeautifulSoup."""
+        content_type = content_info.get('type', 'plain_text')
+        return content_type in ('plain_text', 'url_path') or not content_info.get('needs_soup', False)
+
     def _translate_content_robust(self, content: str, content_info: Dict, element_path: str, tag: str) -> str:
         """
         Translate content using the most appropriate method based on content analysis.
@@ -418,53 +599,45 @@ class XMLProcessor:
 
     def _translate_soup_text_nodes(self, soup):
         """
-        Recursively translate all text nodes in a BeautifulSoup object while preserving structure.
+        Translate all text nodes in a BeautifulSoup object while preserving structure.
+        
+        The nodes are collected first and their texts sent in one batch.
         """
-        for element in soup.descendants:
-            if isinstance(element, NavigableString) and not isinstance(element, CData):
-                original_text = element.string
+        # Walk the tree, pruning ignore-marked subtrees before descending into them.
+        # Only meaningful text is kept: (node, original text, stripped text)
+        text_nodes = []
+        stack = [soup]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, Tag):
+                if is_ignore_marked(node.attrs):
+                    logger.debug("Skipping subtree due to ignore attribute: <%s>", node.name)
+                    continue
+                stack.extend(reversed(node.contents))
+            elif isinstance(node, NavigableString) and not isinstance(node, CData):
+                original_text = str(node)
                 text_content = original_text.strip()
-                
-                if text_content and len(text_content) > 1:  # Only translate meaningful text
-                    # Check if this text node or any parent has ignore attribute
-                    should_ignore = False
-                    current = element.parent
-                    
-                    while current and isinstance(current, Tag):
-                        # Check for ignore attribute (case-insensitive)
-                        ignore_value = current.get('ignore', '') or current.get('Ignore', '')
-                        if ignore_value.lower() == 'true':
-                            should_ignore = True
-                            break
-                        current = current.parent
-                    
-                    if should_ignore:
-                        logger.debug(f"Skipping translation due to ignore attribute: {text_content[:50]}")
-                        continue  # Skip translation for ignored elements
-                    
-                    # Translate the text
-                    try:
-                        translated = self.csv_processor.translate_text(text_content)
-                        if translated and translated != text_content:
-                            # IMPROVED: Preserve surrounding whitespace more accurately
-                            leading_space = ''
-                            trailing_space = ''
-                            
-                            # Extract leading whitespace - find where content starts
-                            content_start = original_text.find(text_content)
-                            if content_start > 0:
-                                leading_space = original_text[:content_start]
-                            
-                            # Extract trailing whitespace - find where content ends
-                            content_end = content_start + len(text_content)
-                            if content_end < len(original_text):
-                                trailing_space = original_text[content_end:]
-                            
-                            # Replace with translated text preserving exact whitespace
-                            new_text = leading_space + translated + trailing_space
-                            element.replace_with(new_text)
-                    except Exception as e:
-                        logger.warning(f"Failed to translate text node: {e}")
+                if len(text_content) > 1:
+                    text_nodes.append((node, original_text, text_content))
+        
+        if not text_nodes:
+            return
+        
+        unique_texts = list(dict.fromkeys(text_content for _, _, text_content in text_nodes))
+        try:
+            translated_by_text = dict(zip(unique_texts, self.csv_processor.translate_texts(unique_texts)))
+        except Exception as e:
+            logger.warning(f"Failed to translate text nodes: {e}")
+            return
+        
+        for element, original_text, text_content in text_nodes:
+            translated = translated_by_text[text_content]
+            if translated and translated != text_content:
+                # Keep the whitespace around the text exactly as it was
+                content_start = original_text.find(text_content)
+                leading_space = original_text[:content_start]
+                trailing_space = original_text[content_start + len(text_content):]
+                element.replace_with(leading_space + translated + trailing_space)
 
     def _is_simple_single_tag(self, content: str) -> bool:
         """Check if content is a simple single HTML tag."""
@@ -481,10 +654,7 @@ class XMLProcessor:
 
     def _translate_simple_html(self, content: str, content_info: Dict) -> str:
         """Translate simple HTML content with a single tag pair."""
-        import re
-        
-        pattern = re.compile(r'^(<[^>]+>)(.*?)(<\/[^>]+>)$', re.DOTALL)
-        match = pattern.match(content.strip())
+        match = SIMPLE_HTML_PATTERN.match(content.strip())
         
         if match:
             opening_tag = match.group(1)
@@ -505,42 +675,38 @@ class XMLProcessor:
 
     def _translate_html_fallback(self, content: str, content_info: Dict) -> str:
         """Fallback HTML translation using regex when BeautifulSoup fails."""
-        import re
-        
         # Enhanced pattern to match complete tag structures with content
         def should_translate_tag_content(preceding_tag):
             """Check if content within a tag should be translated."""
             # Look for ignore attribute in the preceding tag (case-insensitive)
-            if ('ignore="true"' in preceding_tag.lower() or "ignore='true'" in preceding_tag.lower() or
-                'Ignore="True"' in preceding_tag or "Ignore='True'" in preceding_tag):
-                return False
-            return True
+            return not IGNORE_ATTRIBUTE_PATTERN.search(preceding_tag)
         
-        # Pattern to match tag followed by text content
-        pattern = re.compile(r'(<[^>]*>)([^<]*)', re.DOTALL)
+        # Collect the text after every tag first, so all of it is translated in one batch
+        texts = list(dict.fromkeys(
+            match.group(2).strip() for match in TAG_TEXT_PATTERN.finditer(content)
+            if match.group(2).strip() and should_translate_tag_content(match.group(1))
+        ))
+        translated_by_text = dict(zip(texts, self.csv_processor.translate_texts(texts)))
         
         def translate_match(match):
             html_tag = match.group(1)  # The HTML tag
             text_content = match.group(2)  # The text content
+            stripped = text_content.strip()
             
-            # Check if the tag has ignore attribute
-            if not should_translate_tag_content(html_tag):
-                return match.group(0)  # Don't translate ignored content
-            
-            # Only translate non-empty content
-            if text_content and text_content.strip():
-                translated = self.csv_processor.translate_text(text_content.strip())
-                # Preserve whitespace structure
-                if text_content.startswith(' '):
-                    return html_tag + ' ' + translated + text_content[len(text_content.strip())+1:]
-                elif text_content.endswith(' '):
-                    return html_tag + translated + ' '
-                else:
-                    return html_tag + translated
+            # Ignored and empty content is kept unchanged
+            if stripped not in translated_by_text or not should_translate_tag_content(html_tag):
+                return match.group(0)
             
-            return match.group(0)  # Keep empty content unchanged
+            translated = translated_by_text[stripped]
+            # Preserve whitespace structure
+            if text_content.startswith(' '):
+                return html_tag + ' ' + translated + text_content[len(stripped)+1:]
+            elif text_content.endswith(' '):
+                return html_tag + translated + ' '
+            else:
+                return html_tag + translated
         
-        result = pattern.sub(translate_match, content)
+        result = TAG_TEXT_PATTERN.sub(translate_match, content)
         
         # Don't wrap in CDATA here - let the XML saving process handle it
         if content_info.get('has_entities'):
@@ -588,21 +754,15 @@ class XMLProcessor:
                 # Just set it directly - the _ensure_proper_cdata_wrapping will handle it
                 element.text = translated
             else:
-                # Preserve whitespace structure for regular text
-                if full_text.startswith(' ') or full_text.startswith('\n'):
-                    # Find leading whitespace
-                    leading_ws = ''
-                    for char in full_text:
-                        if char.isspace():
-                            leading_ws += char
-                        else:
-                            break
+                # Preserve leading whitespace for regular text
+                if full_text != original_text:
+                    leading_ws = full_text[:len(full_text) - len(full_text.lstrip())]
                     element.text = leading_ws + translated
                 else:
                     element.text = translated
         elif element_type == 'tail':
             # Replace tail text preserving whitespace
-            if full_text.startswith(' ') or full_text.startswith('\n'):
+            if full_text != original_text:
                 element.tail = full_text.replace(original_text, translated)
             else:
                 element.tail = translated
@@ -622,40 +782,28 @@ class XMLProcessor:
     def _save_xml_with_structure_preservation(self, tree, output_file: str, original_raw_xml: str):
         """
         Save XML with maximum structure preservation including CDATA, formatting, and encoding.
+        
+        The tree is indented in place and serialized once; there is no second
+        parse for pretty printing, and mixed content keeps its text.
         """
         try:
-            # Generate the new XML content
+            # Indent whitespace-only text and tails in place, then serialize once.
+            # Content that may become CDATA keeps its inner markup unindented.
+            indent_structure(tree.getroot(), skip_tags={tag.lower() for tag in CDATA_WRAP_TAGS})
             xml_string = ET.tostring(tree.getroot(), encoding='utf-8', method='xml').decode('utf-8')
+            # Keep the compact empty-element form; '>' in text and attributes is always escaped
+            xml_string = xml_string.replace(' />', '/>')
             
             # Process and wrap HTML content in CDATA where appropriate
             processed_xml = self._ensure_proper_cdata_wrapping(xml_string, original_raw_xml)
             
-            # Pretty print the XML
-            try:
-                dom = minidom.parseString(f'<?xml version="1.0" encoding="utf-8"?>\n{processed_xml}')
-                pretty_xml = dom.toprettyxml(indent='    ', encoding='utf-8').decode('utf-8')
-                
-                # Fix HTML entity escaping inside CDATA sections
-                # minidom incorrectly escapes & to &amp; even inside CDATA
-                pretty_xml = self._fix_cdata_escaping(pretty_xml)
-                
-                # Clean up excessive whitespace from minidom
-                lines = []
-                for line in pretty_xml.split('\n'):
-                    if line.strip():
-                        lines.append(line)
-                
-                # Write to file
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write('\n'.join(lines))
-                    f.write('\n')
-                    
-            except Exception as pretty_error:
-                logger.warning(f"Pretty printing failed: {pretty_error}")
-                # Fallback to direct write
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write('<?xml version="1.0" encoding="utf-8"?>\n')
-                    f.write(processed_xml)
+            # Wrapped content may still carry entities escaped by the serializer
+            processed_xml = self._fix_cdata_escaping(processed_xml)
+            
+            with open(output_file, 'w', encoding='utf-8') as f:
+                f.write('<?xml version="1.0" encoding="utf-8"?>\n')
+                f.write(processed_xml)
+                f.write('\n')
         
         except Exception as e:
             logger.error(f"XML saving failed: {e}")
@@ -665,37 +813,31 @@ class XMLProcessor:
     def _fix_cdata_escaping(self, xml_content: str) -> str:
         """
         Fix HTML entity escaping that occurs inside CDATA sections.
-        minidom incorrectly escapes & to &amp; even inside CDATA.
+        Text wrapped in CDATA after serialization still has & escaped as &amp;.
         """
-        import re
-        
-        # Pattern to match CDATA sections
-        cdata_pattern = re.compile(r'<!\[CDATA\[(.*?)\]\]>', re.DOTALL)
-        
         def fix_cdata_content(match):
+            # Undo the serializer's escaping in one pass; sections without entities are kept as they are
             cdata_content = match.group(1)
-            # Unescape HTML entities that were incorrectly escaped by minidom
-            fixed_content = cdata_content.replace('&amp;', '&').replace('&lt;', '<').replace('&gt;', '>')
-            return f'<![CDATA[{fixed_content}]]>'
+            if '&' not in cdata_content:
+                return match.group(0)
+            return f'<![CDATA[{unescape_serialized_text(cdata_content)}]]>'
         
-        return cdata_pattern.sub(fix_cdata_content, xml_content)
+        return CDATA_SECTION_PATTERN.sub(fix_cdata_content, xml_content)
 
     def _ensure_proper_cdata_wrapping(self, xml_string: str, original_xml: str) -> str:
         """
         Ensure HTML content is properly wrapped in CDATA sections based on original structure.
         Never add CDATA to empty or whitespace-only content.
         """
-        import re
+        original_cache = {}  # tag -> its elements in the original XML, found once per tag
         
-        # Tags that typically contain HTML and should be wrapped in CDATA
-        # Include ALL possible HTML-containing elements
-        html_tags = [
-            'Content', 'Description', 'Title', 'Banner', 'Summary', 'Body', 'Text',
-            'Teaser', 'Introduction', 'Conclusion', 'Excerpt', 'Abstract',
-            'Details', 'Info', 'Note', 'Comment', 'Message', 'HTML', 'Image', 'URL'
-        ]
+        def original_elements(tag):
+            if tag not in original_cache:
+                original_cache[tag] = re.findall(f'<{tag}[^>]*>.*?</{tag}\\s*>', original_xml, re.DOTALL | re.IGNORECASE)
+            return original_cache[tag]
         
-        for tag in html_tags:
+        # Tags that typically contain HTML and should be wrapped in CDATA
+        for tag in CDATA_WRAP_TAGS:
             # CRITICAL: Skip self-closing tags completely to prevent malformed XML
             # First, check for and skip self-closing tags
             self_closing_pattern = re.compile(f'<{tag}([^>]*?)/>', re.IGNORECASE)
@@ -724,8 +866,7 @@ class XMLProcessor:
                     return match.group(0)
                 
                 # Check if element has ignore attribute (case-insensitive)
-                if ('ignore="true"' in attributes.lower() or "ignore='true'" in attributes.lower() or
-                    'Ignore="True"' in attributes or "Ignore='True'" in attributes):
+                if IGNORE_ATTRIBUTE_PATTERN.search(attributes):
                     # For ignored elements, preserve CDATA exactly as is, but drop if empty
                     if '<![CDATA[' in content and ']]>' in content:
                         cdata_content = self._extract_cdata_content(content)
@@ -735,9 +876,7 @@ class XMLProcessor:
                         return match.group(0)  # Keep existing CDATA if not empty
                     else:
                         # If original had CDATA but content is not empty, restore it
-                        original_pattern = f'<{tag}[^>]*>.*?</{tag}\\s*>'
-                        original_matches = re.findall(original_pattern, original_xml, re.DOTALL | re.IGNORECASE)
-                        for orig_match in original_matches:
+                        for orig_match in original_elements(tag):
                             if attributes.strip() in orig_match and '<![CDATA[' in orig_match:
                                 if content.strip():  # Only restore if content is not empty
                                     return f'<{tag}{attributes}><![CDATA[{content}]]></{tag}>'
@@ -758,15 +897,13 @@ class XMLProcessor:
                     
                     # If content has escaped HTML entities, unescape them first
                     if '&lt;' in content and '&gt;' in content:
-                        content = content.replace('&lt;', '<').replace('&gt;', '>').replace('&amp;', '&')
+                        content = unescape_serialized_text(content)
                     
                     return f'<{tag}{attributes}><![CDATA[{content}]]></{tag}>'
                 
                 # Check if this element originally had CDATA (even without HTML)
                 # This handles cases like URLs in Image elements
-                original_pattern = f'<{tag}[^>]*>.*?</{tag}\\s*>'
-                original_matches = re.findall(original_pattern, original_xml, re.DOTALL | re.IGNORECASE)
-                for orig_match in original_matches:
+                for orig_match in original_elements(tag):
                     if attributes.strip() in orig_match and '<![CDATA[' in orig_match:
                         # Original had CDATA, so restore it to prevent HTML escaping
                         return f'<{tag}{attributes}><![CDATA[{content}]]></{tag}>'
@@ -6,7 +6,6 @@ and supporting multithreaded processing for performance.
 """
 
 import xml.etree.ElementTree as ET
-from xml.dom import minidom
 import logging
 import threading
 import concurrent.futures
@@ -15,9 +14,13 @@ from typing import List, Dict, Any, Optional
 from pathlib import Path
 
 from ..config import get_config
+from .xml_processor import indent_structure
 
 logger = logging.getLogger(__name__)
 
+# Lowercase tags whose content is wrapped in CDATA on save
+HTML_CONTENT_TAGS = {'content', 'title', 'description', 'url'}
+
 
 class XMLProcessor:
     """Handles XML file translation with structure preservation."""
@@ -181,81 +184,85 @@ class XMLProcessor:
 
     def _collect_text_elements(self, element, text_elements: List):
         """Collect all text elements that need translation."""
-        # Special handling for elements with CDATA that contain HTML
-        if element.text and element.text.strip():
-            # Get the element path to help identify specific elements
-            element_path = self._get_element_path(element)
-            
-            # Special handling for URL elements - preserve the path structure
-            if element.tag == 'Url':
-                # URLs should be handled specially to maintain their structure
-                url_text = element.text.strip()
-                if url_text.startswith('/'):
-                    # This is a path URL, only translate the parts after the language code
-                    parts = url_text.split('/')
-                    if len(parts) > 2:  # Has at least /en/something
-                        # Replace the language code with a placeholder
-                        lang_code = parts[1].lower()
-                        if lang_code in ('en', 'de', 'fr', 'es', 'it', 'da', 'sv', 'nb', 'nl'):
-                            # Collect for translation with special handling
-                            text_elements.append({
-                                'element': element,
-                                'type': 'url',
-                                'original': '/'.join(parts[2:]),  # Collect everything after language code
-                                'full_text': element.text,
-                                'element_path': element_path,
-                                'tag': element.tag,
-                                'prefix': f'/{lang_code}/'  # Store the prefix to restore later
-                            })
-                            return  # Skip normal text processing for URLs
-            
-            # Check if this is likely HTML content (common in CDATA sections)
-            is_html = False
-            if '<' in element.text and '>' in element.text:
-                # Raw HTML tags
-                is_html = True
-            elif '&lt;' in element.text and '&gt;' in element.text:
-                # Escaped HTML entities
-                is_html = True
-            
-            if is_html:
-                # Store the element with special type for HTML/CDATA handling
-                text_elements.append({
-                    'element': element,
-                    'type': 'html_content',  # Special marker for HTML content
-                    'original': element.text.strip(),
-                    'full_text': element.text,
-                    'element_path': element_path,  # Store element path for context
-                    'tag': element.tag,  # Store the element tag
-                    'is_simple_html': self._is_simple_html_content(element.text.strip()),  # Flag for simple HTML
-                    'has_entities': '&lt;' in element.text and '&gt;' in element.text  # Track if it contains HTML entities
-                })
-            else:
-                # Regular text content
+        # Walk the tree with an explicit stack so deep documents cannot hit the recursion limit
+        stack = [element]
+        while stack:
+            element = stack.pop()
+            
+            # Special handling for elements with CDATA that contain HTML
+            if element.text and element.text.strip():
+                # Get the element path to help identify specific elements
+                element_path = self._get_element_path(element)
+            
+                # Special handling for URL elements - preserve the path structure
+                if element.tag == 'Url':
+                    # URLs should be handled specially to maintain their structure
+                    url_text = element.text.strip()
+                    if url_text.startswith('/'):
+                        # This is a path URL, only translate the parts after the language code
+                        parts = url_text.split('/')
+                        if len(parts) > 2:  # Has at least /en/something
+                            # Replace the language code with a placeholder
+                            lang_code = parts[1].lower()
+                            if lang_code in ('en', 'de', 'fr', 'es', 'it', 'da', 'sv', 'nb', 'nl'):
+                                # Collect for translation with special handling
+                                text_elements.append({
+                                    'element': element,
+                                    'type': 'url',
+                                    'original': '/'.join(parts[2:]),  # Collect everything after language code
+                                    'full_text': element.text,
+                                    'element_path': element_path,
+                                    'tag': element.tag,
+                                    'prefix': f'/{lang_code}/'  # Store the prefix to restore later
+                                })
+                                continue  # Skip normal text processing for URLs
+            
+                # Check if this is likely HTML content (common in CDATA sections)
+                is_html = False
+                if '<' in element.text and '>' in element.text:
+                    # Raw HTML tags
+                    is_html = True
+                elif '&lt;' in element.text and '&gt;' in element.text:
+                    # Escaped HTML entities
+                    is_html = True
+            
+                if is_html:
+                    # Store the element with special type for HTML/CDATA handling
+                    text_elements.append({
+                        'element': element,
+                        'type': 'html_content',  # Special marker for HTML content
+                        'original': element.text.strip(),
+                        'full_text': element.text,
+                        'element_path': element_path,  # Store element path for context
+                        'tag': element.tag,  # Store the element tag
+                        'is_simple_html': self._is_simple_html_content(element.text.strip()),  # Flag for simple HTML
+                        'has_entities': '&lt;' in element.text and '&gt;' in element.text  # Track if it contains HTML entities
+                    })
+                else:
+                    # Regular text content
+                    text_elements.append({
+                        'element': element,
+                        'type': 'text',
+                        'original': element.text.strip(),
+                        'full_text': element.text,
+                        'element_path': element_path,  # Store element path for context
+                        'tag': element.tag  # Store the element tag
+                    })
+        
+            # Collect tail text
+            if element.tail and element.tail.strip():
+                element_path = self._get_element_path(element)
                 text_elements.append({
                     'element': element,
-                    'type': 'text',
-                    'original': element.text.strip(),
-                    'full_text': element.text,
+                    'type': 'tail',
+                    'original': element.tail.strip(),
+                    'full_text': element.tail,
                     'element_path': element_path,  # Store element path for context
                     'tag': element.tag  # Store the element tag
                 })
         
-        # Collect tail text
-        if element.tail and element.tail.strip():
-            element_path = self._get_element_path(element)
-            text_elements.append({
-                'element': element,
-                'type': 'tail',
-                'original': element.tail.strip(),
-                'full_text': element.tail,
-                'element_path': element_path,  # Store element path for context
-                'tag': element.tag  # Store the element tag
-            })
-        
-        # Process children recursively
-        for child in element:
-            self._collect_text_elements(child, text_elements)
+            # Children are pushed in reverse so they are visited in document order
+            stack.extend(reversed(element))
 
     def _translate_xml_elements_multithreaded(self, text_elements: List, max_workers: int) -> tuple[bool, int]:
         """Translate XML text elements using multithreading."""
@@ -533,33 +540,19 @@ class XMLProcessor:
         that character encoding is preserved correctly.
         """
         try:
-            # Create a string representation of the XML with proper encoding
+            # Indent in place and serialize once; HTML-bearing tags keep their markup as is
+            indent_structure(tree.getroot(), skip_tags=HTML_CONTENT_TAGS)
             xml_string = ET.tostring(tree.getroot(), encoding='utf-8', method='xml').decode('utf-8')
+            xml_string = xml_string.replace(' />', '/>')
             
             # Process all tags that might contain HTML and wrap them in CDATA
             processed_xml = self._process_all_html_content(xml_string)
             
-            try:
-                # Parse the processed XML for pretty printing
-                dom = minidom.parseString(f'<?xml version="1.0" encoding="utf-8" ?>{processed_xml}')
-                pretty_xml = dom.toprettyxml(indent='    ', encoding='utf-8').decode('utf-8')
-                
-                # Clean up extra whitespace that minidom adds
-                lines = []
-                for line in pretty_xml.split('\n'):
-                    if line.strip():  # Only keep non-empty lines
-                        lines.append(line)
-                
-                # Write to file with explicit UTF-8 encoding
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write('\n'.join(lines))
-                    f.write('\n')  # End with newline
-            except Exception as pretty_error:
-                logger.warning(f"Pretty printing failed: {pretty_error}. Writing processed XML directly.")
-                # Fallback to direct write of processed XML
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write('<?xml version="1.0" encoding="utf-8" ?>\n')
-                    f.write(processed_xml)
+            # Write to file with explicit UTF-8 encoding
+            with open(output_file, 'w', encoding='utf-8') as f:
+                f.write('<?xml version="1.0" encoding="utf-8"?>\n')
+                f.write(processed_xml)
+                f.write('\n')  # End with newline
         
         except Exception as e:
             logger.error(f"XML saving failed: {e}. Using basic output.")
@@ -5,14 +5,20 @@ This package contains all the translation service implementations with a clean,
 modular architecture for easy maintenance and extension.
 """
 
-from .base import BaseTranslationService
+from .base import BaseTranslationService, RateLimitError
 from .libre_translate import LibreTranslateService, is_libretranslate_selfhost_available
 from .google_translate import DeepTranslatorService, GoogleTransService
+from .translation_cache import TranslationCache, MemoCache
+from .rate_limiter import TokenBucket
 
 __all__ = [
     'BaseTranslationService',
+    'RateLimitError',
     'LibreTranslateService', 
     'DeepTranslatorService',
     'GoogleTransService', 
+    'TranslationCache',
+    'MemoCache',
+    'TokenBucket',
     'is_libretranslate_selfhost_available'
 ]
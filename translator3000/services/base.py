@@ -5,7 +5,11 @@ This module defines the common interface that all translation services must impl
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional
+
+
+class RateLimitError(Exception):
+    """Raised by a service when the provider is throttling requests (HTTP 429)."""
 
 
 class BaseTranslationService(ABC):
@@ -29,6 +33,18 @@ class BaseTranslationService(ABC):
         """
         pass
     
+    def translate_batch(self, texts: List[str]) -> List[Optional[str]]:
+        """
+        Translate several texts; services with a batch endpoint override this.
+        
+        Args:
+            texts: Texts to translate
+            
+        Returns:
+            Translations in input order, None for each text that failed
+        """
+        return [self.translate(text) for text in texts]
+    
     @abstractmethod
     def is_available(self) -> bool:
         """
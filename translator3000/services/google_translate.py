@@ -7,7 +7,7 @@ implementations with version compatibility handling.
 
 import asyncio
 import logging
-from typing import Optional
+from typing import List, Optional
 
 from .base import BaseTranslationService
 
@@ -45,6 +45,14 @@ class DeepTranslatorService(BaseTranslationService):
         except Exception as e:
             logger.warning(f"DeepTranslator error: {e}")
             return None
+    
+    def translate_batch(self, texts: List[str]) -> List[Optional[str]]:
+        """Translate several texts using deep-translator's batch API."""
+        try:
+            return self.translator.translate_batch([text.strip() for text in texts])
+        except Exception as e:
+            logger.warning(f"DeepTranslator batch error: {e}")
+            return [None] * len(texts)
 
 
 class GoogleTransService(BaseTranslationService):
@@ -71,6 +79,10 @@ class GoogleTransService(BaseTranslationService):
             self.translator = Translator()
         
         self.is_4x = major_version >= 4
+        
+        # Bind the language pair once so translate() is a single call per text
+        translator, src, dest = self.translator, source_lang, target_lang
+        self._do_translate = lambda text: translator.translate(text, src=src, dest=dest)
     
     def is_available(self) -> bool:
         """Check if googletrans library is available."""
@@ -86,13 +98,8 @@ class GoogleTransService(BaseTranslationService):
             return text
         
         try:
-            if self.is_4x:
-                # Use wrapper for 4.x
-                result = self.translator.translate(text.strip(), src=self.source_lang, dest=self.target_lang)
-            else:
-                # Use directly for 3.x
-                result = self.translator.translate(text.strip(), src=self.source_lang, dest=self.target_lang)
-            
+            # The 4.x wrapper and the 3.x Translator share the same translate signature
+            result = self._do_translate(text.strip())
             return result.text if hasattr(result, 'text') else str(result)
         except Exception as e:
             logger.warning(f"GoogleTrans error: {e}")
@@ -6,25 +6,63 @@ and automatic URL selection for optimal performance.
 """
 
 import logging
-from typing import Optional
+import socket
+import threading
+import time
+from typing import List, Optional
+from urllib.parse import urlparse
 
-from .base import BaseTranslationService
+from .base import BaseTranslationService, RateLimitError
 from ..config import get_config
 
 logger = logging.getLogger(__name__)
 
+# Seconds a self-hosted availability check is reused before probing again
+SELFHOST_CHECK_TTL = 60
+
+# selfhost_url -> (checked_at, available)
+_selfhost_checks = {}
+_selfhost_checks_lock = threading.Lock()
+
 
 def is_libretranslate_selfhost_available() -> bool:
-    """Check if LibreTranslate is running on self-hosted server."""
+    """
+    Check if LibreTranslate is running on self-hosted server.
+    
+    The result is cached per URL for SELFHOST_CHECK_TTL seconds, so the
+    several services built for one translator share a single probe.
+    """
     config = get_config()
     
     if not config.get('libretranslate_selfhost_enabled', True):
         return False
+    
+    selfhost_url = config.get('libretranslate_selfhost_url', 'http://localhost:5000/translate')
+    with _selfhost_checks_lock:
+        now = time.monotonic()
+        cached = _selfhost_checks.get(selfhost_url)
+        if cached and now - cached[0] < SELFHOST_CHECK_TTL:
+            return cached[1]
         
+        available = _check_libretranslate_selfhost(selfhost_url, config.get('libretranslate_selfhost_timeout', 2))
+        _selfhost_checks[selfhost_url] = (now, available)
+        return available
+
+
+def _check_libretranslate_selfhost(selfhost_url: str, timeout: float) -> bool:
+    """Probe a self-hosted LibreTranslate URL: TCP connect first, then an HTTP check."""
+    try:
+        # A refused TCP connect answers the common "not running" case without an HTTP request
+        parsed = urlparse(selfhost_url)
+        port = parsed.port or (443 if parsed.scheme == 'https' else 80)
+        with socket.create_connection((parsed.hostname, port), timeout=timeout):
+            pass
+    except (OSError, ValueError) as e:
+        logger.debug(f"selfhost LibreTranslate not reachable: {e}")
+        return False
+    
     try:
         import requests
-        selfhost_url = config.get('libretranslate_selfhost_url', 'http://localhost:5000/translate')
-        timeout = config.get('libretranslate_selfhost_timeout', 2)
         
         # Extract base URL for health check
         if '/translate' in selfhost_url:
@@ -76,6 +114,23 @@ class LibreTranslateService(BaseTranslationService):
         # Validate that requests is available
         if not self.is_available():
             raise ImportError("LibreTranslate requires the 'requests' library")
+        
+        # Reuse one pooled session so concurrent workers share keep-alive connections
+        self.session = self._create_session()
+    
+    def _create_session(self):
+        """Create an HTTP session with a connection pool sized for the worker threads."""
+        import requests
+        from requests.adapters import HTTPAdapter
+        
+        config = get_config()
+        pool_size = max(config.get('csv_max_workers', 6), config.get('xml_max_workers', 6))
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        
+        session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
     
     def is_available(self) -> bool:
         """Check if LibreTranslate service is available."""
@@ -85,13 +140,10 @@ class LibreTranslateService(BaseTranslationService):
         except ImportError:
             return False
     
-    def translate(self, text: str) -> Optional[str]:
-        """Translate text using LibreTranslate API."""
-        if not text or not text.strip():
-            return text
-            
+    def _post(self, q):
+        """Send a translation request for a string or a list of strings and return translatedText."""
         payload = {
-            "q": text.strip(),
+            "q": q,
             "source": self.source_lang,
             "target": self.target_lang
         }
@@ -102,28 +154,55 @@ class LibreTranslateService(BaseTranslationService):
         if self.api_key:
             payload["api_key"] = self.api_key
         
+        response = self.session.post(self.api_url, json=payload, headers=headers, timeout=10)
+        
+        if response.status_code == 429:
+            raise RateLimitError("Rate limit exceeded (HTTP 429) - consider using an API key")
+        elif response.status_code == 403:
+            raise Exception("Access forbidden - check API key")
+        elif response.status_code != 200:
+            raise Exception(f"HTTP {response.status_code}: {response.text}")
+        
+        result = response.json()
+        if 'translatedText' in result:
+            return result['translatedText']
+        else:
+            raise Exception(f"Unexpected response format: {result}")
+    
+    def _log_error(self, e: Exception):
+        """Log a failed request with a hint matching the failure."""
+        if "requests" in str(e).lower():
+            logger.error("LibreTranslate requires requests library")
+        else:
+            logger.warning(f"LibreTranslate API error: {e}")
+    
+    def translate(self, text: str) -> Optional[str]:
+        """Translate text using LibreTranslate API; throttling raises RateLimitError so the caller can back off."""
+        if not text or not text.strip():
+            return text
+        
         try:
-            import requests
-            response = requests.post(self.api_url, json=payload, headers=headers, timeout=10)
-            
-            if response.status_code == 429:
-                raise Exception("Rate limit exceeded - consider using an API key")
-            elif response.status_code == 403:
-                raise Exception("Access forbidden - check API key")
-            elif response.status_code != 200:
-                raise Exception(f"HTTP {response.status_code}: {response.text}")
-            
-            result = response.json()
-            if 'translatedText' in result:
-                return result['translatedText']
-            else:
-                raise Exception(f"Unexpected response format: {result}")
-                
+            return self._post(text.strip())
+        except RateLimitError:
+            raise
         except Exception as e:
-            if "Rate limit" in str(e) or "429" in str(e):
-                logger.warning("LibreTranslate rate limit hit - falling back to next service")
-            elif "requests" in str(e).lower():
-                logger.error("LibreTranslate requires requests library")
-            else:
-                logger.warning(f"LibreTranslate API error: {e}")
+            self._log_error(e)
             return None
+    
+    def translate_batch(self, texts: List[str]) -> List[Optional[str]]:
+        """Translate several texts with a single LibreTranslate request (the API accepts a list for q)."""
+        if not texts:
+            return []
+        
+        try:
+            translated = self._post([text.strip() for text in texts])
+        except RateLimitError:
+            raise
+        except Exception as e:
+            self._log_error(e)
+            return [None] * len(texts)
+        
+        if not isinstance(translated, list) or len(translated) != len(texts):
+            logger.warning("LibreTranslate batch response did not match the request size")
+            return [None] * len(texts)
+        return translated
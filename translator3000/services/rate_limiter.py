@@ -0,0 +1,46 @@
+"""
+Request rate limiting for Translator3000.
+
+This module provides a token bucket shared by all worker threads, so the
+configured request rate holds across the whole process instead of each
+worker sleeping a fixed delay after every request.
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket allowing `rate` requests per second with bursts of `capacity`."""
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """
+        Create a full bucket.
+
+        Args:
+            rate: Tokens added per second; 0 or less disables limiting
+            capacity: Maximum number of tokens that can be stored (burst size)
+        """
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self.tokens = self.capacity
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until one is available."""
+        if self.rate <= 0:
+            return
+
+        with self.lock:
+            now = time.monotonic()
+            # Time spent waiting on the network refills the bucket, so slow requests never sleep
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+
+            # Reserve the token now; a negative balance makes later callers queue up behind it
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
@@ -0,0 +1,173 @@
+"""
+Persistent translation cache for Translator3000.
+
+This module stores finished translations in a small SQLite database so that
+text which was already translated (in this run or a previous one) never has
+to go over the network again.
+"""
+
+import atexit
+import hashlib
+import logging
+import sqlite3
+import threading
+import weakref
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Caches still open; held weakly so an unused cache can be released before exit
+_open_caches = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_caches():
+    """Flush and close every cache that is still open when the interpreter exits."""
+    for cache in list(_open_caches):
+        cache.close()
+
+
+class TranslationCache:
+    """SQLite-backed translation memory keyed by (source_lang, target_lang, text)."""
+
+    # Number of buffered writes that triggers a commit
+    FLUSH_SIZE = 100
+
+    # Keys per SELECT ... IN (...) query, below SQLite's bound-parameter limit
+    LOOKUP_CHUNK = 500
+
+    def __init__(self, cache_file: Path):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            cache_file: Path to the SQLite database file
+        """
+        self.cache_file = Path(cache_file)
+        self._lock = threading.Lock()
+        self._pending: Dict[bytes, str] = {}
+
+        # Worker threads share one connection, guarded by the lock
+        self._connection = sqlite3.connect(str(self.cache_file), check_same_thread=False)
+        # Write-ahead logging makes each batched commit an append instead of a journal
+        # rewrite; NORMAL sync is safe with WAL and only syncs at checkpoints
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS translations (key BLOB PRIMARY KEY, translated TEXT NOT NULL)"
+        )
+        self._connection.commit()
+
+        _open_caches.add(self)
+        logger.info(f"Translation cache opened: {self.cache_file}")
+
+    @staticmethod
+    def make_key(source_lang: str, target_lang: str, text: str) -> bytes:
+        """Build the lookup key for a text in a language pair."""
+        return hashlib.sha1(f"{source_lang}|{target_lang}|{text}".encode('utf-8')).digest()
+
+    def get(self, source_lang: str, target_lang: str, text: str) -> Optional[str]:
+        """
+        Look up a cached translation.
+
+        Returns:
+            The cached translation or None on a cache miss
+        """
+        key = self.make_key(source_lang, target_lang, text)
+        with self._lock:
+            if key in self._pending:
+                return self._pending[key]
+            if self._connection is None:
+                return None
+            row = self._connection.execute(
+                "SELECT translated FROM translations WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def get_many(self, source_lang: str, target_lang: str, texts: Iterable[str]) -> Dict[str, str]:
+        """
+        Look up several texts with one query per LOOKUP_CHUNK keys.
+
+        Returns:
+            Mapping of each cached text to its translation; misses are left out
+        """
+        key_to_text = {self.make_key(source_lang, target_lang, text): text for text in texts}
+        found = {}
+        with self._lock:
+            for key in [key for key in key_to_text if key in self._pending]:
+                found[key_to_text.pop(key)] = self._pending[key]
+            if self._connection is None:
+                return found
+
+            keys = list(key_to_text)
+            for start in range(0, len(keys), self.LOOKUP_CHUNK):
+                chunk = keys[start:start + self.LOOKUP_CHUNK]
+                placeholders = ','.join('?' * len(chunk))
+                rows = self._connection.execute(
+                    f"SELECT key, translated FROM translations WHERE key IN ({placeholders})", chunk
+                ).fetchall()
+                for key, translated in rows:
+                    found[key_to_text[key]] = translated
+        return found
+
+    def put(self, source_lang: str, target_lang: str, text: str, translated: str):
+        """Store a translation; writes are buffered and committed in batches."""
+        key = self.make_key(source_lang, target_lang, text)
+        with self._lock:
+            self._pending[key] = translated
+            if len(self._pending) >= self.FLUSH_SIZE:
+                self._flush_locked()
+
+    def flush(self):
+        """Commit all buffered translations to disk."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        """Write buffered translations in a single transaction (caller holds the lock)."""
+        if not self._pending or self._connection is None:
+            return
+        try:
+            with self._connection:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO translations (key, translated) VALUES (?, ?)",
+                    self._pending.items()
+                )
+            self._pending.clear()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to write translation cache: {e}")
+
+    def close(self):
+        """Flush pending writes and close the database."""
+        with self._lock:
+            _open_caches.discard(self)
+            if self._connection is None:
+                return
+            self._flush_locked()
+            self._connection.close()
+            self._connection = None
+
+    def __del__(self):
+        # A cache dropped without close() still writes its buffered translations
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+class MemoCache(dict):
+    """In-memory translation memo that drops its oldest entries once it holds max_size items."""
+
+    def __init__(self, max_size: int):
+        super().__init__()
+        self.max_size = max_size
+
+    def __setitem__(self, key, value):
+        if len(self) >= self.max_size and key not in self:
+            # Evicted entries are still in the persistent cache, so dropping the oldest is cheap
+            try:
+                del self[next(iter(self))]
+            except (KeyError, RuntimeError, StopIteration):
+                pass  # Another thread changed the memo first
+        super().__setitem__(key, value)
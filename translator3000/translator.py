@@ -5,6 +5,7 @@ This is the new modular implementation that uses the extracted processors
 for better maintainability and performance.
 """
 
+import functools
 import logging
 from typing import List
 
@@ -43,18 +44,30 @@ class CSVTranslator:
         
         # Backward compatibility: expose attributes from csv_processor
         self.translators = getattr(self.csv_processor, 'translators', [])
-        self.delay = getattr(self.csv_processor, 'delay_between_requests', 0.05)
-        self.delay_between_requests = getattr(self.csv_processor, 'delay_between_requests', 0.05)
+        self.delay = getattr(self.csv_processor, 'delay', 0.05)
+        self.delay_between_requests = self.delay
         self.glossary = getattr(self.csv_processor, 'glossary', {})
         
         logger.info(f"Modular Translator initialized: {SUPPORTED_LANGUAGES[source_lang]} -> {SUPPORTED_LANGUAGES[target_lang]}")
     
+    def set_delay(self, delay_seconds: float):
+        """
+        Change the delay between translation requests without rebuilding the translator.
+        
+        Args:
+            delay_seconds: Delay in seconds between translation requests
+        """
+        self.csv_processor.set_delay(delay_seconds)
+        self.delay = delay_seconds
+        self.delay_between_requests = delay_seconds
+    
     def translate_csv(self, 
                      input_file: str, 
                      output_file: str, 
                      columns_to_translate: List[str],
                      append_suffix: str = "_translated",
-                     delimiter: str = ",") -> tuple[bool, int]:
+                     delimiter: str = ",",
+                     encoding: str = "utf-8") -> tuple[bool, int]:
         """
         Translate specified columns in a CSV file.
         
@@ -64,12 +77,13 @@ class CSVTranslator:
             columns_to_translate: List of column names to translate
             append_suffix: Suffix to append to translated column names
             delimiter: CSV delimiter
+            encoding: Encoding of the input file (output is always UTF-8)
             
         Returns:
             Tuple of (success, characters_translated)
         """
         return self.csv_processor.translate_csv(
-            input_file, output_file, columns_to_translate, append_suffix, delimiter
+            input_file, output_file, columns_to_translate, append_suffix, delimiter, encoding
         )
     
     def translate_xml(self, input_file: str, output_file: str, use_multithreading: bool = True, max_workers: int = None) -> tuple[bool, int]:
@@ -99,10 +113,41 @@ class CSVTranslator:
         """
         return self.csv_processor.translate_text(text)
     
+    def translate_batch(self, texts: List[str]) -> List[str]:
+        """
+        Translate several text strings with one request per translation service.
+        
+        Args:
+            texts: Texts to translate
+            
+        Returns:
+            Translated texts in input order
+        """
+        return self.csv_processor.translate_batch(texts)
+    
+    def translate_texts(self, texts: List[str], max_workers: int = None) -> List[str]:
+        """
+        Translate any number of texts, sending each distinct string once.
+        
+        Suited to category-like columns where a few values repeat over many rows.
+        
+        Args:
+            texts: Texts to translate
+            max_workers: Number of batches in flight at once (uses config if None)
+            
+        Returns:
+            Translated texts in input order
+        """
+        return self.csv_processor.translate_texts(texts, max_workers)
+    
     # Additional methods for compatibility with legacy API
-    def translate_column(self, df, column: str):
+    def translate_column(self, df, column: str, use_multithreading: bool = True, max_workers: int = None):
         """Translate all texts in a DataFrame column."""
-        return self.csv_processor.translate_column(df, column)
+        return self.csv_processor.translate_column(df, column, use_multithreading, max_workers)
+    
+    def translate_column_multithreaded(self, df, column: str, max_workers: int = None):
+        """Translate all texts in a DataFrame column using worker threads."""
+        return self.csv_processor.translate_column_multithreaded(df, column, max_workers)
     
     def is_html_content(self, text: str) -> bool:
         """Check if text contains HTML tags."""
@@ -111,3 +156,25 @@ class CSVTranslator:
     def translate_html_content(self, html_text: str) -> str:
         """Translate HTML content while preserving structure."""
         return self.csv_processor.translate_html_content(html_text)
+    
+    def close(self):
+        """Flush and close the persistent translation cache."""
+        self.csv_processor.close()
+
+
+@functools.lru_cache(maxsize=8)
+def get_translator(source_lang: str = 'en', target_lang: str = 'nl') -> CSVTranslator:
+    """
+    Get a shared translator for a language pair.
+    
+    Service probing, glossary loading and HTTP connection pools are set up once
+    per language pair and reused by every caller.
+    
+    Args:
+        source_lang: Source language code (e.g., 'en', 'da')
+        target_lang: Target language code (e.g., 'nl', 'sv')
+        
+    Returns:
+        Shared CSVTranslator instance
+    """
+    return CSVTranslator(source_lang, target_lang)
@@ -11,11 +11,11 @@ from .language_utils import (
     generate_output_directory, get_language_preferences, SUPPORTED_LANGUAGES
 )
 from .file_utils import (
-    discover_files_and_folders, print_discovered_files, ensure_directory_exists,
-    is_supported_file, get_relative_path
+    FileEntry, discover_files_and_folders, print_discovered_files, ensure_directory_exists,
+    is_supported_file, get_relative_path, prefetch_file
 )
 from .text_utils import (
-    is_html_content, load_glossary, apply_glossary_replacements,
+    is_html_content, Glossary, load_glossary, apply_glossary_replacements,
     preserve_case, clean_text_for_translation, extract_translatable_content
 )
 
@@ -23,8 +23,8 @@ __all__ = [
     'get_logger', 'setup_logging',
     'get_language_suffix', 'get_language_name', 'generate_output_filename',
     'generate_output_directory', 'get_language_preferences', 'SUPPORTED_LANGUAGES',
-    'discover_files_and_folders', 'print_discovered_files', 'ensure_directory_exists',
-    'is_supported_file', 'get_relative_path',
-    'is_html_content', 'load_glossary', 'apply_glossary_replacements',
+    'FileEntry', 'discover_files_and_folders', 'print_discovered_files', 'ensure_directory_exists',
+    'is_supported_file', 'get_relative_path', 'prefetch_file',
+    'is_html_content', 'Glossary', 'load_glossary', 'apply_glossary_replacements',
     'preserve_case', 'clean_text_for_translation', 'extract_translatable_content'
 ]
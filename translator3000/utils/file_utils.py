@@ -5,10 +5,38 @@ This module contains helper functions for discovering files in directories,
 handling file processing modes, and managing input/output paths.
 """
 
+import concurrent.futures
+from dataclasses import dataclass
 from typing import Dict, List, Any
 from pathlib import Path
 import os
 
+# File extensions (lowercase) that can be translated
+SUPPORTED_SUFFIXES = ('.csv', '.xml')
+
+# Source folders are scanned by a thread pool when there are more than this many
+PARALLEL_SCAN_MIN_FOLDERS = 4
+PARALLEL_SCAN_WORKERS = 8
+
+# posix_fadvise is only available on Unix
+FADVISE_AVAILABLE = hasattr(os, 'posix_fadvise')
+
+
+@dataclass(frozen=True)
+class FileEntry:
+    """A discovered source file with its display data computed once during discovery."""
+    __slots__ = ('path', 'rel', 'kind')
+    
+    path: Path  # Full path to the file
+    rel: str    # Path relative to the source directory
+    kind: str   # 'CSV' or 'XML'
+
+
+def _make_entry(path: str, prefix_len: int) -> FileEntry:
+    """Build a FileEntry from a scandir path that starts with the source directory."""
+    kind = 'CSV' if path.lower().endswith('.csv') else 'XML'
+    return FileEntry(Path(path), path[prefix_len:], kind)
+
 
 def discover_files_and_folders(source_dir: Path) -> Dict[str, Any]:
     """
@@ -19,9 +47,9 @@ def discover_files_and_folders(source_dir: Path) -> Dict[str, Any]:
     
     Returns:
         Dictionary with structure: {
-            'root_files': [list of files in root source dir],
+            'root_files': [FileEntry for each file in root source dir],
             'folders': {
-                'folder_name': [list of files in that folder],
+                'folder_name': [FileEntry for each file in that folder],
                 ...
             }
         }
@@ -31,33 +59,65 @@ def discover_files_and_folders(source_dir: Path) -> Dict[str, Any]:
         'folders': {}
     }
     
-    # Find files in root source directory
-    for file_path in source_dir.iterdir():
-        if file_path.is_file() and file_path.suffix.lower() in ['.csv', '.xml']:
-            discovered['root_files'].append(file_path)
-    
-    # Find subdirectories and their files
-    for item in source_dir.iterdir():
-        if item.is_dir() and not item.name.startswith('.'):
-            folder_files = []
-            # Look for CSV/XML files in subdirectory
-            for file_path in item.rglob('*'):
-                if file_path.is_file() and file_path.suffix.lower() in ['.csv', '.xml']:
-                    folder_files.append(file_path)
-            
-            if folder_files:  # Only include folders that have CSV/XML files
-                discovered['folders'][item.name] = folder_files
+    # scandir joins names onto source_dir, so relative paths are plain string slices
+    prefix_len = len(os.path.join(str(source_dir), ''))
+    
+    # One scandir pass over the root; DirEntry caches the file type, so no extra stat calls
+    folders = []  # (name, path) of the subdirectories to scan
+    with os.scandir(source_dir) as entries:
+        for entry in entries:
+            if entry.is_file():
+                if entry.name.lower().endswith(SUPPORTED_SUFFIXES):
+                    discovered['root_files'].append(_make_entry(entry.path, prefix_len))
+            elif entry.is_dir() and not entry.name.startswith('.'):
+                folders.append((entry.name, entry.path))
+    
+    # Scanning waits on the file system, so wide trees scan their folders in parallel
+    folder_paths = [path for _, path in folders]
+    if len(folders) > PARALLEL_SCAN_MIN_FOLDERS:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(PARALLEL_SCAN_WORKERS, len(folders))) as executor:
+            scanned = list(executor.map(_scan_supported_files, folder_paths))
+    else:
+        scanned = [_scan_supported_files(path) for path in folder_paths]
+    
+    for (folder_name, _), paths in zip(folders, scanned):
+        if paths:  # Only include folders that have CSV/XML files
+            discovered['folders'][folder_name] = [_make_entry(path, prefix_len) for path in paths]
     
     return discovered
 
 
-def print_discovered_files(discovered: Dict[str, List[Path]], source_dir: Path) -> int:
+def _scan_supported_files(directory: str) -> List[str]:
+    """
+    Recursively list CSV/XML file paths below a directory using os.scandir.
+    
+    Files of a directory come before the files of its subdirectories, the same
+    order Path.rglob produces. The walk uses an explicit stack, so deep trees
+    neither recurse nor copy file lists up through every level.
+    """
+    files = []
+    stack = [directory]
+    while stack:
+        subdirs = []
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    if entry.name.lower().endswith(SUPPORTED_SUFFIXES):
+                        files.append(entry.path)
+                elif entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+        # Reversed, so the first subdirectory is scanned next (depth-first, in scandir order)
+        stack.extend(reversed(subdirs))
+    return files
+
+
+def print_discovered_files(discovered: Dict[str, List[FileEntry]], source_dir: Path) -> int:
     """
     Print discovered files and return total count.
     
     Args:
         discovered: Dictionary from discover_files_and_folders()
-        source_dir: Source directory for relative path calculation
+        source_dir: Source directory the files were discovered in
         
     Returns:
         Total number of files found
@@ -67,9 +127,8 @@ def print_discovered_files(discovered: Dict[str, List[Path]], source_dir: Path)
     # Print root files
     if discovered['root_files']:
         print("[ROOT] Files in source root:")
-        for file_path in discovered['root_files']:
-            file_type = "CSV" if file_path.suffix.lower() == ".csv" else "XML"
-            print(f"  • {file_path.name} ({file_type})")
+        for entry in discovered['root_files']:
+            print(f"  • {entry.rel} ({entry.kind})")
             total_files += 1
         print()
     
@@ -78,10 +137,9 @@ def print_discovered_files(discovered: Dict[str, List[Path]], source_dir: Path)
         print("[SUBDIRS] Files in subdirectories:")
         for folder_name, files in discovered['folders'].items():
             print(f"  [FOLDER] {folder_name}/")
-            for file_path in files:
-                file_type = "CSV" if file_path.suffix.lower() == ".csv" else "XML"
-                relative_path = file_path.relative_to(source_dir / folder_name)
-                print(f"    • {relative_path} ({file_type})")
+            folder_prefix_len = len(folder_name) + 1  # Shown relative to the folder itself
+            for entry in files:
+                print(f"    • {entry.rel[folder_prefix_len:]} ({entry.kind})")
                 total_files += 1
             print()
     
@@ -135,3 +193,25 @@ def get_relative_path(file_path: Path, base_dir: Path) -> str:
     except ValueError:
         # If file is not under base_dir, return just the filename
         return file_path.name
+
+
+def prefetch_file(file_path: Path) -> None:
+    """
+    Ask the kernel to start reading a file into the page cache in the background.
+    
+    Used to read the next file of a batch while the current one waits on the
+    translation services. Does nothing where posix_fadvise is not available.
+    
+    Args:
+        file_path: File that will be read soon
+    """
+    if not FADVISE_AVAILABLE:
+        return
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass  # Only a hint; the file is read normally later
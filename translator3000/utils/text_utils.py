@@ -5,13 +5,23 @@ This module contains helper functions for text processing, HTML detection,
 glossary handling, and case preservation.
 """
 
+import csv
+import functools
 import re
 import logging
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Case classes returned by classify_case(), used to index case_variants()
+CASE_AS_IS, CASE_UPPER, CASE_LOWER, CASE_TITLE = range(4)
+
+# Patterns used per text, compiled once at import
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+NUMERIC_TEXT_PATTERN = re.compile(r'^[\d\s\-\.\,\(\)]+$')
+
 
 def is_html_content(text: str) -> bool:
     """
@@ -27,11 +37,10 @@ def is_html_content(text: str) -> bool:
         return False
     
     # Simple regex to detect HTML tags
-    html_pattern = re.compile(r'<[^>]+>')
-    return bool(html_pattern.search(str(text)))
+    return bool(HTML_TAG_PATTERN.search(str(text)))
 
 
-def load_glossary(glossary_file_path: Path) -> Dict[str, Dict[str, str]]:
+def load_glossary(glossary_file_path: Path) -> 'Glossary':
     """
     Load the glossary CSV file for custom translation terms.
     
@@ -39,40 +48,39 @@ def load_glossary(glossary_file_path: Path) -> Dict[str, Dict[str, str]]:
         glossary_file_path: Path to the glossary.csv file
     
     Returns:
-        Dictionary mapping source terms to target terms and case preferences
+        Glossary mapping source terms to target terms and case preferences
     """
-    glossary = {}
+    glossary = Glossary()
     
     if not glossary_file_path.exists():
         logger.info(f"No glossary file found at {glossary_file_path}. Using translation API only.")
         return glossary
     
     try:
-        # Read the glossary CSV
-        with open(glossary_file_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        
-        # Skip header and empty lines
-        for line_num, line in enumerate(lines[1:], 2):
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-            
-            parts = line.split(';')
-            if len(parts) != 3:
-                logger.warning(f"Glossary line {line_num} has wrong format (expected 3 columns): {line}")
-                continue
+        # Stream the rows through csv.reader; quoted fields may contain the delimiter
+        with open(glossary_file_path, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f, delimiter=';')
+            next(reader, None)  # Header
             
-            source_term, target_term, keep_case = parts
-            source_term = source_term.strip()
-            target_term = target_term.strip()
-            keep_case = keep_case.strip().lower() == 'true'
-            
-            if source_term and target_term:
-                glossary[source_term.lower()] = {
-                    'target': target_term,
-                    'keep_case': keep_case
-                }
+            for parts in reader:
+                # Skip empty and comment lines
+                if not ''.join(parts).strip() or parts[0].lstrip().startswith('#'):
+                    continue
+                
+                if len(parts) != 3:
+                    logger.warning(f"Glossary line {reader.line_num} has wrong format (expected 3 columns): {';'.join(parts)}")
+                    continue
+                
+                source_term, target_term, keep_case = parts
+                source_term = source_term.strip()
+                target_term = target_term.strip()
+                keep_case = keep_case.strip().lower() == 'true'
+                
+                if source_term and target_term:
+                    glossary[source_term.lower()] = {
+                        'target': target_term,
+                        'keep_case': keep_case
+                    }
         
         if glossary:
             logger.info(f"Loaded {len(glossary)} terms from {glossary_file_path}")
@@ -85,42 +93,189 @@ def load_glossary(glossary_file_path: Path) -> Dict[str, Dict[str, str]]:
     return glossary
 
 
+@functools.lru_cache(maxsize=None)
+def compile_glossary_pattern(source_term: str) -> re.Pattern:
+    """
+    Compile the case-insensitive whole-word pattern for a glossary term.
+    
+    Only used to resolve targets that contain later terms. Patterns are cached
+    per term without a size limit, so resolving chains in glossaries beyond the
+    512 entries of re's own cache does not recompile them.
+    
+    Args:
+        source_term: Glossary source term
+        
+    Returns:
+        Compiled regex pattern
+    """
+    return re.compile(r'\b' + re.escape(source_term) + r'\b', re.IGNORECASE)
+
+
+def _replace_term(text: str, source_term: str, target_term: str, keep_case: bool) -> str:
+    """Replace one glossary term in text, choosing the target variant by the matched case."""
+    variants = case_variants(target_term)
+    return compile_glossary_pattern(source_term).sub(
+        lambda match: target_term if keep_case else variants[classify_case(match.group(0))], text
+    )
+
+
+def _compile_glossary_union(terms: Tuple[Tuple[str, str, bool], ...]) -> Tuple[re.Pattern, Dict[str, tuple], frozenset]:
+    """
+    Compile glossary terms into one whole-word alternation and resolve their replacements.
+    
+    Args:
+        terms: (lowercase source, target, keep_case) for every term, in glossary order
+        
+    Returns:
+        Tuple of (pattern, {lowercase source: (keep_case, target, case variants)},
+        case-folded first characters of the terms)
+    """
+    # Longest terms first, so a term never shadows a longer one that contains it
+    ordered = sorted((source for source, _, _ in terms), key=len, reverse=True)
+    pattern = re.compile(r'\b(?:' + '|'.join(re.escape(source) for source in ordered) + r')\b', re.IGNORECASE)
+    
+    # Terms used to be applied one after another, so a target containing a later term
+    # was replaced again; resolve those chains here instead of on every text
+    replacements = {}
+    for index, (source, target, keep_case) in enumerate(terms):
+        variants = case_variants(target)
+        if pattern.search(target):
+            for later_source, later_target, later_keep_case in terms[index + 1:]:
+                target = _replace_term(target, later_source, later_target, later_keep_case)
+                variants = tuple(_replace_term(variant, later_source, later_target, later_keep_case)
+                                 for variant in variants)
+        replacements[source] = (keep_case, target, variants)
+    
+    first_chars = frozenset(source.casefold()[0] for source, _, _ in terms if source)
+    return pattern, replacements, first_chars
+
+
+class Glossary(dict):
+    """
+    Glossary terms keyed by lowercase source term, with their combined pattern.
+    
+    The pattern is compiled on first use and dropped whenever terms are added,
+    replaced or removed, so it is built once per glossary instead of per text.
+    Replace an entry rather than editing its dictionary in place.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._compiled = None
+    
+    def compiled(self) -> Tuple[re.Pattern, Dict[str, tuple], frozenset]:
+        """Return the result of _compile_glossary_union() for the current terms."""
+        compiled = self._compiled
+        if compiled is None:
+            compiled = self._compiled = _compile_glossary_union(
+                tuple((source_term, config['target'], config['keep_case']) for source_term, config in self.items())
+            )
+        return compiled
+    
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._compiled = None
+    
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._compiled = None
+    
+    def __ior__(self, other):
+        self.update(other)
+        return self
+    
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._compiled = None
+    
+    def setdefault(self, key, default=None):
+        self._compiled = None
+        return super().setdefault(key, default)
+    
+    def pop(self, *args):
+        self._compiled = None
+        return super().pop(*args)
+    
+    def popitem(self):
+        self._compiled = None
+        return super().popitem()
+    
+    def clear(self):
+        super().clear()
+        self._compiled = None
+
+
 def apply_glossary_replacements(text: str, glossary: Dict[str, Dict[str, str]]) -> str:
     """
     Apply glossary replacements to text before translation.
     
+    All terms are matched in one pass of a combined pattern. A Glossary from
+    load_glossary() compiles it once; a plain dictionary is compiled per call.
+    
     Args:
         text: Text to process
-        glossary: Glossary dictionary from load_glossary()
+        glossary: Glossary from load_glossary() or a dictionary of the same shape
         
     Returns:
         Text with glossary terms replaced
     """
-    if not glossary:
+    if not glossary or not text:
         return text
     
-    result = text
+    if not isinstance(glossary, Glossary):
+        glossary = Glossary(glossary)
+    pattern, replacements, first_chars = glossary.compiled()
     
-    for source_term, config in glossary.items():
-        target_term = config['target']
-        keep_case = config['keep_case']
-        
-        # Create case-insensitive pattern for whole words
-        pattern = re.compile(r'\b' + re.escape(source_term) + r'\b', re.IGNORECASE)
+    # A text without any term's first character (case-folded) cannot contain a term
+    if first_chars.isdisjoint(text.casefold()):
+        return text
+    
+    def replace_match(match):
+        matched_text = match.group(0)
+        replacement = replacements.get(matched_text.lower())
+        if replacement is None:
+            return matched_text
         
-        def replace_match(match):
-            matched_text = match.group(0)
-            
-            if keep_case:
-                # For keep_case=True, use the target term exactly as specified in glossary
-                return target_term
-            else:
-                # For keep_case=False, adapt target case to match the original text
-                return preserve_case(matched_text, target_term)
+        keep_case, target_term, variants = replacement
+        if keep_case:
+            # For keep_case=True, use the target term exactly as specified in glossary
+            return target_term
+        # For keep_case=False, pick the precomputed target variant matching the original case
+        return variants[classify_case(matched_text)]
+    
+    return pattern.sub(replace_match, text)
+
+
+def classify_case(text: str) -> int:
+    """
+    Classify the case pattern of a word.
+    
+    Args:
+        text: Text to classify
         
-        result = pattern.sub(replace_match, result)
+    Returns:
+        One of CASE_UPPER, CASE_LOWER, CASE_TITLE or CASE_AS_IS (mixed case)
+    """
+    if text.isupper():
+        return CASE_UPPER
+    elif text.islower():
+        return CASE_LOWER
+    elif text.istitle():
+        return CASE_TITLE
+    return CASE_AS_IS
+
+
+def case_variants(replacement: str) -> tuple:
+    """
+    Precompute the case variants of a replacement, indexed by classify_case().
     
-    return result
+    Args:
+        replacement: Replacement text
+        
+    Returns:
+        Tuple of (as-is, upper, lower, capitalized) variants
+    """
+    return (replacement, replacement.upper(), replacement.lower(), replacement.capitalize())
 
 
 def preserve_case(original: str, replacement: str) -> str:
@@ -134,11 +289,12 @@ def preserve_case(original: str, replacement: str) -> str:
     Returns:
         Replacement text with preserved case pattern
     """
-    if original.isupper():
+    case_class = classify_case(original)
+    if case_class == CASE_UPPER:
         return replacement.upper()
-    elif original.islower():
+    elif case_class == CASE_LOWER:
         return replacement.lower()
-    elif original.istitle():
+    elif case_class == CASE_TITLE:
         return replacement.capitalize()
     else:
         # Mixed case - return replacement as-is
@@ -159,7 +315,7 @@ def clean_text_for_translation(text: str) -> str:
         return text
     
     # Remove extra whitespace but preserve structure
-    text = re.sub(r'\s+', ' ', text.strip())
+    text = WHITESPACE_PATTERN.sub(' ', text.strip())
     
     return text
 
@@ -187,7 +343,7 @@ def extract_translatable_content(text: str) -> Optional[str]:
         return None
     
     # Skip strings that are mostly numbers
-    if re.match(r'^[\d\s\-\.\,\(\)]+$', cleaned):
+    if NUMERIC_TEXT_PATTERN.match(cleaned):
         return None
     
     return cleaned